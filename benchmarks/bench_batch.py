@@ -0,0 +1,72 @@
+# benchmarks/bench_batch.py
+"""
+Throughput (queries/s): vòng lặp từng cặp như experiments.run_experiments
+so với batch_query.batch_solve (gom cặp chung start / goal).
+
+    python -m benchmarks.bench_batch                          # 2000 cặp trên 50 start
+    python -m benchmarks.bench_batch --pairs 5000 --sources 20 --kind ucs --workers 4
+"""
+
+import argparse
+import random
+import time
+
+import experiments
+from game.logic import load_words
+from solvers.batch_query import batch_solve
+from solvers.graph_cache import load_or_build_graph
+from solvers.ucs_solver import path_cost
+
+# thuật toán của experiments tương ứng với kind của batch
+ALGO_OF_KIND = {"bfs": "BFS", "ucs": "UCS"}
+
+
+def make_pairs(words, num_pairs: int, num_sources: int, seed: int):
+    """num_pairs cặp, start lấy trong num_sources từ (như pipeline có ít điểm xuất phát)."""
+    rng = random.Random(seed)
+    sources = rng.sample(list(words), num_sources)
+    return [(rng.choice(sources), rng.choice(words)) for _ in range(num_pairs)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dict", default=experiments.DICT_PATH)
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--sources", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--kind", choices=sorted(ALGO_OF_KIND), default="bfs")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--loop-limit", type=int, default=300,
+                        help="số cặp đo cho vòng lặp từng cặp (chậm), 0 = tất cả")
+    args = parser.parse_args()
+
+    words = load_words(args.dict)
+    graph = load_or_build_graph(args.dict, words)
+    pairs = make_pairs(words, args.pairs, args.sources, args.seed)
+    print(f"{len(pairs)} pairs, {args.sources} sources, kind={args.kind}")
+
+    loop_pairs = pairs[:args.loop_limit] if args.loop_limit else pairs
+    algo = ALGO_OF_KIND[args.kind]
+    t0 = time.perf_counter()
+    # bfs so độ dài path, ucs so cost (có thể nhiều path cùng cost)
+    metric = f"{algo}_path_len" if args.kind == "bfs" else f"{algo}_path_cost"
+    loop_vals = [experiments.run_algorithm(algo, s, g, graph)[metric] for s, g in loop_pairs]
+    t_loop = time.perf_counter() - t0
+    qps_loop = len(loop_pairs) / t_loop
+    print(f"per-pair loop       : {qps_loop:10.1f} queries/s  ({len(loop_pairs)} pairs, {t_loop:.2f} s)")
+
+    t0 = time.perf_counter()
+    paths = batch_solve(pairs, words, graph, args.kind, args.workers)
+    t_batch = time.perf_counter() - t0
+    qps_batch = len(pairs) / t_batch
+    print(f"batch (workers={args.workers:2d}) : {qps_batch:10.1f} queries/s  ({len(pairs)} pairs, {t_batch:.2f} s)")
+    print(f"speedup: x{qps_batch / qps_loop:.1f}")
+
+    measure = len if args.kind == "bfs" else path_cost
+    batch_vals = [measure(p) if p else -1 for p in paths[:len(loop_pairs)]]
+    if batch_vals != loop_vals:
+        raise SystemExit("batch results differ from the per-pair loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_graph_build.py
+"""
+So sánh build_graph_pairwise (O(n²)) với build_graph (bucket wildcard).
+
+    python -m benchmarks.bench_graph_build              # 3000 từ đầu
+    python -m benchmarks.bench_graph_build --limit 0    # toàn bộ dictionary (chậm, vài phút)
+    python -m benchmarks.bench_graph_build --workers 4
+"""
+
+import argparse
+import time
+
+from game.logic import load_words
+from solvers.bfs_solver import build_graph, build_graph_pairwise
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dict", default="data/words.txt")
+    parser.add_argument("--limit", type=int, default=3000, help="số từ dùng để so (0 = tất cả)")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    words = load_words(args.dict)
+    if args.limit:
+        words = words[:args.limit]
+    print(f"Words: {len(words)}")
+
+    fast, t_fast = timed(build_graph, words, args.workers)
+    print(f"bucket   (workers={args.workers}): {t_fast * 1000:10.1f} ms")
+
+    slow, t_slow = timed(build_graph_pairwise, words)
+    print(f"pairwise             : {t_slow * 1000:10.1f} ms")
+
+    same = fast == slow and all(fast[w] == slow[w] for w in words)
+    edges = sum(len(v) for v in fast.values()) // 2
+    print(f"Edges: {edges}  identical: {same}  speedup: x{t_slow / t_fast:.1f}")
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_lexicon.py
+"""
+Chi phí mỗi lần gọi: membership trên list vs Lexicon (hash) vs PackedLexicon (snapshot),
+và thời gian load dictionary: parse text từng dòng vs đọc lexicon snapshot.
+
+    python -m benchmarks.bench_lexicon
+"""
+
+import random
+import time
+import timeit
+
+from game.lexicon_cache import load_or_compile_lexicon
+from game.logic import Lexicon, is_valid_guess, load_words
+
+DICT_PATH = "data/words.txt"
+
+
+def per_call_ns(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def parse_text(path: str) -> Lexicon:
+    """Cách load cũ: đọc từng dòng, strip / upper / len / isalpha, dựng Lexicon."""
+    words = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            w = line.strip().upper()
+            if len(w) == 5 and w.isalpha():
+                words.append(w)
+    return Lexicon(words)
+
+
+def load_ms(fn, repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main():
+    load_or_compile_lexicon(DICT_PATH)      # compile snapshot nếu chưa có
+    print(f"{'load: parse text':26s} {load_ms(lambda: parse_text(DICT_PATH)):12.3f} ms")
+    print(f"{'load: lexicon snapshot':26s} {load_ms(lambda: load_words(DICT_PATH)):12.3f} ms")
+    # lần tra đầu tiên dựng dict word -> id (1 lần / lexicon)
+    print(f"{'first lookup (dict build)':26s} {load_ms(lambda: 'ROSSA' in load_words(DICT_PATH)):12.3f} ms")
+
+    packed = load_words(DICT_PATH)
+    as_list = list(packed)
+    lexicon = Lexicon(as_list)
+    rng = random.Random(0)
+    # nửa có trong dictionary, nửa không
+    queries = [rng.choice(as_list) for _ in range(500)] + ["ZZZZZ"] * 500
+    rng.shuffle(queries)
+
+    def run(fn):
+        return lambda: [fn(q) for q in queries]
+
+    cases = [
+        ("word in list", run(lambda q: q in as_list)),
+        ("word in Lexicon", run(lambda q: q in lexicon)),
+        ("is_valid_guess(list)", run(lambda q: is_valid_guess(q, as_list))),
+        ("is_valid_guess(Lexicon)", run(lambda q: is_valid_guess(q, lexicon))),
+        ("list.index", run(lambda q: q in as_list and as_list.index(q))),
+        ("Lexicon.get_id", run(lambda q: lexicon.get_id(q))),
+        ("word in PackedLexicon", run(lambda q: q in packed)),
+        ("PackedLexicon.get_id", run(lambda q: packed.get_id(q))),
+        ("is_valid_guess(Packed)", run(lambda q: is_valid_guess(q, packed))),
+    ]
+
+    print(f"Words: {len(lexicon)}, {len(queries)} queries/run")
+    for name, fn in cases:
+        number = 3 if "list" in name and "Lexicon" not in name else 200
+        ns = per_call_ns(fn, number) / len(queries)
+        print(f"{name:26s} {ns:12.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# benchmarks/bench_suite.py
+"""
+Benchmark có thống kê: warmup, lặp nhiều lần, median / p95 / p99, peak bytes thật
+(tracemalloc) mỗi query, bộ query cố định theo dictionary, xuất JSON và so với baseline.
+
+    python -m benchmarks.bench_suite run --out bench.json
+    python -m benchmarks.bench_suite run --queries 50 --repeats 5 --algos BFS,Astar
+    python -m benchmarks.bench_suite compare baseline.json bench.json --threshold 0.10
+
+Bộ query lưu ở benchmarks/queries/<tên dictionary>.json kèm hash dictionary;
+dictionary đổi thì sinh lại (cùng seed), còn không thì mọi máy / commit dùng chung 1 bộ.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import experiments
+from game.feedback import dictionary_key
+from game.logic import WORD_LENGTH, LengthLexicons, check_guess, load_words
+from solvers.graph import build_word_graph
+from solvers.graph_cache import graph_cache_key, graph_cache_path, load_graph, load_or_build_graph
+from solvers.implicit_graph import ImplicitWordGraph
+from solvers.landmarks import load_or_build_landmarks
+
+QUERIES_DIR = os.path.join(os.path.dirname(__file__), "queries")
+
+# IDA* thuần Hamming có thể chạy tới MAX_IDASTAR_EXPANDED trên 1 query -> mặc định bỏ,
+# IDA* vẫn được đo qua IDAstarALT
+DEFAULT_SKIP = {"IDAstar"}
+# thuật toán đo thêm trên ImplicitWordGraph
+IMPLICIT_ALGOS = ("BFS", "BiBFS", "UCS", "Astar")
+IMPLICIT_CACHE_SIZE = experiments.IMPLICIT_CACHE_SIZE
+
+
+# ======================= THỐNG KÊ =======================
+
+def percentile(sorted_xs: Sequence[float], p: float) -> float:
+    """Percentile p (0..100) nội suy tuyến tính trên list đã sort."""
+    if not sorted_xs:
+        return float("nan")
+    k = (len(sorted_xs) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_xs) - 1)
+    return sorted_xs[lo] + (sorted_xs[hi] - sorted_xs[lo]) * (k - lo)
+
+
+def summarize(samples: List[float], unit: str) -> dict:
+    xs = sorted(samples)
+    return {
+        "unit": unit, "n": len(xs),
+        "min": xs[0], "median": percentile(xs, 50), "p95": percentile(xs, 95),
+        "p99": percentile(xs, 99), "max": xs[-1], "mean": sum(xs) / len(xs),
+    }
+
+
+def time_samples(fn: Callable[[], object], repeats: int, warmup: int) -> List[float]:
+    """Thời gian (ms) của repeats lần gọi fn, sau warmup lần bỏ đi."""
+    for _ in range(warmup):
+        fn()
+    out = []
+    for _ in range(repeats):
+        t0 = time.perf_counter_ns()
+        fn()
+        out.append((time.perf_counter_ns() - t0) / 1e6)
+    return out
+
+
+def peak_bytes(fn: Callable[[], object]) -> int:
+    """Peak bytes cấp phát thêm trong lúc gọi fn (tracemalloc phải đang chạy)."""
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fn()
+    return tracemalloc.get_traced_memory()[1] - base
+
+
+# ======================= BỘ QUERY CỐ ĐỊNH =======================
+
+def query_set_path(dict_path: str) -> str:
+    name = os.path.splitext(os.path.basename(dict_path))[0]
+    return os.path.join(QUERIES_DIR, name + ".json")
+
+
+def load_or_make_queries(dict_path: str, words, graph, count: int, seed: int) -> List[Tuple[str, str]]:
+    """
+    Đọc bộ query đã lưu nếu cùng dictionary (hash), seed và đủ count;
+    ngược lại sinh bằng experiments.sample_pairs (reachable_only) rồi lưu lại.
+    """
+    path = query_set_path(dict_path)
+    key = dictionary_key(words).hex()
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("dictionary") == key and data.get("seed") == seed and len(data["pairs"]) >= count:
+            return [tuple(p) for p in data["pairs"][:count]]
+
+    pairs = experiments.sample_pairs(words, graph, count, seed, reachable_only=True)
+    os.makedirs(QUERIES_DIR, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"dictionary": key, "seed": seed, "pairs": pairs}, f)
+    return pairs
+
+
+# ======================= CÁC CASE =======================
+
+def bench_graph_build(words, repeats: int, warmup: int) -> dict:
+    samples = time_samples(lambda: build_word_graph(words), repeats, warmup)
+    tracemalloc.start()
+    try:
+        mem = peak_bytes(lambda: build_word_graph(words))
+    finally:
+        tracemalloc.stop()
+    return dict(summarize(samples, "ms"), peak_bytes_max=mem)
+
+
+def bench_cache_load(dict_path: str, words, repeats: int, warmup: int) -> dict:
+    path = graph_cache_path(dict_path)
+    key = graph_cache_key(words)
+
+    def load():
+        g = load_graph(path, key, words)
+        g.connected(0, g.n - 1)     # chạm vào component labels như solver làm
+        return g
+
+    samples = time_samples(load, repeats, warmup)
+    tracemalloc.start()
+    try:
+        mem = peak_bytes(load)
+    finally:
+        tracemalloc.stop()
+    return dict(summarize(samples, "ms"), peak_bytes_max=mem)
+
+
+def bench_implicit_startup(words, repeats: int, warmup: int) -> dict:
+    """Dựng ImplicitWordGraph (không graph file) để so với cache_load / graph_build."""
+    samples = time_samples(lambda: ImplicitWordGraph(words), repeats, warmup)
+    tracemalloc.start()
+    try:
+        mem = peak_bytes(lambda: ImplicitWordGraph(words))
+    finally:
+        tracemalloc.stop()
+    return dict(summarize(samples, "ms"), peak_bytes_max=mem)
+
+
+def bench_first_frame(dict_path: str, repeats: int, warmup: int) -> Optional[dict]:
+    """
+    Time-to-first-frame của GUI như game.app.run_app: đọc dictionary, tạo cửa sổ
+    (graph load ở thread nền, không chờ), tới khi frame đầu vẽ xong (root.update()).
+    None nếu không mở được cửa sổ (thiếu tkinter hoặc không có display).
+    """
+    try:
+        import tkinter as tk
+    except ImportError:
+        return None
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return None
+    from game.app import LengthSession
+    from game.gui_tk import WordleGUI
+
+    sessions = {}
+
+    def load_length(n, log=None):
+        if n not in sessions:
+            sessions[n] = LengthSession(LengthLexicons(dict_path), n)
+        return sessions[n].load(log=lambda msg: None)
+
+    def first_frame() -> float:
+        t0 = time.perf_counter_ns()
+        words = LengthLexicons(dict_path).get(WORD_LENGTH)
+        root = tk.Tk()
+        try:
+            WordleGUI(root, words, lengths=[WORD_LENGTH], load_length=load_length)
+            root.update()
+            return (time.perf_counter_ns() - t0) / 1e6
+        finally:
+            root.destroy()
+
+    with contextlib.redirect_stdout(io.StringIO()):    # GUI in secret (DEBUG) mỗi lần
+        for _ in range(warmup):
+            first_frame()
+        samples = [first_frame() for _ in range(repeats)]
+    return summarize(samples, "ms")
+
+
+def bench_solver(name: str, pairs, graph, landmarks, repeats: int, warmup: int) -> dict:
+    """Mỗi query chạy repeats lần (sau warmup), rồi 1 lần dưới tracemalloc để lấy peak bytes."""
+    samples: List[float] = []
+    for start, goal in pairs:
+        samples.extend(time_samples(
+            lambda: experiments.run_algorithm(name, start, goal, graph, landmarks), repeats, warmup))
+
+    mems: List[int] = []
+    tracemalloc.start()
+    try:
+        for start, goal in pairs:
+            mems.append(peak_bytes(lambda: experiments.run_algorithm(name, start, goal, graph, landmarks)))
+    finally:
+        tracemalloc.stop()
+    mems.sort()
+    return dict(summarize(samples, "ms"),
+                peak_bytes_median=percentile(mems, 50), peak_bytes_max=mems[-1])
+
+
+def bench_check_guess(words, pairs, repeats: int, warmup: int) -> dict:
+    """check_guess trên các cặp query (secret = goal, guess = start), đơn vị ns / call."""
+    batch = [(g.lower(), s.lower()) for s, g in pairs] * max(1, 2000 // max(1, len(pairs)))
+
+    def run():
+        for secret, guess in batch:
+            check_guess(secret, guess)
+
+    samples = [ms * 1e6 / len(batch) for ms in time_samples(run, repeats, warmup)]
+    return summarize(samples, "ns/call")
+
+
+# ======================= RUN / COMPARE =======================
+
+def run_suite(dict_path: str, num_queries: int, seed: int, repeats: int, warmup: int,
+              algos: Optional[List[str]] = None, log=print) -> dict:
+    words = load_words(dict_path)
+    graph = load_or_build_graph(dict_path, words, log=log)
+    landmarks = load_or_build_landmarks(dict_path, graph, log=log)
+    pairs = load_or_make_queries(dict_path, words, graph, num_queries, seed)
+    if algos is None:
+        algos = [a for a in experiments.algorithm_names() if a not in DEFAULT_SKIP]
+
+    cases: Dict[str, dict] = {}
+    log("graph_build...")
+    cases["graph_build"] = bench_graph_build(words, max(1, min(repeats, 5)), min(warmup, 1))
+    log("cache_load...")
+    cases["cache_load"] = bench_cache_load(dict_path, words, repeats, warmup)
+    log("first_frame...")
+    frame = bench_first_frame(dict_path, repeats, warmup)
+    if frame is not None:
+        cases["first_frame"] = frame
+    else:
+        log("  skipped (no tkinter / display)")
+    log("implicit_startup...")
+    cases["implicit_startup"] = bench_implicit_startup(words, repeats, warmup)
+    for name in algos:
+        log(f"solver {name}...")
+        cases[f"solver.{name}"] = bench_solver(name, pairs, graph, landmarks, repeats, warmup)
+    # cùng query trên graph ngầm (neighbor cache như app / experiments)
+    implicit = ImplicitWordGraph(words, IMPLICIT_CACHE_SIZE)
+    for name in IMPLICIT_ALGOS:
+        if name in algos:
+            log(f"implicit {name}...")
+            cases[f"implicit.{name}"] = bench_solver(name, pairs, implicit, None, repeats, warmup)
+    log("check_guess...")
+    cases["check_guess"] = bench_check_guess(words, pairs, repeats, warmup)
+
+    return {
+        "meta": {
+            "dictionary": os.path.basename(dict_path),
+            "dictionary_key": dictionary_key(words).hex(),
+            "queries": len(pairs), "seed": seed, "repeats": repeats, "warmup": warmup,
+            "python": sys.version.split()[0], "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cases": cases,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10,
+            metrics: Sequence[str] = ("median", "p95", "peak_bytes_max")) -> List[str]:
+    """
+    Trả về list dòng mô tả regression: metric của current lớn hơn baseline quá threshold
+    (tỉ lệ, 0.10 = chậm / tốn hơn 10%). Case chỉ có ở 1 bên thì bỏ qua.
+    """
+    if baseline["meta"].get("dictionary_key") != current["meta"].get("dictionary_key"):
+        print("warning: baseline và current dùng dictionary khác nhau")
+    regressions = []
+    for case, cur in current["cases"].items():
+        base = baseline["cases"].get(case)
+        if base is None:
+            continue
+        for m in metrics:
+            if m not in cur or m not in base or base[m] <= 0:
+                continue
+            ratio = cur[m] / base[m]
+            if ratio > 1 + threshold:
+                regressions.append(f"{case}.{m}: {base[m]:.4g} -> {cur[m]:.4g} ({(ratio - 1) * 100:+.1f}%)")
+    return regressions
+
+
+def print_table(report: dict) -> None:
+    print(f"{'case':24s} {'unit':>8s} {'median':>10s} {'p95':>10s} {'p99':>10s} {'peak KB':>10s}")
+    for case, r in report["cases"].items():
+        peak = r.get("peak_bytes_max")
+        peak_s = f"{peak / 1024:10.1f}" if peak is not None else f"{'-':>10s}"
+        print(f"{case:24s} {r['unit']:>8s} {r['median']:10.3f} {r['p95']:10.3f} {r['p99']:10.3f} {peak_s}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    run = sub.add_parser("run", help="chạy benchmark, in bảng và ghi JSON")
+    run.add_argument("--dict", default=experiments.DICT_PATH)
+    run.add_argument("--queries", type=int, default=30)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--algos", default=None, help="vd BFS,Astar (mặc định: tất cả trừ IDAstar)")
+    run.add_argument("--out", default=None, help="file JSON kết quả")
+    run.add_argument("--baseline", default=None, help="so luôn với baseline JSON")
+    run.add_argument("--threshold", type=float, default=0.10)
+
+    cmp_ = sub.add_parser("compare", help="so 2 file JSON, exit 1 nếu có regression")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args()
+
+    if args.cmd == "run":
+        algos = args.algos.split(",") if args.algos else None
+        report = run_suite(args.dict, args.queries, args.seed, args.repeats, args.warmup, algos)
+        print_table(report)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"Saved to {args.out}")
+        if not args.baseline:
+            return
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        current = report
+    else:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    if regressions:
+        raise SystemExit(1)
+    print(f"No regressions (threshold {args.threshold * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
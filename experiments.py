@@ -1,272 +1,540 @@
 import time
 import random
 import csv
-from collections import deque
-from typing import Dict, List, Optional
-
-from game.logic import load_words
-from solvers.bfs_solver import build_graph
-from solvers.ucs_solver import step_cost
+import cProfile
+import hashlib
+import json
+import os
+import pstats
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from game.logic import WORD_LENGTH, Lexicon, length_dict_path, load_words
+from solvers.astar_solver import id_heuristic
+from solvers.bidir_bfs_solver import bidir_bfs_search
+from solvers.bidir_dijkstra_solver import bidir_dijkstra_search
+from solvers.dfs_solver import ids_search
+from solvers.graph import WordGraph
+from solvers.graph_cache import attach_graph, graph_cache_path, graph_cache_valid, load_or_build_graph
+from solvers.idastar_solver import idastar_search
+from solvers.implicit_graph import ImplicitWordGraph
+from solvers.landmarks import (DEFAULT_K, Landmarks, landmarks_cache_path, landmarks_cache_valid,
+                              load_landmarks, load_or_build_landmarks)
+from solvers.search_core import FIFO, PRIORITY, SearchStats, search
+from solvers.sssp_tree import bfs_tree, dijkstra_tree
+from solvers.ucs_solver import path_cost
+from solvers.weighted_astar_solver import letter_cost_heuristic
+
+
+DICT_PATH = "data/words.txt"
+# run_experiments(implicit=True): số node giữ trong neighbor cache của ImplicitWordGraph
+IMPLICIT_CACHE_SIZE = 4096
 
 
 # ======================= HELPER =======================
 
-def filter_five_letter_words(words: List[str]) -> List[str]:
-    """Chỉ lấy các từ 5 chữ cái cho graph cho đúng Word Ladder."""
-    return [w.upper() for w in words if len(w) == 5]
-
-
-# ======================= BFS =======================
-
-def bfs_experiment(start: str, goal: str, graph: Dict[str, List[str]]):
-    start, goal = start.upper(), goal.upper()
-
-    queue = deque([start])
-    parent = {start: None}
-    visited = {start}
-
-    expanded = 0
-    peak_mem = len(queue) + len(visited)
-
-    while queue:
-        u = queue.popleft()
-        expanded += 1
-
-        if u == goal:
-            path: List[str] = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            return list(reversed(path)), expanded, peak_mem
-
-        for v in graph[u]:
-            if v not in visited:
-                visited.add(v)
-                parent[v] = u
-                queue.append(v)
-
-        peak_mem = max(peak_mem, len(queue) + len(visited))
+def filter_words_by_length(words: List[str], length: int = WORD_LENGTH) -> Lexicon:
+    """Chỉ lấy các từ `length` chữ cái: Word Ladder chỉ nối các từ cùng độ dài."""
+    return Lexicon(w.upper() for w in words if len(w) == length)
 
-    return None, expanded, peak_mem
 
+def filter_five_letter_words(words: List[str]) -> Lexicon:
+    """Tên cũ, giữ cho code gọi trước đây."""
+    return filter_words_by_length(words, 5)
 
-# ======================= IDS (có limit) =======================
 
-MAX_IDS_EXPANDED = 2000  # giới hạn số node 
+# ======================= SEARCH CORE =======================
 
+# True: mọi search qua search_core chạy dưới cProfile, in top hàm khi xong run_experiments
+PROFILE_SEARCH = False
+_profiler = cProfile.Profile()
 
-def dfs_limited(u, goal, graph, depth_left, visited, path, stats):
-    if stats["expanded"] >= MAX_IDS_EXPANDED:
-        return False
 
-    visited.add(u)
-    path.append(u)
-    stats["expanded"] += 1
-    stats["peak"] = max(stats["peak"], len(visited))
+def core_experiment(start: str, goal: str, graph: WordGraph, policy: str, **kwargs):
+    """Chạy đúng search_core.search mà solver của GUI dùng, trả về (path, SearchStats)."""
+    s, t = graph.id_of(start.upper()), graph.id_of(goal.upper())
+    stats = SearchStats(profile=PROFILE_SEARCH)
+    stats.profiler = _profiler if PROFILE_SEARCH else None
+    path = search(graph, s, t, policy, stats=stats, **kwargs)
+    return (graph.to_words(path) if path else None), stats
 
-    if u == goal:
-        return True
-    if depth_left == 0:
-        path.pop()
-        visited.remove(u)
-        return False
 
-    for v in graph[u]:
-        if v not in visited:
-            if dfs_limited(v, goal, graph, depth_left - 1, visited, path, stats):
-                return True
-            if stats["expanded"] >= MAX_IDS_EXPANDED:
-                break
-
-    path.pop()
-    visited.remove(u)
-    return False
+# ======================= BFS =======================
 
+def bfs_experiment(start: str, goal: str, graph: WordGraph):
+    path, stats = core_experiment(start, goal, graph, FIFO)
+    return path, stats.expanded, stats.peak_mem
 
-def ids_experiment(start: str, goal: str, graph: Dict[str, List[str]], max_depth: int = 10):
-    start, goal = start.upper(), goal.upper()
 
-    total_expanded = 0
-    peak_global = 0
+# ======================= BFS 2 CHIỀU =======================
 
-    for depth_limit in range(1, max_depth + 1):
-        visited = set()
-        path: List[str] = []
-        stats = {"expanded": 0, "peak": 0}
+def bibfs_experiment(start: str, goal: str, graph: WordGraph):
+    s, t = graph.id_of(start.upper()), graph.id_of(goal.upper())
+    path, expanded, peak_mem = bidir_bfs_search(graph, s, t)
+    return (graph.to_words(path) if path else None), expanded, peak_mem
 
-        found = dfs_limited(start, goal, graph, depth_limit, visited, path, stats)
 
-        total_expanded += stats["expanded"]
-        peak_global = max(peak_global, stats["peak"])
+# ======================= IDS =======================
 
-        if found:
-            return path, total_expanded, peak_global
+# IDS giờ có transposition table nên không cần giới hạn số node nữa;
+# đặt 1 số nguyên nếu muốn cắt sớm khi benchmark
+MAX_IDS_EXPANDED: Optional[int] = None
 
-        if stats["expanded"] >= MAX_IDS_EXPANDED:
-            break
 
-    return None, total_expanded, peak_global
+def ids_experiment(start: str, goal: str, graph: WordGraph, max_depth: int = 50):
+    s, t = graph.id_of(start.upper()), graph.id_of(goal.upper())
+    path, expanded, peak_mem = ids_search(graph, s, t, max_depth, max_expanded=MAX_IDS_EXPANDED)
+    return (graph.to_words(path) if path else None), expanded, peak_mem
 
 
 # ======================= UCS =======================
 
-def ucs_experiment(start: str, goal: str, graph: Dict[str, List[str]]):
-    import heapq
+def ucs_experiment(start: str, goal: str, graph: WordGraph):
+    path, stats = core_experiment(start, goal, graph, PRIORITY, weighted=True)
+    return path, stats.expanded, stats.peak_mem
 
-    start, goal = start.upper(), goal.upper()
 
-    pq = [(0, start)]
-    cost = {start: 0}
-    parent = {start: None}
+# ======================= DIJKSTRA 2 CHIỀU =======================
 
-    expanded = 0
-    peak_mem = len(pq) + len(cost)
+def bidijkstra_experiment(start: str, goal: str, graph: WordGraph):
+    s, t = graph.id_of(start.upper()), graph.id_of(goal.upper())
+    path, _, expanded, peak_mem = bidir_dijkstra_search(graph, s, t)
+    return (graph.to_words(path) if path else None), expanded, peak_mem
 
-    while pq:
-        g, u = heapq.heappop(pq)
-        expanded += 1
 
-        if u == goal:
-            path: List[str] = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            return list(reversed(path)), expanded, peak_mem
+# ======================= A* CÓ TRỌNG SỐ (cost model UCS) =======================
 
-        for v in graph[u]:
-            step_c = step_cost(u, v)
-            new_cost = g + step_c
-            if v not in cost or new_cost < cost[v]:
-                cost[v] = new_cost
-                parent[v] = u
-                heapq.heappush(pq, (new_cost, v))
+# epsilon cho cột WAstarEps: cost tối đa WASTAR_EPSILON lần tối ưu
+WASTAR_EPSILON = 1.5
 
-        peak_mem = max(peak_mem, len(pq) + len(cost))
 
-    return None, expanded, peak_mem
+def weighted_astar_experiment(start: str, goal: str, graph: WordGraph, epsilon: float = 1.0):
+    h = letter_cost_heuristic(graph, graph.id_of(goal.upper()))
+    path, stats = core_experiment(start, goal, graph, PRIORITY, h=h, weighted=True, epsilon=epsilon)
+    return path, stats.expanded, stats.peak_mem
 
 
 # ======================= A*  =======================
 
-def astar_experiment(start: str, goal: str, graph: Dict[str, List[str]]):
+def astar_experiment(start: str, goal: str, graph: WordGraph, landmarks: Optional[Landmarks] = None):
     """
-    A* với heuristic = số ký tự khác nhau (Hamming distance).
+    A* với heuristic = số ký tự khác nhau (Hamming distance),
+    hoặc max(Hamming, ALT) khi truyền landmarks.
     Trả về: (path, expanded_nodes, peak_memory)
     """
-    import heapq
-
-    start, goal = start.upper(), goal.upper()
+    h = id_heuristic(graph, graph.id_of(goal.upper()), landmarks)
+    path, stats = core_experiment(start, goal, graph, PRIORITY, h=h)
+    return path, stats.expanded, stats.peak_mem
 
-    def h(word: str) -> int:
-        return sum(1 for a, b in zip(word, goal) if a != b)
 
-    pq = [(h(start), 0, start)]  # (f = g+h, g, node)
-    g_cost = {start: 0}
-    parent = {start: None}
+# ======================= IDA* =======================
 
-    expanded = 0
-    peak_mem = len(pq) + len(g_cost)
+# IDA* chỉ có Hamming (không landmark) bùng nổ trên cặp xa mà Hamming thấp
+# (vd MAHAL -> UNBED) vì không nhớ node đã thăm; cắt ở đây để benchmark luôn dừng
+MAX_IDASTAR_EXPANDED: Optional[int] = 1_000_000
 
-    while pq:
-        f, g, u = heapq.heappop(pq)
-        expanded += 1
 
-        if u == goal:
-            path: List[str] = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            return list(reversed(path)), expanded, peak_mem
+def idastar_experiment(start: str, goal: str, graph: WordGraph, landmarks: Optional[Landmarks] = None):
+    s, t = graph.id_of(start.upper()), graph.id_of(goal.upper())
+    path, expanded, peak_mem = idastar_search(graph, s, t, max_expanded=MAX_IDASTAR_EXPANDED,
+                                              landmarks=landmarks)
+    return (graph.to_words(path) if path else None), expanded, peak_mem
 
-        for v in graph[u]:
-            new_g = g + 1
-            if v not in g_cost or new_g < g_cost[v]:
-                g_cost[v] = new_g
-                parent[v] = u
-                new_f = new_g + h(v)
-                heapq.heappush(pq, (new_f, new_g, v))
 
-        peak_mem = max(peak_mem, len(pq) + len(g_cost))
+# ======================= 1 START, NHIỀU GOAL =======================
 
-    return None, expanded, peak_mem
+def solve_from_common_start(start: str, goals: List[str], graph: WordGraph, kind: str = "bfs"):
+    """
+    Trả lời cả batch goal từ cùng 1 start bằng 1 lần dựng cây (bfs hoặc ucs),
+    mỗi goal sau đó chỉ đi ngược parent. Trả về list path theo thứ tự goals.
+    """
+    tree = bfs_tree(graph, start) if kind == "bfs" else dijkstra_tree(graph, start)
+    return tree.paths_to(goals)
 
 
 # ======================= RUN 1 CẶP =======================
 
-def run_single_pair(start: str, goal: str, graph: Dict[str, List[str]]):
-    result = {"start": start, "goal": goal}
-
-    # BFS
-    t0 = time.perf_counter()
-    p, e, m = bfs_experiment(start, goal, graph)
-    t1 = time.perf_counter()
-    result["BFS_time_ms"] = (t1 - t0) * 1000
-    result["BFS_expanded"] = e
-    result["BFS_peak_mem"] = m
-    result["BFS_path_len"] = len(p) if p else -1
-
-    # IDS
+# (tên cột, hàm chạy (start, goal, graph, landmarks) -> (path, expanded, peak_mem),
+#  có cột path_cost không, cần landmarks không); thứ tự = thứ tự cột trong CSV
+ALGORITHMS = [
+    ("BFS", lambda s, g, gr, lm: bfs_experiment(s, g, gr), False, False),
+    ("BiBFS", lambda s, g, gr, lm: bibfs_experiment(s, g, gr), False, False),
+    ("IDS", lambda s, g, gr, lm: ids_experiment(s, g, gr), False, False),
+    ("UCS", lambda s, g, gr, lm: ucs_experiment(s, g, gr), True, False),
+    ("BiDijkstra", lambda s, g, gr, lm: bidijkstra_experiment(s, g, gr), True, False),
+    ("WAstar", lambda s, g, gr, lm: weighted_astar_experiment(s, g, gr, 1.0), True, False),
+    ("WAstarEps", lambda s, g, gr, lm: weighted_astar_experiment(s, g, gr, WASTAR_EPSILON), True, False),
+    ("Astar", lambda s, g, gr, lm: astar_experiment(s, g, gr), False, False),
+    ("AstarALT", lambda s, g, gr, lm: astar_experiment(s, g, gr, lm), False, True),
+    ("IDAstar", lambda s, g, gr, lm: idastar_experiment(s, g, gr), False, False),
+    ("IDAstarALT", lambda s, g, gr, lm: idastar_experiment(s, g, gr, lm), False, True),
+]
+_ALGO_BY_NAME = {a[0]: a for a in ALGORITHMS}
+
+
+def algorithm_names(landmarks: bool = True) -> List[str]:
+    return [name for name, _, _, need_lm in ALGORITHMS if landmarks or not need_lm]
+
+
+def run_algorithm(name: str, start: str, goal: str, graph: WordGraph,
+                  landmarks: Optional[Landmarks] = None) -> Dict[str, float]:
+    """Chạy 1 thuật toán cho 1 cặp, trả về các cột {name}_time_ms, _expanded, ..."""
+    _, fn, with_cost, _ = _ALGO_BY_NAME[name]
     t0 = time.perf_counter()
-    p, e, m = ids_experiment(start, goal, graph)
+    p, e, m = fn(start, goal, graph, landmarks)
     t1 = time.perf_counter()
-    result["IDS_time_ms"] = (t1 - t0) * 1000
-    result["IDS_expanded"] = e
-    result["IDS_peak_mem"] = m
-    result["IDS_path_len"] = len(p) if p else -1
-
-    # UCS
-    t0 = time.perf_counter()
-    p, e, m = ucs_experiment(start, goal, graph)
-    t1 = time.perf_counter()
-    result["UCS_time_ms"] = (t1 - t0) * 1000
-    result["UCS_expanded"] = e
-    result["UCS_peak_mem"] = m
-    result["UCS_path_len"] = len(p) if p else -1
+    result = {
+        f"{name}_time_ms": (t1 - t0) * 1000,
+        f"{name}_expanded": e,
+        f"{name}_peak_mem": m,
+        f"{name}_path_len": len(p) if p else -1,
+    }
+    if with_cost:
+        result[f"{name}_path_cost"] = path_cost(p) if p else -1
+    return result
 
-    # A*
-    t0 = time.perf_counter()
-    p, e, m = astar_experiment(start, goal, graph)
-    t1 = time.perf_counter()
-    result["Astar_time_ms"] = (t1 - t0) * 1000
-    result["Astar_expanded"] = e
-    result["Astar_peak_mem"] = m
-    result["Astar_path_len"] = len(p) if p else -1
 
+def run_single_pair(start: str, goal: str, graph: WordGraph, landmarks: Optional[Landmarks] = None):
+    result = {"start": start, "goal": goal}
+    for name in algorithm_names(landmarks is not None):
+        result.update(run_algorithm(name, start, goal, graph, landmarks))
     return result
 
 
 # ======================= MAIN =======================
 
-def run_experiments(num_pairs: int = 10):
-    print("Loading dictionary...")
-    full_words = load_words("data/words.txt")
-    words = filter_five_letter_words(full_words)
-    print(f"Total 5-letter words: {len(words)}")
+def _check_pairs_exist(words: List[str], graph: WordGraph, reachable_only: bool) -> None:
+    """Chặn trước vòng lặp chọn lại vô hạn khi không tồn tại cặp hợp lệ."""
+    if len(words) < 2:
+        raise ValueError(f"cần >= 2 từ để chọn cặp, dictionary có {len(words)}")
+    if reachable_only and max(graph.component_sizes, default=0) < 2:
+        raise ValueError("reachable_only: không có component nào >= 2 từ (mọi từ đều cô lập)")
 
-    print("Building graph...")
-    graph = build_graph(words)
-    print("Graph ready ✓")
 
-    rows = []
-    for i in range(num_pairs):
-        start = random.choice(words)
-        goal = random.choice(words)
+def sample_pair(words: List[str], graph: WordGraph, reachable_only: bool = False, rng=random):
+    """
+    Chọn ngẫu nhiên (start, goal) khác nhau.
+    reachable_only: goal lấy trong cùng component với start (start thuộc component >= 2 từ).
+    rng: random.Random có seed để tái lập được, mặc định module random.
+    ValueError nếu không có cặp nào (dictionary < 2 từ / không component nào >= 2 từ).
+    """
+    _check_pairs_exist(words, graph, reachable_only)
+    if not reachable_only:
+        start = rng.choice(words)
+        goal = rng.choice(words)
         while goal == start:
-            goal = random.choice(words)
-
-        print(f"[{i+1}/{num_pairs}] {start} -> {goal}")
-        row = run_single_pair(start, goal, graph)
-        rows.append(row)
-
-    with open("experiment_results.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+            goal = rng.choice(words)
+        return start, goal
+
+    comp = graph.components
+    start = rng.choice(words)
+    while graph.component_size(graph.id_of(start)) < 2:
+        start = rng.choice(words)
+    c = comp[graph.id_of(start)]
+    members = [v for v in range(graph.n) if comp[v] == c]
+    goal = start
+    while goal == start:
+        goal = graph.words[rng.choice(members)]
+    return start, goal
+
+
+def sample_pairs(words: List[str], graph: WordGraph, num_pairs: int, seed: int = 0,
+                 reachable_only: bool = False) -> List[Tuple[str, str]]:
+    """
+    num_pairs cặp xác định hoàn toàn bởi seed (không phụ thuộc số worker).
+    reachable_only: như sample_pair nhưng gom node theo component 1 lần cho cả batch.
+    """
+    _check_pairs_exist(words, graph, reachable_only)
+    rng = random.Random(seed)
+    if not reachable_only:
+        return [sample_pair(words, graph, False, rng) for _ in range(num_pairs)]
+
+    comp = graph.components
+    members: Dict[int, List[int]] = {}
+    for v in range(graph.n):
+        members.setdefault(comp[v], []).append(v)
+    starts = [v for v in range(graph.n) if len(members[comp[v]]) >= 2]
+
+    pairs = []
+    for _ in range(num_pairs):
+        s = rng.choice(starts)
+        t = s
+        while t == s:
+            t = rng.choice(members[comp[s]])
+        pairs.append((graph.words[s], graph.words[t]))
+    return pairs
+
+
+# ======================= CHẠY SONG SONG =======================
+
+# state của worker: graph / landmarks mở bằng mmap từ file cache (mọi worker dùng
+# chung page cache của OS, không build lại, không unpickle cả graph)
+_w_graph: Optional[WordGraph] = None
+_w_landmarks: Optional[Landmarks] = None
+# lỗi lúc attach cache (file bị xoá / thay giữa chừng): báo lại ở job đầu tiên để process
+# cha nhận đúng lỗi này thay vì BrokenProcessPool khi initializer chết
+_w_error: Optional[RuntimeError] = None
+
+
+def _init_worker(graph_path: str, graph_key: Optional[str], graph: Optional[WordGraph],
+                 landmarks_path: Optional[str], landmarks_k: int, landmarks: Optional[Landmarks]):
+    global _w_graph, _w_landmarks, _w_error
+    try:
+        if graph is None:
+            graph = attach_graph(graph_path, bytes.fromhex(graph_key))
+        if landmarks is None and landmarks_path is not None:
+            landmarks = load_landmarks(landmarks_path, graph.n, bytes.fromhex(graph_key), landmarks_k)
+            if landmarks is None:
+                raise RuntimeError(f"landmark cache {landmarks_path} bị xoá hoặc thay đổi "
+                                   "sau khi bắt đầu chạy, chạy lại")
+    except RuntimeError as e:
+        _w_error = e
+        return
+    _w_graph = graph
+    _w_landmarks = landmarks
+
+
+def _job(job: Tuple[str, str, str]) -> Dict[str, float]:
+    if _w_error is not None:
+        raise _w_error
+    name, start, goal = job
+    return run_algorithm(name, start, goal, _w_graph, _w_landmarks)
+
+
+def iter_pairs_parallel(pairs: List[Tuple[str, str]], graph: WordGraph, dict_path: str,
+                        landmarks: Optional[Landmarks] = None, workers: Optional[int] = None,
+                        algorithms: Optional[List[str]] = None, chunksize: int = 64):
+    """
+    Chia job (cặp, thuật toán) cho process pool, yield 1 row / cặp theo đúng thứ tự pairs
+    ngay khi đủ kết quả của cặp đó (không giữ cả bảng trong RAM).
+    Worker attach vào graph / landmark cache (mmap) của dict_path; cái nào chưa được
+    cache (không ghi được file, graph ngầm) thì mới gửi qua pickle 1 lần / worker.
+    Mọi cột trừ *_time_ms giống hệt nhau với bất kỳ số worker nào.
+    """
+    workers = workers or os.cpu_count() or 1
+    if algorithms is None:
+        algorithms = algorithm_names(landmarks is not None)
+    jobs = ((name, start, goal) for start, goal in pairs for name in algorithms)
+
+    pool = None
+    if workers == 1:
+        results = (run_algorithm(name, start, goal, graph, landmarks) for name, start, goal in jobs)
+    else:
+        graph_path = graph_cache_path(dict_path)
+        key = bytes.fromhex(graph.cache_key) if graph.cache_key else None
+        # graph ngầm (ImplicitWordGraph) không có cache_path: gửi nguyên qua pickle
+        # chỉ kiểm tra header (không mmap trong process cha)
+        cached = (key is not None and graph.cache_path is not None
+                  and graph_cache_valid(graph_path, key))
+        # landmark cache xét theo header của chính nó (graph ngầm cũng có cache_key),
+        # không theo graph cache
+        lm_path = lm_k = None
+        if landmarks is not None and key is not None:
+            lm_path, lm_k = landmarks_cache_path(dict_path), landmarks.k
+            if not landmarks_cache_valid(lm_path, graph.n, key, lm_k):
+                lm_path = None
+        initargs = (graph_path, graph.cache_key, None if cached else graph,
+                    lm_path, lm_k, landmarks if lm_path is None else None)
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs)
+        results = pool.map(_job, jobs, chunksize=chunksize)
+
+    try:
+        for start, goal in pairs:
+            row = {"start": start, "goal": goal}
+            for _ in algorithms:
+                row.update(next(results))
+            yield row
+    except BaseException:
+        if pool is not None:
+            # Ctrl-C / lỗi / generator bị đóng giữa chừng: bỏ job chưa chạy thay vì chờ hết
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    if pool is not None:
+        pool.shutdown(wait=True)      # xong hết: join worker trước khi interpreter thoát
+
+
+def run_pairs_parallel(pairs: List[Tuple[str, str]], graph: WordGraph, dict_path: str,
+                       landmarks: Optional[Landmarks] = None, workers: Optional[int] = None,
+                       algorithms: Optional[List[str]] = None, chunksize: int = 64) -> List[dict]:
+    """Như iter_pairs_parallel nhưng trả về list row."""
+    return list(iter_pairs_parallel(pairs, graph, dict_path, landmarks, workers, algorithms, chunksize))
+
+
+# ======================= GHI KẾT QUẢ (STREAM, RESUME) =======================
+
+class RunningAggregates:
+    """Mean / median thời gian và mean expanded theo thuật toán, cập nhật từng row."""
+
+    def __init__(self, algorithms: List[str]):
+        self.algorithms = algorithms
+        self.times = {a: array("d") for a in algorithms}
+        self.expanded = {a: 0 for a in algorithms}
+
+    def add(self, row: dict) -> None:
+        for a in self.algorithms:
+            self.times[a].append(float(row[f"{a}_time_ms"]))
+            self.expanded[a] += int(row[f"{a}_expanded"])
+
+    def report(self) -> str:
+        lines = [f"{'algorithm':12s} {'n':>7s} {'mean ms':>10s} {'median ms':>10s} {'mean expanded':>14s}"]
+        for a in self.algorithms:
+            ts = self.times[a]
+            if not ts:
+                continue
+            n = len(ts)
+            lines.append(f"{a:12s} {n:7d} {sum(ts) / n:10.2f} {median(ts):10.2f} {self.expanded[a] / n:14.1f}")
+        return "\n".join(lines)
+
+
+def run_config_id(words: List[str], seed: int, reachable_only: bool, algorithms: List[str]) -> str:
+    """Định danh cấu hình chạy: cùng id = cùng dictionary, seed, cách chọn cặp và thuật toán."""
+    h = hashlib.sha256()
+    h.update(json.dumps([seed, reachable_only, algorithms]).encode())
+    h.update("\n".join(words).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _read_rows(path: str):
+    """Đọc row đã ghi (CSV hoặc .jsonl); dòng cuối bị cắt dở (crash lúc ghi) thì bỏ."""
+    if not os.path.exists(path):
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    return
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                if None in row.values() or None in row:
+                    return
+                yield row
+
+
+class _RowWriter:
+    """Ghi từng row ra CSV hoặc JSON Lines (theo đuôi file), flush mỗi flush_every row."""
+
+    def __init__(self, path: str, append: bool, flush_every: int):
+        self.path = path
+        self.jsonl = path.endswith(".jsonl")
+        self.flush_every = max(1, flush_every)
+        self.pending = 0
+        has_data = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self.header = None
+        if has_data:
+            _truncate_partial_line(path)
+            if not self.jsonl:
+                with open(path, newline="", encoding="utf-8") as f:
+                    self.header = next(csv.reader(f), None)
+        self.f = open(path, "a" if has_data else "w", newline="", encoding="utf-8")
+        self.writer = None
+
+    def write(self, row: dict) -> None:
+        if self.jsonl:
+            self.f.write(json.dumps(row) + "\n")
+        else:
+            if self.writer is None:
+                fields = list(row.keys())
+                if self.header is not None and self.header != fields:
+                    raise ValueError(f"{self.path} có cột khác cấu hình hiện tại, không resume được")
+                self.writer = csv.DictWriter(self.f, fieldnames=fields)
+                if self.header is None:
+                    self.writer.writeheader()
+            self.writer.writerow(row)
+        self.pending += 1
+        if self.pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.f.close()
+
+
+def _truncate_partial_line(path: str) -> None:
+    """Cắt dòng cuối nếu chưa ghi xong (không kết thúc bằng newline)."""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def run_experiments(num_pairs: int = 10, workers: Optional[int] = 1, reachable_only: bool = False,
+                    seed: int = 0, out: str = "experiment_results.csv", resume: bool = False,
+                    flush_every: int = 10, report_every: int = 10, length: int = WORD_LENGTH,
+                    implicit: bool = False):
+    """
+    Chạy num_pairs cặp sinh từ seed; workers > 1 (None = số CPU) chạy song song,
+    kết quả (trừ thời gian) không đổi theo số worker.
+    Row được ghi ngay khi xong (out .csv hoặc .jsonl), flush mỗi flush_every row.
+    resume=True: giữ file cũ, bỏ qua cặp đã xong với cùng run_id (seed + cấu hình), chạy tiếp.
+    Mỗi report_every row in aggregate (mean / median thời gian, mean expanded) theo thuật toán.
+    length: độ dài từ lấy từ dictionary, cache graph / landmarks riêng theo độ dài.
+    implicit=True: chạy trên ImplicitWordGraph (sinh hàng xóm lúc cần, không graph file);
+    landmark chỉ dùng nếu đã có cache, component vẫn tính trước để so công bằng với CSR.
+    """
+    print("Loading dictionary...")
+    words = load_words(DICT_PATH, length)
+    print(f"Total {length}-letter words: {len(words)}")
+
+    cache_path = length_dict_path(DICT_PATH, length)
+    if implicit:
+        graph = ImplicitWordGraph(words, IMPLICIT_CACHE_SIZE)
+        graph.label_components()
+        landmarks = load_landmarks(landmarks_cache_path(cache_path), graph.n,
+                                   bytes.fromhex(graph.cache_key), DEFAULT_K)
+    else:
+        graph = load_or_build_graph(cache_path, words, workers)
+        landmarks = load_or_build_landmarks(cache_path, graph, workers=workers)
+    print("Graph ready ✓")
 
-    print("\nDONE! Saved to experiment_results.csv")
+    algorithms = algorithm_names(landmarks is not None)
+    run_id = run_config_id(words, seed, reachable_only, algorithms)
+    aggregates = RunningAggregates(algorithms)
+
+    done = set()
+    if resume:
+        if os.path.exists(out):
+            _truncate_partial_line(out)
+        for row in _read_rows(out):
+            if row.get("run_id") == run_id:
+                done.add(int(row["pair_index"]))
+                aggregates.add(row)
+        print(f"Resuming run {run_id}: {len(done)} pairs already in {out}")
+
+    pairs = sample_pairs(words, graph, num_pairs, seed, reachable_only)
+    todo = [i for i in range(num_pairs) if i not in done]
+    print(f"Running {len(todo)}/{num_pairs} pairs (seed={seed}, workers={workers or os.cpu_count()})...")
+
+    writer = _RowWriter(out, resume, flush_every)
+    try:
+        rows = iter_pairs_parallel([pairs[i] for i in todo], graph, cache_path, landmarks, workers, algorithms)
+        # lặp trên rows (không zip với todo) để generator chạy hết và join pool
+        for k, row in enumerate(rows, 1):
+            i = todo[k - 1]
+            row = dict({"run_id": run_id, "pair_index": i}, **row)
+            writer.write(row)
+            aggregates.add(row)
+            print(f"[{i + 1}/{num_pairs}] {row['start']} -> {row['goal']}")
+            if k % report_every == 0:
+                print(aggregates.report())
+    finally:
+        writer.close()
+
+    if not todo or len(todo) % report_every:     # chia hết thì vòng lặp vừa in rồi
+        print(aggregates.report())
+    print(f"\nDONE! Saved to {out}")
+
+    if PROFILE_SEARCH:
+        pstats.Stats(_profiler).sort_stats("cumulative").print_stats(20)
 
 
 if __name__ == "__main__":
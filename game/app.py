@@ -1,31 +1,69 @@
-import os
-import pickle
-from game.logic import load_words, choose_secret, play_console
+import threading
+
+from game.logic import WORD_LENGTH, LengthLexicons, choose_secret, play_console
+from game.feedback import load_feedback_matrix
 from game.gui_tk import run_gui
-from solvers.bfs_solver import build_graph
+from solvers.entropy_solver import opener_cache_path
+from solvers.graph_cache import load_or_build_graph
+from solvers.implicit_graph import ImplicitWordGraph
+from solvers.landmarks import DEFAULT_K, landmarks_cache_path, load_landmarks, load_or_build_landmarks
+from solvers.path_cache import PathCache, path_cache_path
 
 DICT_PATH = "data/words.txt"
+IMPLICIT_CACHE_SIZE = 4096     # số node giữ hàng xóm trong ImplicitWordGraph
+
 
+def load_graph_cache(dict_path, words, log=print):
+    """Graph cache nhị phân theo nội dung dictionary, xem solvers/graph_cache."""
+    return load_or_build_graph(dict_path, words, log=log)
 
-def load_graph_cache(dict_path, words):
-    cache_file = dict_path.replace(".txt", "_graph.pkl")
 
-    if os.path.exists(cache_file):
-        print("Loading graph cache...")
-        with open(cache_file, "rb") as f:
-            return pickle.load(f)
+class LengthSession:
+    """
+    Mọi thứ của 1 độ dài từ: graph, landmarks, ma trận feedback, path cache.
+    Chỉ load / build ở lần đầu load() (cache file riêng theo length_dict_path),
+    nên chơi 5 chữ không tốn gì cho các độ dài khác.
+    implicit=True: graph ngầm (ImplicitWordGraph), không đọc / ghi graph file,
+    landmark chỉ dùng nếu đã có cache.
+    """
 
-    print("Building graph (first time)...")
-    graph = build_graph(words)
+    def __init__(self, lexicons: LengthLexicons, length: int, implicit: bool = False):
+        self.length = length
+        self.implicit = implicit
+        self.words = lexicons.get(length)
+        self.cache_path = lexicons.cache_path(length)
+        self._lock = threading.Lock()
+        self._loaded = None
 
-    with open(cache_file, "wb") as f:
-        pickle.dump(graph, f)
+    def load(self, log=print):
+        """
+        (words, graph, feedback_matrix, opener_path, landmarks, path_cache) cho run_gui.
+        log(msg) nhận tiến độ (GUI gọi từ thread nền và hiện trong cửa sổ).
+        """
+        with self._lock:
+            if self._loaded is None:
+                if self.implicit:
+                    graph = ImplicitWordGraph(self.words, IMPLICIT_CACHE_SIZE)
+                    landmarks = load_landmarks(landmarks_cache_path(self.cache_path), graph.n,
+                                               bytes.fromhex(graph.cache_key), DEFAULT_K)
+                else:
+                    graph = load_graph_cache(self.cache_path, self.words, log)
+                    landmarks = load_or_build_landmarks(self.cache_path, graph, log=log)
+                # ma trận feedback là tuỳ chọn (python -m game.feedback build)
+                matrix = load_feedback_matrix(self.cache_path, self.words)
+                path_cache = PathCache(path=path_cache_path(self.cache_path))
+                self._loaded = (self.words, graph, matrix, opener_cache_path(self.cache_path),
+                                landmarks, path_cache)
+            return self._loaded
 
-    return graph
+    def save(self):
+        if self._loaded is not None:
+            self._loaded[-1].save()
 
 
-def run_app(mode="GUI"):
-    words = load_words(DICT_PATH)
+def run_app(mode="GUI", length=WORD_LENGTH, implicit=False):
+    lexicons = LengthLexicons(DICT_PATH)
+    words = lexicons.get(length)
     if not words:
         print("Dictionary is empty or not found!")
         return
@@ -34,5 +72,14 @@ def run_app(mode="GUI"):
         secret = choose_secret(words)
         play_console(secret, words)
     else:
-        graph = load_graph_cache(DICT_PATH, words)
-        run_gui(words, graph)
+        sessions = {}
+
+        def load_length(n, log=print):
+            if n not in sessions:
+                sessions[n] = LengthSession(lexicons, n, implicit)
+            return sessions[n].load(log)
+
+        # mở cửa sổ ngay sau khi có từ, graph load ở thread nền trong GUI
+        run_gui(words, lengths=lexicons.lengths, load_length=load_length)
+        for session in sessions.values():
+            session.save()
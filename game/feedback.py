@@ -0,0 +1,254 @@
+# game/feedback.py
+"""
+Feedback dạng mã base-3 và ma trận feedback tính sẵn.
+
+Mã của 1 lượt đoán: sum(d[i] * 3**i), d[i] = 0 (B), 1 (Y), 2 (G).
+Với từ 5 chữ mã nằm trong 0..242, 242 = GGGGG; từ dài hơn thì mã vượt 1 byte.
+
+check_guess trong logic.py vẫn là bản chuẩn; score_batch / score_matrix là
+kernel chấm nhiều cặp một lúc, FeedbackMatrix đọc ma trận guess x secret
+(uint8) đã tính sẵn từ file bằng mmap.
+
+    python -m game.feedback build  [--dict data/words.txt] [--workers N]
+    python -m game.feedback verify [--dict data/words1.txt] [--limit N] [--length 6]
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence
+
+from .logic import WORD_LENGTH, Lexicon, check_guess, length_dict_path, load_words
+
+_DIGIT = {"B": 0, "Y": 1, "G": 2}
+_LETTER = "BYG"
+
+MAGIC = b"WLFM"
+FORMAT_VERSION = 1
+# magic, version, word length, n, key (sha256 của dictionary)
+_HEADER = struct.Struct("<4sHHI32s")
+
+
+def all_green(length: int = WORD_LENGTH) -> int:
+    return 3 ** length - 1
+
+
+def encode(feedback: Sequence[str]) -> int:
+    """['G', 'B', 'Y', ...] -> mã base-3."""
+    code = 0
+    for i, ch in enumerate(feedback):
+        code += _DIGIT[ch] * 3 ** i
+    return code
+
+
+def decode(code: int, length: int = WORD_LENGTH) -> List[str]:
+    """Mã base-3 -> ['G', 'B', 'Y', ...]."""
+    out = []
+    for _ in range(length):
+        code, d = divmod(code, 3)
+        out.append(_LETTER[d])
+    return out
+
+
+def score(secret: str, guess: str) -> int:
+    """Giống encode(check_guess(secret, guess)) nhưng không tạo list trung gian."""
+    code = 0
+    p = 1
+    rest = []
+    pending = []
+    for a, b in zip(secret, guess):
+        if a == b:
+            code += 2 * p
+        else:
+            rest.append(a)
+            pending.append((b, p))
+        p *= 3
+    for b, p in pending:
+        if b in rest:
+            code += p
+            rest.remove(b)
+    return code
+
+
+def score_batch(guess: str, secrets: Iterable[str]):
+    """Chấm 1 guess với nhiều secret: bytearray nếu length <= 5, dài hơn thì array uint32."""
+    guess = guess.upper()
+    top = all_green(len(guess))
+    out = bytearray() if top <= 255 else array("I")
+    append = out.append
+    for s in secrets:
+        append(top if s == guess else score(s, guess))
+    return out
+
+
+def score_matrix(guesses: Iterable[str], secrets: Sequence[str]) -> List[bytearray]:
+    """Chấm nhiều guess x nhiều secret, mỗi guess 1 hàng."""
+    return [score_batch(g, secrets) for g in guesses]
+
+
+# ======================================================
+# MA TRẬN TÍNH SẴN
+# ======================================================
+
+def feedback_matrix_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_feedback.bin"
+
+
+def dictionary_key(words: Sequence[str]) -> bytes:
+    return hashlib.sha256("\n".join(words).encode("utf-8")).digest()
+
+
+class FeedbackMatrix:
+    """
+    Ma trận n x n uint8, hàng = guess id, cột = secret id (id theo Lexicon).
+    File chỉ được mmap ở lần truy cập đầu tiên.
+    """
+
+    def __init__(self, path: str, words: Lexicon):
+        self.path = path
+        self.words = Lexicon(words)
+        self.n = len(self.words)
+        self._buf = None
+        self._mmap = None
+
+    def _open(self):
+        with open(self.path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, length, n, key = _HEADER.unpack_from(mm, 0)
+        if (magic != MAGIC or version != FORMAT_VERSION or n != self.n
+                or key != dictionary_key(self.words)
+                or len(mm) != _HEADER.size + n * n):
+            mm.close()
+            raise ValueError(f"{self.path} không khớp với dictionary, chạy lại build")
+        self._mmap = mm
+        self._buf = memoryview(mm)[_HEADER.size:]
+
+    @property
+    def buf(self) -> memoryview:
+        if self._buf is None:
+            self._open()
+        return self._buf
+
+    def row(self, guess_id: int) -> memoryview:
+        """Mã feedback của guess với mọi secret."""
+        n = self.n
+        return self.buf[guess_id * n:(guess_id + 1) * n]
+
+    def code(self, guess_id: int, secret_id: int) -> int:
+        return self.buf[guess_id * self.n + secret_id]
+
+
+def load_feedback_matrix(dict_path: str, words: Lexicon) -> Optional[FeedbackMatrix]:
+    """FeedbackMatrix nếu file đã build và khớp dictionary, ngược lại None."""
+    path = feedback_matrix_path(dict_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        return None
+    magic, version, _, n, key = _HEADER.unpack(head)
+    if magic != MAGIC or version != FORMAT_VERSION or n != len(words) or key != dictionary_key(words):
+        return None
+    return FeedbackMatrix(path, words)
+
+
+_worker_words: Sequence[str] = ()
+
+
+def _init_worker(words):
+    global _worker_words
+    _worker_words = words
+
+
+def _score_rows(bounds):
+    lo, hi = bounds
+    words = _worker_words
+    return b"".join(score_batch(words[g], words) for g in range(lo, hi))
+
+
+def build_feedback_matrix(dict_path: str, words: Lexicon, workers: Optional[int] = None,
+                          chunk: int = 64, log=print) -> FeedbackMatrix:
+    """Tính toàn bộ n x n mã feedback, ghi atomically ra file cạnh dictionary."""
+    words = Lexicon(words)
+    n = len(words)
+    if n and all_green(len(words[0])) > 255:
+        raise ValueError("mã feedback uint8 chỉ đủ cho từ <= 5 chữ")
+    path = feedback_matrix_path(dict_path)
+    workers = workers or os.cpu_count() or 1
+    chunks = [(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    t0 = time.perf_counter()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(words[0]) if n else 0, n,
+                                 dictionary_key(words)))
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(tuple(words),)) as pool:
+                for k, rows in enumerate(pool.map(_score_rows, chunks)):
+                    f.write(rows)
+                    if log and k % 20 == 0:
+                        log(f"  rows {chunks[k][1]}/{n}  ({time.perf_counter() - t0:.0f}s)")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return FeedbackMatrix(path, words)
+
+
+def verify(words: Sequence[str], matrix: Optional[FeedbackMatrix] = None) -> int:
+    """
+    So score_batch (và matrix nếu có) với check_guess trên mọi cặp guess x secret.
+    Trả về số cặp sai.
+    """
+    bad = 0
+    for gi, g in enumerate(words):
+        row = score_batch(g, words)
+        mrow = matrix.row(gi) if matrix is not None else None
+        for si, s in enumerate(words):
+            ref = encode(check_guess(s, g))
+            if row[si] != ref or (mrow is not None and mrow[si] != ref):
+                bad += 1
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--dict", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=0, help="verify: chỉ dùng N từ đầu")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, help="độ dài từ (build chỉ hỗ trợ <= 5)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        dict_path = args.dict or "data/words.txt"
+        words = load_words(dict_path, args.length)
+        cache_path = length_dict_path(dict_path, args.length)
+        print(f"Building {len(words)} x {len(words)} feedback matrix...")
+        build_feedback_matrix(cache_path, words, args.workers)
+        print(f"Saved to {feedback_matrix_path(cache_path)}")
+    else:
+        dict_path = args.dict or "data/words1.txt"
+        words = load_words(dict_path, args.length)
+        matrix = load_feedback_matrix(length_dict_path(dict_path, args.length), words)
+        if args.limit:
+            words = words[:args.limit]     # id 0..limit-1 vẫn khớp với matrix
+        bad = verify(words, matrix)
+        checked = "score_batch + matrix" if matrix is not None else "score_batch"
+        print(f"{checked}: {len(words) ** 2} pairs, {bad} mismatches")
+        if bad:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
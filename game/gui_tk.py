@@ -1,16 +1,36 @@
+import queue
 import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
-from typing import List
 
-from .logic import load_words, choose_secret, check_guess, is_valid_guess
+from .logic import Lexicon, load_words, choose_secret, check_guess, is_valid_guess
+from .letter_index import Constraints, LetterIndex
 from solvers.bfs_solver import bfs_solve
+from solvers.bidir_bfs_solver import bidir_bfs_solve
 from solvers.dfs_solver import ids_solve
 from solvers.astar_solver import astar_solve
+from solvers.idastar_solver import idastar_solve
 from solvers.ucs_solver import ucs_solve
-
-
-WORD_LENGTH = 5
+from solvers.entropy_solver import EntropySolver
+from solvers.implicit_graph import ImplicitWordGraph
+from solvers.path_cache import default_path_cache
+from solvers.sssp_tree import bfs_tree, dijkstra_tree
+
+
+CELL_PX = 95          # bề rộng 1 ô (kể cả padding), canvas rộng theo độ dài từ
+
+# (nhãn nút, mode của run_solver); mọi nút này chỉ bật khi graph đã load xong
+SOLVER_BUTTONS = [
+    ("Run BFS Solver", "bfs"),
+    ("Run Bi-BFS Solver", "bibfs"),
+    ("Run DFS Solver", "dfs"),
+    ("Run UCS Solver", "ucs"),
+    ("Run A* Solver", "astar"),
+    ("Run A* (ALT) Solver", "astar_alt"),
+    ("Run IDA* Solver", "idastar"),
+    ("Entropy Solver", "entropy"),
+]
 
 COLOR_BG = "#121213"
 COLOR_EMPTY = "#3a3a3c"
@@ -28,11 +48,28 @@ COLOR_KEY_GRAY = "#3a3a3c"
 
 
 class WordleGUI:
-    def __init__(self, root: tk.Tk, words: List[str], graph):
+    def __init__(self, root: tk.Tk, words: Lexicon, graph=None, feedback_matrix=None, opener_path=None,
+                 landmarks=None, path_cache=None, lengths=None, load_length=None):
         self.root = root
         self.words = words
-        self.graph = graph
+        self.word_length = len(words[0])
+        # lengths / load_length(n, log): các độ dài chọn được và hàm load tài nguyên độ dài n
+        # (cùng thứ tự tham số như __init__, chạy ở thread nền), None = chỉ chơi 1 độ dài
+        self.lengths = lengths or [self.word_length]
+        self.load_length = load_length
+        self.graph = graph                        # None -> đang load ở background
+        self.ready = graph is not None
+        self.pending_solver = None                # mode bấm lúc graph chưa sẵn sàng
+        self.solver_buttons = []
+        self._load_token = 0
+        self.landmarks = landmarks                # None -> nút A* (ALT) dùng Hamming
+        self.path_cache = path_cache if path_cache is not None else default_path_cache
+        self.feedback_matrix = feedback_matrix    # None -> entropy solver ước lượng
+        self.opener_path = opener_path
         self.secret = choose_secret(words)
+        self.guess_history = []                   # (guess, feedback) các row đã ENTER
+        self.letter_index = LetterIndex(words)
+        self.constraints = Constraints()
 
         self.current_row = 0
         self.current_col = 0
@@ -57,6 +94,15 @@ class WordleGUI:
         self.solver_thread = None
         self.stop_solver = False
 
+        # Start word cố định -> dựng sẵn cây BFS / Dijkstra (UCS) ở background,
+        # sau đó path tới mọi secret chỉ là đi ngược parent (xem _prepare_graph)
+        self.start_trees = {}
+        if self.ready:
+            threading.Thread(target=self._prepare_graph, args=(self.graph,), daemon=True).start()
+        else:
+            # cửa sổ hiện ngay, gõ đoán không cần graph; solver chờ load xong
+            self._load_in_background(self.word_length, restart=False)
+
         # Tạo sẵn 6 hàng trống
         for _ in range(6):
             self._create_row()
@@ -88,6 +134,26 @@ class WordleGUI:
         )
         title.grid(row=0, column=1, pady=10)
 
+        # Số từ còn khớp feedback (cột trái)
+        self.candidates_label = tk.Label(
+            header,
+            text=f"Candidates: {len(self.words)}",
+            font=("Helvetica", 12, "bold"),
+            fg="#00e6e6",
+            bg=COLOR_BG
+        )
+        self.candidates_label.grid(row=0, column=0, sticky="w", padx=20)
+
+        # Tiến độ load graph (trống khi đã sẵn sàng)
+        self.status_label = tk.Label(
+            header,
+            text="",
+            font=("Helvetica", 11),
+            fg="#aaaaaa",
+            bg=COLOR_BG
+        )
+        self.status_label.grid(row=1, column=0, columnspan=3)
+
         # SETTINGS BUTTON nằm góc phải (col=2)
         settings_btn = tk.Button(
             header,
@@ -114,7 +180,7 @@ class WordleGUI:
 
         win.title("Settings")
         win.configure(bg=COLOR_BG)
-        win.geometry("300x400")
+        win.geometry("300x690")
 
         # Khi user đóng cửa sổ 
         def on_close():
@@ -123,40 +189,37 @@ class WordleGUI:
 
         win.protocol("WM_DELETE_WINDOW", on_close)
 
+        if self.load_length is not None and len(self.lengths) > 1:
+            row = tk.Frame(win, bg=COLOR_BG)
+            row.pack(pady=(10, 0))
+            tk.Label(
+                row, text="Word length",
+                font=("Helvetica", 14, "bold"),
+                bg=COLOR_BG, fg="#00e6e6"
+            ).pack(side="left", padx=5)
+            length_var = tk.IntVar(value=self.word_length)
+            tk.OptionMenu(
+                row, length_var, *self.lengths,
+                command=self.set_word_length
+            ).pack(side="left")
+
         tk.Label(
             win, text="Solver Options",
             font=("Helvetica", 18, "bold"),
             bg=COLOR_BG, fg="#00e6e6"
         ).pack(pady=10)
 
-        tk.Button(
-            win, text="Run BFS Solver",
-            font=("Helvetica", 14, "bold"),
-            bg="#333333", fg="white",
-            command=lambda: self.run_solver("bfs")
-        ).pack(pady=5)
-
-        tk.Button(
-            win, text="Run DFS Solver",
-            font=("Helvetica", 14, "bold"),
-            bg="#333333", fg="white",
-            command=lambda: self.run_solver("dfs")
-        ).pack(pady=5)
-
-
-        tk.Button(
-            win, text="Run UCS Solver",
-            font=("Helvetica", 14, "bold"),
-            bg="#333333", fg="white",
-            command=lambda: self.run_solver("ucs")
-        ).pack(pady=5)
-
-        tk.Button(
-            win, text="Run A* Solver",
-            font=("Helvetica", 14, "bold"),
-            bg="#333333", fg="white",
-            command=lambda: self.run_solver("astar")
-        ).pack(pady=5)
+        self.solver_buttons = []
+        for text, mode in SOLVER_BUTTONS:
+            btn = tk.Button(
+                win, text=text,
+                font=("Helvetica", 14, "bold"),
+                bg="#333333", fg="white",
+                state="normal" if self.ready else "disabled",
+                command=lambda m=mode: self.run_solver(m)
+            )
+            btn.pack(pady=5)
+            self.solver_buttons.append(btn)
 
         # RESET BUTTON
         tk.Button(
@@ -174,6 +237,114 @@ class WordleGUI:
             command=self.stop_current_solver
         ).pack(pady=10)
 
+    def set_word_length(self, length):
+        """Đổi độ dài từ: load graph / cache của độ dài đó ở background rồi dựng lại bàn chơi."""
+        length = int(length)
+        if self.load_length is None:
+            return
+        # cùng độ dài mà chưa ready (lần load trước lỗi) thì cho load lại
+        if length == self.word_length and self.ready:
+            return
+        self.stop_current_solver()
+        self.pending_solver = None        # solver bấm cho độ dài cũ, không chạy trên bàn mới
+        self._load_in_background(length, restart=length != self.word_length)
+
+    # ======================================================
+    # LOAD GRAPH Ở BACKGROUND
+    # ======================================================
+    def _set_ready(self, ready):
+        self.ready = ready
+        for btn in self.solver_buttons:
+            if btn.winfo_exists():
+                btn.config(state="normal" if ready else "disabled")
+
+    def _load_in_background(self, length, restart):
+        """
+        Gọi load_length ở thread nền; thread chỉ đẩy log / kết quả vào queue,
+        main thread poll queue mỗi 100ms (Tk chỉ được đụng từ main thread).
+        restart=True: xong thì dựng lại bàn chơi (đổi độ dài từ).
+        """
+        self._load_token += 1
+        token = self._load_token
+        self._set_ready(False)
+        events = queue.Queue()
+        status = [f"Loading {length}-letter graph..."]
+        t0 = time.perf_counter()
+
+        def log(msg):
+            print(msg)
+            events.put(("log", msg))
+
+        def load():
+            try:
+                events.put(("done", self.load_length(length, log)))
+            except Exception as e:
+                events.put(("error", e))
+
+        def poll():
+            if token != self._load_token:
+                return            # đã có lần load mới hơn (đổi độ dài lần nữa)
+            while True:
+                try:
+                    kind, value = events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "log":
+                    status[0] = value
+                elif kind == "error":
+                    self._load_failed(length, value)
+                    return
+                else:
+                    self._apply_resources(*value, restart=restart)
+                    self.status_label.config(
+                        text=f"Graph ready ({time.perf_counter() - t0:.1f}s)")
+                    return
+            text = f"{status[0]} {time.perf_counter() - t0:.1f}s"
+            if self.pending_solver is not None:
+                text += f"  ({self.pending_solver} queued)"
+            self.status_label.config(text=text)
+            self.root.after(100, poll)
+
+        threading.Thread(target=load, daemon=True).start()
+        poll()
+
+    def _load_failed(self, length, error):
+        """
+        Bỏ solver đang chờ và báo lỗi. Đang đổi độ dài mà lỗi thì vẫn chơi tiếp
+        độ dài cũ (graph cũ còn nguyên); lỗi ở lần load đầu thì chọn lại độ dài
+        trong Settings để thử lại.
+        """
+        self.pending_solver = None
+        self._set_ready(self.graph is not None)
+        self.status_label.config(text=f"Graph load failed: {error}")
+        messagebox.showerror("Graph", f"Không load được graph {length} chữ:\n{error}")
+
+    def _apply_resources(self, words, graph, feedback_matrix, opener_path, landmarks, path_cache,
+                         restart=False):
+        self.words = words
+        self.word_length = len(words[0])
+        self.graph = graph
+        self.feedback_matrix = feedback_matrix
+        self.opener_path = opener_path
+        self.landmarks = landmarks
+        self.path_cache = path_cache if path_cache is not None else default_path_cache
+        if restart:
+            self.letter_index = LetterIndex(words)
+            self.canvas.config(width=max(500, CELL_PX * self.word_length))
+            self.restart_game()
+        self.start_trees = {}
+        threading.Thread(target=self._prepare_graph, args=(graph,), daemon=True).start()
+        self._set_ready(True)
+
+        if self.pending_solver is not None:
+            mode, self.pending_solver = self.pending_solver, None
+            self.run_solver(mode)
+
+    def secret_reachable(self) -> bool:
+        """Graph ngầm chưa gán nhãn component xong thì True (solver tự search rồi báo)."""
+        g = self.graph
+        return g.connected(g.id_of(self.words[0]), g.id_of(self.secret))
+
     def stop_current_solver(self):
         print("[STOP] stopping solver...")
         self.stop_solver = True
@@ -192,6 +363,9 @@ class WordleGUI:
         print(f"(DEBUG) New secret word is: {self.secret}")
 
         # Reset trạng thái nội bộ
+        self.guess_history = []
+        self.constraints = Constraints()
+        self.update_candidates_label()
         self.game_over = False
         self.current_row = 0
         self.current_col = 0
@@ -218,11 +392,24 @@ class WordleGUI:
         if self.game_over:
             return
 
+        # Graph chưa load xong -> xếp hàng, chạy khi sẵn sàng
+        if not self.ready:
+            self.pending_solver = mode
+            return
+
         # Nếu solver đang chạy → không cho chạy thêm
         if self.solver_thread and self.solver_thread.is_alive():
             messagebox.showinfo("Solver", "Solver đang chạy!")
             return
 
+        # Solver word-ladder: báo ngay nếu start và secret khác component (O(1))
+        if mode != "entropy" and not self.secret_reachable():
+            messagebox.showwarning(
+                "No path",
+                f"Không có đường đi từ {self.words[0]} tới secret (khác connected component)!"
+            )
+            return
+
         # Reset stop flag
         self.stop_solver = False
 
@@ -235,9 +422,60 @@ class WordleGUI:
         self.solver_thread.start()
 
     def _run_solver_thread(self, mode):
+        if mode == "entropy":
+            self._play_entropy()
+            return
+
         start_word = self.words[0]
         goal_word = self.secret
 
+        path = self.path_cache.get_or_solve(
+            mode, start_word, goal_word, self.graph,
+            lambda: self._solve_path(mode, start_word, goal_word),
+            store=lambda: not self.stop_solver,
+        )
+        print(f"[CACHE] {self.path_cache.stats()}")
+
+        # Nếu bị dừng giữa chừng -> thoát silently
+        if self.stop_solver:
+            print("[THREAD] Solver stopped early.")
+            return
+
+        # Nếu không có path
+        if not path:
+            self.root.after(0, lambda: messagebox.showwarning("No path", "Không tìm được đường đi!"))
+            return
+
+        # Loại bỏ start nếu cần
+        if path[0] == start_word:
+            path = path[1:]
+
+        # CHẠY TRONG MAIN THREAD
+        self.root.after(0, lambda: self.run_guess_sequence(path))
+
+    def _prepare_graph(self, graph):
+        """
+        Việc nặng sau khi có graph, chạy ở thread nền.
+        Graph ngầm (ImplicitWordGraph): chỉ gán nhãn component để secret_reachable báo
+        sớm, không dựng cây (duyệt cả component lúc mở, mất ý nghĩa khởi động lazy).
+        """
+        if isinstance(graph, ImplicitWordGraph):
+            graph.label_components()
+            print("[GRAPH] connected components labelled")
+        else:
+            self._build_start_trees()
+
+    def _build_start_trees(self):
+        start_word = self.words[0]
+        self.start_trees["bfs"] = bfs_tree(self.graph, start_word)
+        self.start_trees["ucs"] = dijkstra_tree(self.graph, start_word)
+        print(f"[TREE] shortest-path trees from {start_word} ready")
+
+    def _solve_path(self, mode, start_word, goal_word):
+        tree = self.start_trees.get(mode)
+        if tree is not None and tree.source_word == start_word:
+            return tree.path_to(goal_word)
+
         path = None
 
         # chọn solver
@@ -249,10 +487,14 @@ class WordleGUI:
                 self.graph,
                 )
 
+        elif mode == "bibfs":
+            path = bidir_bfs_solve(start_word, goal_word, self.words, self.graph)
+
         elif mode == "dfs":  # IDS
             path = ids_solve(
                 start_word, goal_word, self.words, self.graph,
-                stop_flag=lambda: self.stop_solver
+                stop_flag=lambda: self.stop_solver,
+                progress=lambda depth, expanded: print(f"[IDS] depth = {depth}, expanded = {expanded}"),
             )
 
         elif mode == "ucs":
@@ -266,29 +508,72 @@ class WordleGUI:
         elif mode == "astar":
             path = astar_solve(start_word, goal_word, self.words, self.graph)
 
-        # Nếu bị dừng giữa chừng -> thoát silently
-        if self.stop_solver:
-            print("[THREAD] Solver stopped early.")
-            return
+        elif mode == "astar_alt":
+            path = astar_solve(start_word, goal_word, self.words, self.graph, self.landmarks)
 
-        # Nếu không có path
-        if not path:
-            self.root.after(0, lambda: messagebox.showwarning("No path", "Không tìm được đường đi!"))
-            return
+        elif mode == "idastar":
+            # có landmark thì dùng để cắt nhánh, không thì Hamming thuần (STOP để dừng)
+            path = idastar_solve(
+                start_word, goal_word, self.words, self.graph,
+                stop_flag=lambda: self.stop_solver, landmarks=self.landmarks,
+            )
 
-        # Loại bỏ start nếu cần
-        if path[0] == start_word:
-            path = path[1:]
+        return path
+
+    def _play_entropy(self):
+        """
+        Entropy solver chơi như người: chỉ dùng feedback của các row đã đoán
+        (kể cả row người chơi tự nhập trước đó), không đọc secret.
+        """
+        solver = EntropySolver(self.words, self.feedback_matrix, opener_path=self.opener_path)
+        try:
+            for guess, feedback in self.guess_history:
+                solver.update(guess, feedback)
+
+            while not self.stop_solver and not self.game_over:
+                if not solver.candidates:
+                    self.root.after(0, lambda: messagebox.showwarning("No path", "Không còn từ nào khớp feedback!"))
+                    return
+                guess = solver.next_guess()
+                if self.stop_solver:
+                    break
+                feedback = self._submit_from_thread(guess)
+                if feedback is None or self.game_over:
+                    break
+                solver.update(guess, feedback)
+                time.sleep(0.9)
+        finally:
+            solver.close()
 
-        # CHẠY TRONG MAIN THREAD
-        self.root.after(0, lambda: self.run_guess_sequence(path))
+        if self.stop_solver:
+            print("[THREAD] Solver stopped early.")
+
+    def _submit_from_thread(self, guess):
+        """Nhập guess vào row hiện tại trên main thread, chờ và trả về feedback."""
+        done = threading.Event()
+        box = []
+
+        def submit():
+            try:
+                for i, ch in enumerate(guess):
+                    cell = self.cells_all_rows[self.current_row][i]
+                    cell.config(text=ch, bg=COLOR_TYPING)
+                self.current_col = self.word_length
+                box.append(self.on_enter())
+            finally:
+                done.set()
+
+        self.root.after(0, submit)
+        done.wait()
+        return box[0] if box else None
 
     def run_guess_sequence(self, guesses):
         self.solver_guesses = guesses
         self.solver_index = 0
 
         def do_step():
-            if self.solver_index >= len(self.solver_guesses):
+            # STOP / đổi độ dài từ giữa chừng -> bỏ các guess còn lại
+            if self.stop_solver or self.solver_index >= len(self.solver_guesses):
                 return
 
             guess = self.solver_guesses[self.solver_index]
@@ -298,7 +583,7 @@ class WordleGUI:
                 cell = self.cells_all_rows[self.current_row][i]
                 cell.config(text=ch, bg=COLOR_TYPING)
 
-            self.current_col = 5
+            self.current_col = self.word_length
             self.on_enter()
 
             self.solver_index += 1
@@ -317,7 +602,7 @@ class WordleGUI:
 
         self.canvas = tk.Canvas(
             board_container,
-            width=500,
+            width=max(500, CELL_PX * self.word_length),
             height=420,
             bg=COLOR_BG,
             highlightthickness=0,
@@ -378,7 +663,7 @@ class WordleGUI:
         row_cells = []
         row_index = len(self.cells_all_rows)
 
-        for c in range(WORD_LENGTH):
+        for c in range(self.word_length):
             lbl = tk.Label(
                 self.inner_frame,
                 text="",
@@ -469,7 +754,7 @@ class WordleGUI:
     def on_key_press(self, ch):
         if self.game_over:
             return
-        if self.current_col >= WORD_LENGTH:
+        if self.current_col >= self.word_length:
             return
 
         cell = self.cells_all_rows[self.current_row][self.current_col]
@@ -498,12 +783,12 @@ class WordleGUI:
     def on_enter(self):
         if self.game_over:
             return
-        if self.current_col < WORD_LENGTH:
+        if self.current_col < self.word_length:
             return
 
         guess = "".join(
             self.cells_all_rows[self.current_row][i].cget("text")
-            for i in range(WORD_LENGTH)
+            for i in range(self.word_length)
         )
 
         if not is_valid_guess(guess, self.words):
@@ -511,6 +796,9 @@ class WordleGUI:
             return
 
         feedback = check_guess(self.secret, guess)
+        self.guess_history.append((guess, feedback))
+        self.constraints.add_feedback(guess, feedback)
+        self.update_candidates_label()
 
         # Animation + color update
         self.animate_row(self.current_row, guess, feedback)
@@ -518,7 +806,7 @@ class WordleGUI:
         if all(ch == "G" for ch in feedback):
             self.game_over = True
             messagebox.showinfo("You win!", f"Secret word: {self.secret}")
-            return
+            return feedback
 
         # Next row
         self.current_row += 1
@@ -528,6 +816,8 @@ class WordleGUI:
             self._create_row()
             self.canvas.yview_moveto(1.0)
 
+        return feedback
+
 
     # ======================================================
     # ANIMATION FLIP
@@ -536,7 +826,7 @@ class WordleGUI:
         cells = self.cells_all_rows[row_index]
 
         def flip_cell(i):
-            if i >= WORD_LENGTH:
+            if i >= len(cells):
                 return
 
             cell = cells[i]
@@ -563,6 +853,14 @@ class WordleGUI:
         flip_cell(0)
 
 
+    # ======================================================
+    # CANDIDATES COUNT
+    # ======================================================
+    def update_candidates_label(self):
+        n = self.letter_index.count(self.letter_index.mask(self.constraints))
+        self.candidates_label.config(text=f"Candidates: {n}")
+
+
     # ======================================================
     # KEYBOARD COLOR UPDATE
     # ======================================================
@@ -582,7 +880,9 @@ class WordleGUI:
 # ======================================================
 # RUN GUI
 # ======================================================
-def run_gui(words, graph):
+def run_gui(words, graph=None, feedback_matrix=None, opener_path=None, landmarks=None, path_cache=None,
+            lengths=None, load_length=None):
     root = tk.Tk()
-    WordleGUI(root, words, graph)
+    WordleGUI(root, words, graph, feedback_matrix, opener_path, landmarks, path_cache,
+              lengths, load_length)
     root.mainloop()
@@ -0,0 +1,151 @@
+# game/letter_index.py
+"""
+Index bitset (chữ, vị trí) và (chữ, số lần tối thiểu) trên toàn Lexicon.
+
+Mỗi bitset là 1 int Python, bit i bật <=> từ id i thỏa điều kiện, nên lọc
+theo ràng buộc chỉ là vài phép AND / AND NOT trên int (chạy trong C).
+
+    idx = LetterIndex(words)
+    c = Constraints.from_pattern("S?A?E", excludes="RT")
+    c.add_feedback("CRANE", check_guess(secret, "CRANE"))
+    idx.words(idx.mask(c))
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .logic import Lexicon
+
+
+class Constraints:
+    """
+    Ràng buộc tích lũy từ feedback G/Y/B hoặc pattern:
+    - greens[i] = chữ bắt buộc ở vị trí i
+    - not_at[i] = các chữ không được ở vị trí i
+    - min_count[ch] / max_count[ch] = số lần xuất hiện tối thiểu / tối đa
+    """
+
+    def __init__(self):
+        self.greens: Dict[int, str] = {}
+        self.not_at: Dict[int, Set[str]] = defaultdict(set)
+        self.min_count: Dict[str, int] = {}
+        self.max_count: Dict[str, int] = {}
+
+    @classmethod
+    def from_feedback(cls, history: Iterable[Tuple[str, Sequence[str]]]) -> "Constraints":
+        c = cls()
+        for guess, feedback in history:
+            c.add_feedback(guess, feedback)
+        return c
+
+    @classmethod
+    def from_pattern(cls, pattern: str, contains: str = "", excludes: str = "") -> "Constraints":
+        """
+        pattern kiểu "S?A?E": chữ cái = đúng vị trí, '?' / '_' / '.' = chữ bất kỳ.
+        contains: các chữ phải có (lặp chữ = cần ít nhất bấy nhiêu lần)
+        excludes: các chữ không được có.
+        """
+        c = cls()
+        for i, ch in enumerate(pattern.upper()):
+            if ch.isalpha():
+                c.greens[i] = ch
+        for ch, k in Counter(contains.upper()).items():
+            c.require(ch, k)
+        for ch in excludes.upper():
+            c.max_count[ch] = 0
+        return c
+
+    def require(self, ch: str, k: int) -> None:
+        self.min_count[ch] = max(self.min_count.get(ch, 0), k)
+
+    def add_feedback(self, guess: str, feedback: Sequence[str]) -> None:
+        """Thêm 1 lượt đoán, feedback như check_guess trả về."""
+        guess = guess.upper()
+        hits = Counter()
+        grays = set()
+        for i, (ch, f) in enumerate(zip(guess, feedback)):
+            if f == "G":
+                self.greens[i] = ch
+                hits[ch] += 1
+            else:
+                self.not_at[i].add(ch)
+                if f == "Y":
+                    hits[ch] += 1
+                else:
+                    grays.add(ch)
+
+        for ch, k in hits.items():
+            self.require(ch, k)
+        # có B cho ch -> secret có đúng hits[ch] chữ ch
+        for ch in grays:
+            k = hits.get(ch, 0)
+            self.max_count[ch] = min(self.max_count.get(ch, k), k)
+
+
+class LetterIndex:
+    def __init__(self, words: Lexicon):
+        self.lexicon = Lexicon(words)
+        n = len(self.lexicon)
+        self.n = n
+        self.all = (1 << n) - 1
+
+        pos_ids: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+        count_ids: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        for i, w in enumerate(self.lexicon):
+            for p, ch in enumerate(w):
+                pos_ids[(p, ch)].append(i)
+            for ch, k in Counter(w).items():
+                for m in range(1, k + 1):
+                    count_ids[(ch, m)].append(i)
+
+        self.pos = {key: self._bits(ids) for key, ids in pos_ids.items()}
+        self.at_least = {key: self._bits(ids) for key, ids in count_ids.items()}
+
+    def _bits(self, ids: List[int]) -> int:
+        buf = bytearray((self.n + 7) // 8)
+        for i in ids:
+            buf[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buf, "little")
+
+    # ---------------- truy vấn ----------------
+
+    def mask(self, c: Constraints) -> int:
+        pos, at_least = self.pos, self.at_least
+        m = self.all
+        for i, ch in c.greens.items():
+            m &= pos.get((i, ch), 0)
+        for i, chars in c.not_at.items():
+            for ch in chars:
+                m &= ~pos.get((i, ch), 0)
+        for ch, k in c.min_count.items():
+            if k > 0:
+                m &= at_least.get((ch, k), 0)
+        for ch, k in c.max_count.items():
+            m &= ~at_least.get((ch, k + 1), 0)
+        return m & self.all
+
+    def ids(self, mask: int) -> List[int]:
+        bits = bin(mask)[:1:-1]       # bit 0 trước
+        out = []
+        i = bits.find("1")
+        while i >= 0:
+            out.append(i)
+            i = bits.find("1", i + 1)
+        return out
+
+    def words(self, mask: int) -> List[str]:
+        w = self.lexicon
+        return [w[i] for i in self.ids(mask)]
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return bin(mask).count("1")
+
+    def query(self, pattern: Optional[str] = None, contains: str = "", excludes: str = "",
+              feedback: Iterable[Tuple[str, Sequence[str]]] = (), as_ids: bool = False) -> List:
+        """Các từ (hoặc id) khớp pattern / contains / excludes và mọi (guess, feedback) đã có."""
+        c = Constraints.from_pattern(pattern or "", contains, excludes)
+        for guess, fb in feedback:
+            c.add_feedback(guess, fb)
+        m = self.mask(c)
+        return self.ids(m) if as_ids else self.words(m)
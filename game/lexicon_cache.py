@@ -0,0 +1,151 @@
+# game/lexicon_cache.py
+"""
+Lexicon snapshot nhị phân cạnh dictionary text (data/words.txt -> data/words_lexicon.bin).
+
+Compile 1 lần đúng như load_words bản text: strip + upper, giữ từ isalpha(), bỏ trùng,
+giữ thứ tự trong file (id không đổi so với đọc text), chia theo độ dài; mỗi độ dài là
+1 khối cố định độ rộng (L ký tự / từ).
+Layout (little-endian):
+- header: magic, version, số section, sha256 của file text nguồn
+- bảng section: (độ dài L, byte / ký tự W, số từ n, offset khối) mỗi độ dài
+- mỗi section: khối n * L ký tự, W = 1 (latin-1, mọi từ A-Z), 2 (utf-16-le) hoặc
+  4 (utf-32-le) tuỳ ký tự lớn nhất, để ký tự thứ k luôn ở byte k * W
+
+Load = 1 lần read + so hash nguồn; text đổi (hash khác) thì tự compile lại.
+Mỗi section thành 1 PackedLexicon: id -> word cắt thẳng trên khối.
+
+    python -m game.lexicon_cache compile [--dict data/words.txt]
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+import tempfile
+from typing import Dict, Optional
+
+from .logic import PackedLexicon
+
+MAGIC = b"WLLX"
+FORMAT_VERSION = 2
+# magic, version, số section, sha256 file nguồn
+_HEADER = struct.Struct("<4sHH32s")
+# độ dài từ, byte / ký tự, số từ, offset khối (tính từ đầu file)
+_SECTION = struct.Struct("<HHII")
+# byte / ký tự -> encoding cố định độ rộng
+_ENCODINGS = {1: "latin-1", 2: "utf-16-le", 4: "utf-32-le"}
+
+
+def lexicon_cache_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_lexicon.bin"
+
+
+def compile_sections(text: str) -> Dict[int, str]:
+    """Text dictionary -> {độ dài: khối từ đã chuẩn hoá, bỏ trùng, theo thứ tự file, nối liền}."""
+    by_length: Dict[int, dict] = {}
+    for line in text.splitlines():
+        w = line.strip().upper()
+        if w.isalpha():
+            by_length.setdefault(len(w), {})[w] = None
+    return {n: "".join(ws) for n, ws in sorted(by_length.items())}
+
+
+def _char_width(block: str) -> int:
+    top = max(map(ord, block), default=0)
+    return 1 if top < 0x100 else 2 if top < 0x10000 else 4
+
+
+def save_snapshot(path: str, sections: Dict[int, str], source_key: bytes) -> None:
+    """Ghi snapshot atomically: ghi ra file tạm cùng thư mục rồi os.replace."""
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    payload = []
+    for length, block in sections.items():
+        width = _char_width(block)
+        table.append(_SECTION.pack(length, width, len(block) // length, offset))
+        payload.append(block.encode(_ENCODINGS[width]))
+        offset += len(payload[-1])
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), source_key))
+            f.write(b"".join(table))
+            for part in payload:
+                f.write(part)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_snapshot(path: str, source_key: bytes) -> Optional[Dict[int, PackedLexicon]]:
+    """{độ dài: PackedLexicon} nếu snapshot hợp lệ và khớp source_key, ngược lại None."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, n_sections, key = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION or key != source_key:
+        return None
+
+    sections = {}
+    end = _HEADER.size + _SECTION.size * n_sections
+    for k in range(n_sections):
+        length, width, n, offset = _SECTION.unpack_from(data, _HEADER.size + k * _SECTION.size)
+        block_end = offset + n * length * width
+        if length == 0 or width not in _ENCODINGS or offset < end or block_end > len(data):
+            return None
+        try:
+            block = data[offset:block_end].decode(_ENCODINGS[width])
+        except UnicodeDecodeError:
+            return None
+        sections[length] = PackedLexicon(block, length)
+    return sections
+
+
+def load_or_compile_lexicon(dict_path: str, log=print) -> Dict[int, PackedLexicon]:
+    """
+    Dùng snapshot nếu hash file text khớp, ngược lại compile lại và ghi đè.
+    Không ghi được snapshot (thư mục read-only) thì vẫn trả về bản vừa compile.
+    """
+    with open(dict_path, "rb") as f:
+        raw = f.read()
+    key = hashlib.sha256(raw).digest()
+    path = lexicon_cache_path(dict_path)
+
+    sections = load_snapshot(path, key)
+    if sections is not None:
+        return sections
+
+    log("Compiling lexicon snapshot (missing or stale)...")
+    blocks = compile_sections(raw.decode("utf-8"))
+    try:
+        save_snapshot(path, blocks, key)
+    except OSError as e:
+        log(f"Could not write lexicon snapshot: {e}")
+    return {n: PackedLexicon(block, n) for n, block in blocks.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["compile"])
+    parser.add_argument("--dict", default="data/words.txt")
+    args = parser.parse_args()
+
+    with open(args.dict, "rb") as f:
+        raw = f.read()
+    blocks = compile_sections(raw.decode("utf-8"))
+    path = lexicon_cache_path(args.dict)
+    save_snapshot(path, blocks, hashlib.sha256(raw).digest())
+    summary = ", ".join(f"{n}: {len(b) // n}" for n, b in blocks.items())
+    print(f"Saved to {path} ({summary})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,197 @@
 # game/logic.py
 
+import os
 import random
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
+WORD_LENGTH = 5      # độ dài mặc định (dictionary gốc chỉ có từ 5 chữ)
 
-def load_words(path: str) -> List[str]:
-    """Load 5-letter words from file, uppercase hết cho đồng nhất."""
-    words = []
+
+class Lexicon(tuple):
+    """
+    Dictionary bất biến: giữ thứ tự xuất hiện trong file, bỏ từ trùng.
+    Là tuple nên index/iterate nhanh như list, thêm:
+    - `word in lexicon` O(1) (hash) thay vì quét cả list
+    - id_of(word) / word_of(id): mapping word <-> id dùng chung với WordGraph
+    """
+
+    def __new__(cls, words: Iterable[str] = ()):
+        if isinstance(words, (Lexicon, PackedLexicon)):
+            return words
+        index = {}
+        for w in words:
+            if w not in index:
+                index[w] = len(index)
+        self = super().__new__(cls, index)
+        self._index = index
+        return self
+
+    def __contains__(self, word) -> bool:
+        return word in self._index
+
+    def index(self, word, *args) -> int:
+        try:
+            return self._index[word]
+        except (KeyError, TypeError):
+            raise ValueError(f"{word!r} is not in lexicon") from None
+
+    def id_of(self, word: str) -> int:
+        """KeyError nếu word không có trong lexicon."""
+        return self._index[word]
+
+    def word_of(self, i: int) -> str:
+        return self[i]
+
+    def get_id(self, word: str, default=None):
+        return self._index.get(word, default)
+
+    def hash_index(self) -> Dict[str, int]:
+        """dict word -> id (cho vòng lặp tra rất nhiều lần, vd ImplicitWordGraph)."""
+        return self._index
+
+    def as_tuple(self) -> tuple:
+        """Đã là tuple, cùng interface với PackedLexicon.as_tuple."""
+        return self
+
+
+class PackedLexicon:
+    """
+    Lexicon trên 1 buffer cố định độ rộng: n từ cùng `length` chữ, theo thứ tự trong file
+    dictionary, nằm liền nhau trong 1 str (1 section của lexicon snapshot, xem lexicon_cache).
+    id i = text[i * length:(i + 1) * length], không phải dựng gì lúc load.
+    word -> id (membership, get_id, id_of) qua dict dựng ở lần tra đầu tiên, sau đó O(1)
+    như Lexicon; as_tuple() cho vòng lặp nóng của solver (tuple index nhanh hơn slice).
+    Cùng interface với Lexicon.
+    """
+
+    __slots__ = ("length", "n", "_text", "_index", "_names")
+
+    def __init__(self, text: str, length: int):
+        self.length = length
+        self.n = len(text) // length if length else 0
+        self._text = text
+        self._index: Optional[Dict[str, int]] = None
+        self._names: Optional[tuple] = None
+
+    def __reduce__(self):
+        return PackedLexicon, (self._text, self.length)
+
+    def __repr__(self) -> str:
+        return f"PackedLexicon({self.n} words x {self.length})"
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedLexicon):
+            return self.length == other.length and self._text == other._text
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._text, self.length))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n))]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("lexicon index out of range")
+        L = self.length
+        return self._text[i * L:(i + 1) * L]
+
+    def __iter__(self):
+        text, L = self._text, self.length
+        return (text[a:a + L] for a in range(0, len(text), L))
+
+    def as_tuple(self) -> tuple:
+        """Mọi từ theo id, dựng 1 lần."""
+        if self._names is None:
+            self._names = tuple(self)
+        return self._names
+
+    def hash_index(self) -> Dict[str, int]:
+        """dict word -> id, dựng ở lần tra đầu tiên."""
+        if self._index is None:
+            names = self.as_tuple()
+            self._index = dict(zip(names, range(len(names))))
+        return self._index
+
+    def __contains__(self, word) -> bool:
+        return word in self.hash_index()
+
+    def get_id(self, word: str, default=None):
+        return self.hash_index().get(word, default)
+
+    def id_of(self, word: str) -> int:
+        """KeyError nếu word không có trong lexicon."""
+        return self.hash_index()[word]
+
+    def index(self, word, *args) -> int:
+        try:
+            return self.hash_index()[word]
+        except (KeyError, TypeError):
+            raise ValueError(f"{word!r} is not in lexicon") from None
+
+    def word_of(self, i: int) -> str:
+        return self[i]
+
+
+def _read_words(path: str) -> Iterable[str]:
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             w = line.strip().upper()
-            if len(w) == 5 and w.isalpha():
-                words.append(w)
-    return words
+            if w.isalpha():
+                yield w
+
+
+def load_words(path: str, length: Optional[int] = WORD_LENGTH):
+    """
+    Từ `length` chữ của dictionary, uppercase, bỏ trùng, giữ thứ tự trong file.
+    Qua lexicon snapshot (game/lexicon_cache) nên trả về PackedLexicon;
+    length=None (mọi độ dài, thứ tự file) thì đọc thẳng text ra Lexicon.
+    """
+    if length is None:
+        return Lexicon(_read_words(path))
+    from .lexicon_cache import load_or_compile_lexicon
+    return load_or_compile_lexicon(path).get(length, Lexicon())
+
+
+def length_dict_path(dict_path: str, length: int) -> str:
+    """
+    Đường dẫn "ảo" đặt tên cache (graph, landmarks, ...) cho từ `length` chữ:
+    5 chữ giữ tên cũ (data/words.txt), độ dài khác -> data/words_len6.txt.
+    """
+    if length == WORD_LENGTH:
+        return dict_path
+    stem, ext = os.path.splitext(dict_path)
+    return f"{stem}_len{length}{ext}"
+
+
+class LengthLexicons:
+    """
+    Dictionary trộn nhiều độ dài: lexicon snapshot đã chia sẵn mỗi độ dài 1 section
+    (PackedLexicon), nên lấy 1 độ dài không tốn gì cho các độ dài khác.
+    """
+
+    def __init__(self, path: str):
+        from .lexicon_cache import load_or_compile_lexicon
+        self.path = path
+        self._sections = load_or_compile_lexicon(path)
+
+    @property
+    def lengths(self) -> List[int]:
+        return sorted(self._sections)
+
+    def __contains__(self, length) -> bool:
+        return length in self._sections
+
+    def get(self, length: int):
+        """PackedLexicon các từ `length` chữ (Lexicon rỗng nếu dictionary không có độ dài này)."""
+        return self._sections.get(length, Lexicon())
+
+    def cache_path(self, length: int) -> str:
+        return length_dict_path(self.path, length)
 
 
 def choose_secret(words: List[str]) -> str:
@@ -22,7 +201,7 @@ def choose_secret(words: List[str]) -> str:
 
 def check_guess(secret: str, guess: str) -> List[str]:
     """
-    Compare guess với secret, trả về list 5 ký tự:
+    Compare guess với secret (cùng độ dài), trả về list mỗi chữ 1 ký tự:
     - 'G' = Green (đúng chữ, đúng vị trí)
     - 'Y' = Yellow (đúng chữ, sai vị trí)
     - 'B' = Gray (không nằm trong từ)
@@ -30,20 +209,21 @@ def check_guess(secret: str, guess: str) -> List[str]:
     secret = secret.upper()
     guess = guess.upper()
 
-    if len(secret) != 5 or len(guess) != 5:
-        raise ValueError("secret and guess must both be 5 letters")
+    n = len(secret)
+    if n == 0 or len(guess) != n:
+        raise ValueError("secret and guess must have the same non-zero length")
 
-    result = ["B"] * 5
+    result = ["B"] * n
     secret_chars = list(secret)
 
    
-    for i in range(5):
+    for i in range(n):
         if guess[i] == secret[i]:
             result[i] = "G"
             secret_chars[i] = None  
 
   
-    for i in range(5):
+    for i in range(n):
         if result[i] == "G":
             continue
         if guess[i] in secret_chars:
@@ -54,16 +234,20 @@ def check_guess(secret: str, guess: str) -> List[str]:
     return result
 
 
-def is_valid_guess(guess: str, dictionary: List[str]) -> bool:
-    """Check guess hợp lệ: 5 chữ cái, có trong dictionary."""
+def is_valid_guess(guess: str, dictionary: Lexicon) -> bool:
+    """Check guess hợp lệ: đúng độ dài từ của dictionary, có trong dictionary (Lexicon -> O(1))."""
     guess = guess.strip().upper()
-    return len(guess) == 5 and guess.isalpha() and guess in dictionary
+    return guess.isalpha() and guess in dictionary
 
 
-def play_console(secret: str, dictionary: List[str]) -> None:
+def play_console(secret: str, dictionary: Lexicon) -> None:
     """Version console đơn giản để test logic trước."""
+    from .letter_index import Constraints, LetterIndex
+
     MAX_ATTEMPTS = 6
     attempt = 0
+    index = LetterIndex(dictionary)
+    constraints = Constraints()
 
     print("Welcome to Wordle (console version)!")
   
@@ -73,11 +257,13 @@ def play_console(secret: str, dictionary: List[str]) -> None:
         guess = input(f"Guess #{attempt + 1}: ").strip().upper()
 
         if not is_valid_guess(guess, dictionary):
-            print("Invalid guess. Must be a valid 5-letter word in the dictionary.")
+            print(f"Invalid guess. Must be a valid {len(secret)}-letter word in the dictionary.")
             continue
 
         feedback = check_guess(secret, guess)
         print("Feedback:", " ".join(feedback))
+        constraints.add_feedback(guess, feedback)
+        print("Candidates left:", index.count(index.mask(constraints)))
 
         if all(ch == "G" for ch in feedback):
             print("You got it! 🎉")
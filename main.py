@@ -1,4 +1,11 @@
+import argparse
+
 from game.app import run_app
 
 if __name__ == "__main__":
-    run_app("GUI")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("length", type=int, nargs="?", default=5, help="độ dài từ, mặc định 5")
+    parser.add_argument("--implicit", action="store_true",
+                        help="sinh hàng xóm lúc cần thay vì load / build graph file")
+    args = parser.parse_args()
+    run_app("GUI", args.length, args.implicit)
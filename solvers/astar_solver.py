@@ -1,16 +1,38 @@
-from heapq import heappush, heappop
-from typing import List, Dict, Optional
+from typing import List, Optional
+
+from .graph import as_word_graph
+from .search_core import PRIORITY, search
 
 def heuristic(word: str, goal: str) -> int:
     """Số ký tự khác nhau giữa word và goal (Hamming distance)."""
     return sum(c1 != c2 for c1, c2 in zip(word, goal))
 
 
-def astar_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[str]]:
+def id_heuristic(graph, goal_id: int, landmarks=None):
+    """
+    h(v) trên id: Hamming distance, hoặc max(Hamming, cận landmark ALT)
+    nếu có bảng landmark (xem landmarks.py). Cả 2 đều admissible nên max cũng vậy.
+    """
+    names = graph.names
+    goal = names[goal_id]
+    if landmarks is None:
+        return lambda v: heuristic(names[v], goal)
+    alt = landmarks.heuristic_to(goal_id)
+
+    def h(v: int) -> int:
+        a = alt(v)
+        b = heuristic(names[v], goal)
+        return a if a > b else b
+
+    return h
+
+
+def astar_solve(start: str, goal: str, words: List[str], graph, landmarks=None) -> Optional[List[str]]:
     """
     Tìm đường đi ngắn nhất từ start -> goal bằng A* search.
     f = g + h
     Mỗi bước cost = 1.
+    landmarks: bảng Landmarks -> h = max(ALT, Hamming), None -> Hamming.
     """
     start = start.upper()
     goal = goal.upper()
@@ -18,32 +40,7 @@ def astar_solve(start: str, goal: str, words: List[str], graph) -> Optional[List
     if start not in words or goal not in words:
         raise ValueError("start và goal phải nằm trong dictionary")
 
-    # priority queue item: (f, g, node)
-    pq = []
-    h0 = heuristic(start, goal)
-    heappush(pq, (h0, 0, start))
-
-    parent: Dict[str, Optional[str]] = {start: None}
-    g_cost: Dict[str, float] = {start: 0}
-
-    while pq:
-        f, g, u = heappop(pq)
-
-        if u == goal:
-            path = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            return path[::-1]
-
-        for v in graph[u]:
-            new_g = g + 1
-            if v not in g_cost or new_g < g_cost[v]:
-                g_cost[v] = new_g
-                parent[v] = u
-
-                f_new = new_g + heuristic(v, goal)
-                heappush(pq, (f_new, new_g, v))
-
-    return None
+    gr = as_word_graph(graph)
+    t = gr.id_of(goal)
+    path = search(gr, gr.id_of(start), t, PRIORITY, h=id_heuristic(gr, t, landmarks))
+    return gr.to_words(path) if path is not None else None
@@ -0,0 +1,178 @@
+# solvers/batch_query.py
+"""
+Trả lời nhiều cặp (start, goal) 1 lượt.
+
+Cặp được gom theo start (hoặc theo goal, phía nào ít từ khác nhau hơn); mỗi nhóm chỉ
+chạy 1 lần search nhiều đích từ từ chung đó, dừng khi mọi đích trong nhóm đã chốt.
+Nhóm theo goal thì search ngược (BFS: graph vô hướng; UCS: graph.in_edges), parent
+trỏ về phía goal nên path đọc xuôi từ start luôn.
+Nhóm được chia cho process pool; worker mmap lại graph cache thay vì unpickle graph.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .graph import WordGraph, as_word_graph
+
+KINDS = ("bfs", "ucs")
+
+
+# ======================= SEARCH NHIỀU ĐÍCH =======================
+
+def _multi_target_bfs(graph: WordGraph, src: int, targets: set):
+    """BFS từ src, dừng khi mọi target đã được thăm (parent gán lúc thăm = path ngắn nhất)."""
+    adj = graph.adj
+    parent = graph.new_parent_array()
+    parent[src] = src
+    remaining = len(targets - {src})
+    queue = deque([src])
+    while queue and remaining:
+        u = queue.popleft()
+        for v in adj(u):
+            if parent[v] < 0:
+                parent[v] = u
+                if v in targets:
+                    remaining -= 1
+                queue.append(v)
+    return parent
+
+
+def _multi_target_dijkstra(graph: WordGraph, src: int, targets: set, reverse: bool):
+    """
+    Dijkstra theo cost UCS từ src, dừng khi mọi target đã pop (đã chốt cost).
+    reverse=True: đi ngược cạnh (dist[v] = cost v -> src), dùng khi nhóm theo goal.
+    """
+    edges = graph.in_edges if reverse else graph.edges
+    parent = graph.new_parent_array()
+    parent[src] = src
+    dist = array("d", [float("inf")]) * graph.n
+    dist[src] = 0
+    remaining = len(targets)
+    pq = [(0, src)]
+    while pq and remaining:
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue      # entry cũ
+        if u in targets:
+            remaining -= 1
+        for v, w in edges(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heappush(pq, (nd, v))
+    return parent
+
+
+def _chain(parent, v: int) -> List[int]:
+    ids = [v]
+    while parent[ids[-1]] != ids[-1]:
+        ids.append(parent[ids[-1]])
+    return ids
+
+
+def _solve_group(graph: WordGraph, kind: str, root: int, others: List[Tuple[int, int]],
+                 by_target: bool) -> List[Tuple[int, Optional[List[int]]]]:
+    """
+    others = [(vị trí trong input, id phía kia)]. root là start (by_target=False)
+    hoặc goal (by_target=True). Trả về [(vị trí, path id start -> goal hoặc None)].
+    """
+    reachable = {o for _, o in others if graph.connected(root, o)}
+    parent = None
+    if reachable:
+        if kind == "bfs":
+            parent = _multi_target_bfs(graph, root, reachable)
+        else:
+            parent = _multi_target_dijkstra(graph, root, reachable, reverse=by_target)
+
+    out = []
+    for idx, o in others:
+        if o not in reachable:
+            out.append((idx, None))
+            continue
+        ids = _chain(parent, o)          # o -> ... -> root
+        if not by_target:
+            ids.reverse()                # root là start
+        out.append((idx, ids))
+    return out
+
+
+# ======================= CHIA PROCESS =======================
+
+_w_graph: Optional[WordGraph] = None
+# cache bị xoá / thay giữa chừng: báo ở task đầu tiên (process cha nhận đúng lỗi này)
+_w_error: Optional[RuntimeError] = None
+
+
+def _init_worker(cache_path: Optional[str], cache_key: Optional[str], graph: Optional[WordGraph]):
+    global _w_graph, _w_error
+    if graph is None:
+        from .graph_cache import attach_graph
+        try:
+            graph = attach_graph(cache_path, bytes.fromhex(cache_key))
+        except RuntimeError as e:
+            _w_error = e
+    _w_graph = graph
+
+
+def _group_task(task):
+    if _w_error is not None:
+        raise _w_error
+    kind, root, others, by_target = task
+    return _solve_group(_w_graph, kind, root, others, by_target)
+
+
+def batch_search(graph: WordGraph, pairs: Sequence[Tuple[int, int]], kind: str = "bfs",
+                 workers: Optional[int] = 1, chunksize: int = 8) -> List[Optional[List[int]]]:
+    """
+    pairs = [(start id, goal id)], trả về path id (hoặc None) theo đúng thứ tự input.
+    kind: "bfs" (path ngắn nhất) hoặc "ucs" (cost nhỏ nhất như ucs_solve).
+    workers > 1 (None = số CPU): chia nhóm cho process pool.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind phải là 1 trong {KINDS}")
+
+    by_target = len({t for _, t in pairs}) < len({s for s, _ in pairs})
+    groups: Dict[int, List[Tuple[int, int]]] = {}
+    for idx, (s, t) in enumerate(pairs):
+        root, other = (t, s) if by_target else (s, t)
+        groups.setdefault(root, []).append((idx, other))
+    # nhóm lớn trước để các worker xong gần cùng lúc
+    tasks = [(kind, root, others, by_target)
+             for root, others in sorted(groups.items(), key=lambda kv: -len(kv[1]))]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        results = (_solve_group(graph, *task) for task in tasks)
+    else:
+        attach = graph.cache_path is not None and graph.cache_key is not None
+        initargs = (graph.cache_path, graph.cache_key, None if attach else graph)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+            results = list(pool.map(_group_task, tasks, chunksize=chunksize))
+
+    paths: List[Optional[List[int]]] = [None] * len(pairs)
+    for group in results:
+        for idx, ids in group:
+            paths[idx] = ids
+    return paths
+
+
+def batch_solve(pairs: Sequence[Tuple[str, str]], words: List[str], graph, kind: str = "bfs",
+                workers: Optional[int] = 1) -> List[Optional[List[str]]]:
+    """
+    Như gọi bfs_solve (kind="bfs") / ucs_solve (kind="ucs") cho từng cặp, nhưng cặp
+    chung start hoặc chung goal chỉ search 1 lần. Trả về list path theo thứ tự pairs.
+    """
+    g = as_word_graph(graph)
+    id_pairs = []
+    for start, goal in pairs:
+        start, goal = start.upper(), goal.upper()
+        if start not in words or goal not in words:
+            raise ValueError("start và goal phải nằm trong dictionary")
+        id_pairs.append((g.id_of(start), g.id_of(goal)))
+    return [g.to_words(p) if p is not None else None
+            for p in batch_search(g, id_pairs, kind, workers)]
@@ -1,8 +1,11 @@
 # solvers/bfs_solver.py
 
-from collections import deque
 from typing import List, Dict, Optional
 
+from .graph import as_word_graph
+from .graph_builder import build_graph_buckets
+from .search_core import FIFO, search
+
 
 def differ_by_one_letter(a: str, b: str) -> bool:
     """True nếu 2 từ khác đúng 1 ký tự."""
@@ -17,10 +20,18 @@ def differ_by_one_letter(a: str, b: str) -> bool:
     return diff == 1
 
 
-def build_graph(words: List[str]) -> Dict[str, List[str]]:
+def build_graph(words: List[str], workers: Optional[int] = 1) -> Dict[str, List[str]]:
     """
     Xây đồ thị word-ladder: mỗi từ nối với các từ khác khác đúng 1 ký tự.
     Đồ thị này dùng chung cho BFS/DFS/UCS/A*.
+    Dùng bucket wildcard (xem graph_builder), workers > 1 để chia process.
+    """
+    return build_graph_buckets(words, workers)
+
+
+def build_graph_pairwise(words: List[str]) -> Dict[str, List[str]]:
+    """
+    Bản cũ so từng cặp O(n²), giữ lại làm chuẩn để benchmark/đối chiếu.
     """
     graph: Dict[str, List[str]] = {w: [] for w in words}
     n = len(words)
@@ -43,27 +54,6 @@ def bfs_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[s
     if start not in words or goal not in words:
         raise ValueError("start và goal phải nằm trong dictionary")
 
-
-    queue = deque([start])
-    parent: Dict[str, Optional[str]] = {start: None}
-    visited = {start}
-
-    while queue:
-        u = queue.popleft()
-        if u == goal:
-            # reconstruct path
-            path = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            path.reverse()
-            return path
-
-        for v in graph[u]:
-            if v not in visited:
-                visited.add(v)
-                parent[v] = u
-                queue.append(v)
-
-    return None
+    g = as_word_graph(graph)
+    path = search(g, g.id_of(start), g.id_of(goal), FIFO)
+    return g.to_words(path) if path is not None else None
@@ -0,0 +1,98 @@
+# solvers/bidir_bfs_solver.py
+
+from typing import List, Optional, Tuple
+
+from .graph import WordGraph, as_word_graph
+
+
+def bidir_bfs_search(graph: WordGraph, s: int, t: int) -> Tuple[Optional[List[int]], int, int]:
+    """
+    BFS 2 chiều trên id: mỗi vòng mở rộng trọn 1 tầng của phía có frontier nhỏ hơn,
+    dừng ở tầng đầu tiên 2 phía gặp nhau (lấy điểm gặp cho tổng độ dài nhỏ nhất
+    trong tầng đó nên path vẫn ngắn nhất).
+    Trả về (path id, số node expanded, peak frontier + visited).
+    """
+    if s == t:
+        return [s], 1, 1
+    if not graph.connected(s, t):
+        return None, 0, 0
+
+    adj = graph.adj
+    parent_f = graph.new_parent_array()
+    parent_b = graph.new_parent_array()
+    parent_f[s] = s
+    parent_b[t] = t
+    dist_f = graph.new_parent_array()    # -1 = chưa thăm
+    dist_b = graph.new_parent_array()
+    dist_f[s] = 0
+    dist_b[t] = 0
+    visited = 2
+    frontier_f = [s]
+    frontier_b = [t]
+
+    expanded = 0
+    peak_mem = 2
+
+    while frontier_f and frontier_b:
+        forward = len(frontier_f) <= len(frontier_b)
+        if forward:
+            frontier, parent, dist, other_dist = frontier_f, parent_f, dist_f, dist_b
+        else:
+            frontier, parent, dist, other_dist = frontier_b, parent_b, dist_b, dist_f
+
+        best = None       # (tổng độ dài, node phía này, node phía kia)
+        next_frontier = []
+        for u in frontier:
+            expanded += 1
+            du = dist[u] + 1
+            for v in adj(u):
+                if other_dist[v] >= 0:
+                    total = du + other_dist[v]
+                    if best is None or total < best[0]:
+                        best = (total, u, v)
+                if parent[v] < 0:
+                    parent[v] = u
+                    dist[v] = du
+                    visited += 1
+                    next_frontier.append(v)
+
+        if forward:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+        peak_mem = max(peak_mem, len(frontier_f) + len(frontier_b) + visited)
+
+        if best is not None:
+            _, u, v = best
+            if not forward:
+                u, v = v, u      # u luôn thuộc phía start, v phía goal
+            return _join(parent_f, parent_b, u, v), expanded, peak_mem
+
+    return None, expanded, peak_mem
+
+
+def _join(parent_f, parent_b, u: int, v: int) -> List[int]:
+    """Ghép start..u (theo parent_f) với v..goal (theo parent_b)."""
+    left = [u]
+    while parent_f[left[-1]] != left[-1]:
+        left.append(parent_f[left[-1]])
+    left.reverse()
+    right = [v]
+    while parent_b[right[-1]] != right[-1]:
+        right.append(parent_b[right[-1]])
+    return left + right
+
+
+def bidir_bfs_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[str]]:
+    """
+    Tìm đường đi ngắn nhất start -> goal bằng BFS 2 chiều.
+    Cùng độ dài path với bfs_solve nhưng expand ít node hơn nhiều trên ladder dài.
+    """
+    start = start.upper()
+    goal = goal.upper()
+    if start not in words or goal not in words:
+        raise ValueError("start và goal phải nằm trong dictionary")
+
+    g = as_word_graph(graph)
+    path, _, _ = bidir_bfs_search(g, g.id_of(start), g.id_of(goal))
+    return g.to_words(path) if path is not None else None
@@ -0,0 +1,89 @@
+# solvers/bidir_dijkstra_solver.py
+
+from array import array
+from heapq import heappop, heappush
+from typing import List, Optional, Tuple
+
+from .bidir_bfs_solver import _join
+from .graph import WordGraph, as_word_graph
+
+
+def bidir_dijkstra_search(graph: WordGraph, s: int, t: int) -> Tuple[Optional[List[int]], Optional[float], int, int]:
+    """
+    Dijkstra 2 chiều theo cost cạnh của UCS (graph.weights / graph.rweights):
+    - phía start relax u -> v với cost(u -> v) (chữ của v)
+    - phía goal relax ngược v -> u với cost(v -> u) (chữ của u, chữ được đổi thành)
+    Mỗi bước pop phía có đỉnh heap nhỏ hơn; mu = cost nhỏ nhất của path đã ghép được
+    qua 1 cạnh nối 2 phía. Dừng khi top_f + top_b >= mu: mọi path chưa thấy đều đắt hơn.
+    Trả về (path id, cost, số node expanded, peak heap + visited).
+    """
+    if s == t:
+        return [s], 0, 1, 1
+    if not graph.connected(s, t):
+        return None, None, 0, 0
+
+    inf = float("inf")
+    parent_f = graph.new_parent_array()
+    parent_b = graph.new_parent_array()
+    parent_f[s] = s
+    parent_b[t] = t
+    dist_f = array("d", [inf]) * graph.n
+    dist_b = array("d", [inf]) * graph.n
+    dist_f[s] = 0
+    dist_b[t] = 0
+    pq_f = [(0, s)]
+    pq_b = [(0, t)]
+    visited = 2
+
+    mu = inf
+    meet = None          # (node phía start, node phía goal)
+    expanded = 0
+    peak_mem = 2
+
+    while pq_f and pq_b:
+        if pq_f[0][0] + pq_b[0][0] >= mu:
+            break
+
+        forward = pq_f[0][0] <= pq_b[0][0]
+        if forward:
+            pq, dist, other_dist, parent, edges = pq_f, dist_f, dist_b, parent_f, graph.edges
+        else:
+            pq, dist, other_dist, parent, edges = pq_b, dist_b, dist_f, parent_b, graph.in_edges
+
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue      # entry cũ
+        expanded += 1
+
+        for v, w in edges(u):
+            nd = d + w
+            if nd < dist[v]:
+                if parent[v] < 0:
+                    visited += 1
+                dist[v] = nd
+                parent[v] = u
+                heappush(pq, (nd, v))
+            if other_dist[v] < inf and nd + other_dist[v] < mu:
+                mu = nd + other_dist[v]
+                meet = (u, v) if forward else (v, u)
+
+        peak_mem = max(peak_mem, len(pq_f) + len(pq_b) + visited)
+
+    if meet is None:
+        return None, None, expanded, peak_mem
+    return _join(parent_f, parent_b, *meet), mu, expanded, peak_mem
+
+
+def bidir_dijkstra_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[str]]:
+    """
+    Tìm đường đi chi phí thấp nhất start -> goal bằng Dijkstra 2 chiều.
+    Cùng cost tối thiểu với ucs_solve (path có thể khác nếu có nhiều path cùng cost).
+    """
+    start = start.upper()
+    goal = goal.upper()
+    if start not in words or goal not in words:
+        raise ValueError("start và goal phải nằm trong dictionary")
+
+    g = as_word_graph(graph)
+    path, _, _, _ = bidir_dijkstra_search(g, g.id_of(start), g.id_of(goal))
+    return g.to_words(path) if path is not None else None
@@ -1,62 +1,59 @@
 # solvers/ids_solver.py
 
-from typing import Dict, List, Optional
+from typing import Callable, List, Optional, Tuple
 
+from .graph import WordGraph, as_word_graph
+from .search_core import LIFO, SearchStats, search
 
-def ids_solve(start: str, goal: str, words: List[str], graph: Dict[str, List[str]], stop_flag=lambda: False, max_depth: int = 50):
+
+def ids_search(graph: WordGraph, s: int, t: int, max_depth: int = 50,
+               stop_flag: Callable[[], bool] = lambda: False,
+               progress: Optional[Callable[[int, int], None]] = None,
+               max_expanded: Optional[int] = None) -> Tuple[Optional[List[int]], int, int]:
     """
-    Iterative Deepening Search (IDS) trên graph Word Ladder.
-    Trả về đường đi [start, ..., goal] hoặc None.
-    """ 
-    start = start.upper()
-    goal = goal.upper()
-    if start not in words or goal not in words:
-        raise ValueError("start và goal phải nằm trong dictionary")
+    IDS không đệ quy: mỗi vòng là 1 lần search LIFO của search_core (stack tường minh,
+    transposition table theo độ sâu nông nhất), depth limit tăng dần.
+    Vòng nào không bị cắt ở depth limit nghĩa là đã duyệt hết component -> dừng.
+    - progress(depth_limit, expanded) được gọi đầu mỗi vòng
+    - max_expanded: dừng (trả None) khi vượt số node expand
+    Trả về (path id, tổng expanded, peak số entry trong table + stack).
+    """
+    if not graph.connected(s, t):
+        return None, 0, 0
 
-    for depth_limit in range(1, max_depth + 1):
-        if stop_flag():    
-            return None
-    
-        print(f"[IDS] thử depth = {depth_limit}")
+    total = SearchStats()
+    # path đơn không dài quá số node trong component
+    max_depth = min(max_depth, max(1, graph.component_size(s) - 1))
 
-        visited = set()          # mỗi vòng IDS là visited mới
-        path = []
+    for depth_limit in range(1, max_depth + 1):
+        if stop_flag():
+            break
+        if progress is not None:
+            progress(depth_limit, total.expanded)
 
-        if dfs_limited(start, goal, graph, depth_limit, visited, path, stop_flag):
-            return path
+        budget = None if max_expanded is None else max(1, max_expanded - total.expanded)
+        path = search(graph, s, t, LIFO, depth_limit=depth_limit, stop_flag=stop_flag,
+                      max_expanded=budget, stats=total)
+        if path is not None:
+            return path, total.expanded, total.peak_mem
+        if total.stopped or not total.cutoff:
+            break       # bị dừng, hoặc vòng này không bị cắt: đã duyệt hết component
 
-    return None
+    return None, total.expanded, total.peak_mem
 
 
-def dfs_limited(u, goal, graph, depth_left, visited, path, stop_flag):
+def ids_solve(start: str, goal: str, words: List[str], graph, stop_flag=lambda: False, max_depth: int = 50,
+              progress: Optional[Callable[[int, int], None]] = None):
     """
-    DFS với giới hạn độ sâu.
-    - u: node hiện tại
-    - goal: node đích
-    - graph: đồ thị word-ladder
-    - depth_left: số bước còn lại
-    - visited: tập đã thăm trong lần chạy depth hiện tại
-    - path: dùng để xây dựng đường đi
+    Iterative Deepening Search (IDS) trên graph Word Ladder.
+    Trả về đường đi [start, ..., goal] hoặc None.
+    progress(depth_limit, expanded): callback báo tiến độ mỗi vòng (thay cho print).
     """
-    if stop_flag():
-        return False
-    
-    visited.add(u)
-    path.append(u)
-
-    if u == goal:
-        return True
-
-    if depth_left <= 0:
-        path.pop()
-        visited.remove(u)
-        return False
-
-    for v in graph[u]:
-        if v not in visited:
-            if dfs_limited(v, goal, graph, depth_left - 1, visited, path, stop_flag):
-                return True
-
-    path.pop()
-    visited.remove(u)
-    return False
+    start = start.upper()
+    goal = goal.upper()
+    if start not in words or goal not in words:
+        raise ValueError("start và goal phải nằm trong dictionary")
+
+    g = as_word_graph(graph)
+    path, _, _ = ids_search(g, g.id_of(start), g.id_of(goal), max_depth, stop_flag, progress)
+    return g.to_words(path) if path is not None else None
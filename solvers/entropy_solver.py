@@ -0,0 +1,222 @@
+# solvers/entropy_solver.py
+
+import math
+import os
+import random
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import List, Optional, Sequence, Tuple
+
+from game.feedback import FeedbackMatrix, dictionary_key, encode, score_batch
+from game.logic import Lexicon, check_guess
+
+# trên số cặp (guess x candidate) này mới chia ra nhiều process
+PARALLEL_MIN_PAIRS = 2_000_000
+# không có ma trận feedback: giới hạn số guess / secret dùng để ước lượng
+NO_MATRIX_POOL = 300
+
+
+def opener_cache_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_opener.txt"
+
+
+def partition_cost(codes) -> float:
+    """
+    sum(n_k * log2 n_k) trên các nhóm feedback. Entropy kỳ vọng của guess là
+    log2(N) - cost / N nên cost càng nhỏ thì guess càng nhiều thông tin.
+    """
+    return sum(c * math.log2(c) for c in Counter(codes).values() if c > 1)
+
+
+def _pick(row, cands):
+    """Lấy row[c] cho mọi c trong cands, chạy trong C qua itemgetter."""
+    if len(cands) == 1:
+        return (row[cands[0]],)
+    return itemgetter(*cands)(row)
+
+
+# ---------------- worker (process pool) ----------------
+
+_w_words: Sequence[str] = ()
+_w_matrix: Optional[FeedbackMatrix] = None
+
+
+def _init_worker(words, matrix_path):
+    global _w_words, _w_matrix
+    _w_words = Lexicon(words)
+    _w_matrix = FeedbackMatrix(matrix_path, _w_words) if matrix_path else None
+
+
+def _best_of(words, matrix, guess_ids, cands, cand_set=frozenset()) -> Tuple[float, bool, int]:
+    """Guess tốt nhất trong guess_ids: key (cost, không phải candidate, id), nhỏ hơn là tốt hơn."""
+    full = matrix is not None and len(cands) == matrix.n
+    cand_words = None if matrix is not None else [words[c] for c in cands]
+    best = None
+    for g in guess_ids:
+        if matrix is not None:
+            row = matrix.row(g)
+            codes = row if full else _pick(row, cands)
+        else:
+            codes = score_batch(words[g], cand_words)
+        key = (partition_cost(codes), g not in cand_set, g)
+        if best is None or key < best:
+            best = key
+    return best
+
+
+def _best_of_task(args):
+    return _best_of(_w_words, _w_matrix, *args)
+
+
+class EntropySolver:
+    """
+    Solver Wordle thật: chỉ dùng feedback G/Y/B, không đọc secret.
+    - candidates: id các từ còn khớp với mọi feedback đã nhận
+    - mỗi lượt chọn guess có entropy kỳ vọng lớn nhất trên phân hoạch feedback
+      của candidates (ưu tiên guess cũng là candidate khi bằng điểm)
+    Có FeedbackMatrix thì chấm trên toàn bộ dictionary, chia process khi nhiều việc.
+    Guess đầu tiên chỉ phụ thuộc dictionary nên được cache ra file (opener_path).
+    """
+
+    def __init__(self, words: Lexicon, matrix: Optional[FeedbackMatrix] = None,
+                 workers: Optional[int] = None, opener_path: Optional[str] = None):
+        self.words = Lexicon(words)
+        self.matrix = matrix
+        self.workers = workers or os.cpu_count() or 1
+        self.opener_path = opener_path
+        self._pool = None
+        self.reset()
+
+    def reset(self):
+        self.candidates: List[int] = list(range(len(self.words)))
+        self.history: List[Tuple[str, int]] = []
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # ---------------- chọn guess ----------------
+
+    def next_guess(self) -> str:
+        cands = self.candidates
+        if not cands:
+            raise ValueError("không còn từ nào khớp với feedback")
+        if len(cands) <= 2:
+            return self.words[cands[0]]
+        if not self.history:
+            return self._opener()
+        return self.words[self._best_guess(cands)]
+
+    def _guess_pool(self, cands) -> Tuple[List[int], List[int]]:
+        """(guess ids, secret ids dùng để chấm)."""
+        if self.matrix is not None:
+            return list(range(len(self.words))), cands
+        # không có ma trận: ước lượng trên tập con để mỗi lượt vẫn < 1s
+        guesses = self._by_letter_score(cands)[:NO_MATRIX_POOL]
+        secrets = cands
+        if len(cands) > NO_MATRIX_POOL:
+            secrets = sorted(random.Random(len(cands)).sample(cands, NO_MATRIX_POOL))
+        return guesses, secrets
+
+    def _by_letter_score(self, cands) -> List[int]:
+        """Candidates xếp theo tần suất (vị trí, chữ) trong candidates, ưu tiên từ không lặp chữ."""
+        words = self.words.as_tuple()
+        freq = Counter()
+        for c in cands:
+            freq.update(enumerate(words[c]))
+
+        def score(c):
+            w = words[c]
+            return -sum(freq[p] for p in enumerate(w)) * len(set(w)), c
+
+        return sorted(cands, key=score)
+
+    def _best_guess(self, cands) -> int:
+        guesses, secrets = self._guess_pool(cands)
+        cand_set = frozenset(cands)
+        if self.workers > 1 and len(guesses) * len(secrets) >= PARALLEL_MIN_PAIRS:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, initializer=_init_worker,
+                    initargs=(self.words.as_tuple(), self.matrix.path if self.matrix else None),
+                )
+            step = -(-len(guesses) // (self.workers * 4))
+            tasks = [(guesses[i:i + step], secrets, cand_set) for i in range(0, len(guesses), step)]
+            return min(self._pool.map(_best_of_task, tasks))[2]
+        return _best_of(self.words.as_tuple(), self.matrix, guesses, secrets, cand_set)[2]
+
+    def _opener(self) -> str:
+        key = dictionary_key(self.words).hex()
+        exact = self.matrix is not None
+        if self.opener_path and os.path.exists(self.opener_path):
+            try:
+                with open(self.opener_path, "r", encoding="utf-8") as f:
+                    parts = f.read().split()
+            except (OSError, UnicodeDecodeError):
+                parts = []          # cache đọc không được -> tính lại
+            # chỉ dùng opener ước lượng khi không có ma trận
+            if len(parts) == 3 and parts[0] == key and parts[2] in self.words \
+                    and (parts[1] == "exact" or not exact):
+                return parts[2]
+
+        word = self.words[self._best_guess(self.candidates)]
+        if self.opener_path:
+            self._save_opener(f"{key} {'exact' if exact else 'approx'} {word}\n")
+        return word
+
+    def _save_opener(self, line: str) -> None:
+        """Ghi atomically như các cache khác; không ghi được (read-only) thì chỉ log, không cache."""
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.opener_path) or ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(line)
+                os.replace(tmp, self.opener_path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+        except OSError as e:
+            print(f"Could not write opener cache: {e}")
+
+    # ---------------- nhận feedback ----------------
+
+    def update(self, guess: str, feedback) -> int:
+        """
+        feedback: list 'G'/'Y'/'B' (như check_guess) hoặc mã base-3.
+        Lọc candidates, trả về số candidate còn lại.
+        """
+        guess = guess.upper()
+        code = feedback if isinstance(feedback, int) else encode(feedback)
+        self.history.append((guess, code))
+
+        cands = self.candidates
+        gid = self.words.get_id(guess)
+        if self.matrix is not None and gid is not None:
+            codes = _pick(self.matrix.row(gid), cands)
+        else:
+            names = self.words.as_tuple()
+            codes = score_batch(guess, [names[c] for c in cands])
+        self.candidates = [c for c, k in zip(cands, codes) if k == code]
+        return len(self.candidates)
+
+
+def entropy_play(secret: str, words: Lexicon, matrix: Optional[FeedbackMatrix] = None,
+                 max_turns: int = 20, opener_path: Optional[str] = None) -> List[str]:
+    """Chơi 1 ván với feedback từ check_guess(secret, ...), trả về các guess đã đoán."""
+    solver = EntropySolver(words, matrix, opener_path=opener_path)
+    guesses = []
+    try:
+        for _ in range(max_turns):
+            guess = solver.next_guess()
+            guesses.append(guess)
+            feedback = check_guess(secret, guess)
+            if all(ch == "G" for ch in feedback):
+                break
+            solver.update(guess, feedback)
+    finally:
+        solver.close()
+    return guesses
@@ -0,0 +1,221 @@
+# solvers/graph.py
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game.logic import Lexicon
+from .graph_builder import build_adjacency
+
+NO_PARENT = -1
+
+
+def id_typecode(n: int) -> str:
+    """uint16 khi đủ chỗ cho n id (dictionary 5 chữ ~15k từ), ngược lại uint32."""
+    return "H" if n <= 0xFFFF else "I"
+
+
+class WordGraph:
+    """
+    Đồ thị word-ladder dạng CSR (compressed sparse row):
+    - words[i] <-> id i, words là Lexicon (mapping id <-> word chỉ nằm ở đó)
+    - neighbors[offsets[i]:offsets[i + 1]] là các id kề với i
+    Solver chạy trên id, chỉ đổi về word khi trả path.
+    offsets/neighbors có thể là array hoặc memoryview trên mmap (graph_cache).
+    components[i] = nhãn connected component của i, component_sizes[c] = số node
+    của component c; tính 1 lần (lazy) hoặc load sẵn từ cache.
+    weights[k] / rweights[k] (uint8, song song với neighbors): với cạnh u -> v = neighbors[k],
+    weights[k] = cost(u -> v), rweights[k] = cost(v -> u) theo letter_freq_cost (xem ucs_solver);
+    cũng tính lazy hoặc load từ cache.
+    """
+
+    cache_key: Optional[str] = None     # hex key của graph cache, None nếu chưa cache
+    cache_path: Optional[str] = None    # file graph cache chứa đúng graph này (process khác mmap lại được)
+
+    def __init__(self, words: List[str], offsets, neighbors, components=None, component_sizes=None,
+                 weights=None, rweights=None):
+        self.words = Lexicon(words)
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self._components = components
+        self._component_sizes = component_sizes
+        self._weights = weights
+        self._rweights = rweights
+
+    def __getstate__(self):
+        # index dựng lại được từ words, không cần pickle; memoryview -> array
+        return {
+            "words": "\n".join(self.words),
+            "offsets": array("I", self.offsets),
+            "neighbors": array(id_typecode(self.n), self.neighbors),
+            "components": array(id_typecode(self.n), self.components),
+            "component_sizes": array("I", self.component_sizes),
+            "weights": array("B", self.weights),
+            "rweights": array("B", self.rweights),
+            "cache_key": self.cache_key,
+        }
+
+    def __setstate__(self, state):
+        words = state["words"].split("\n") if state["words"] else []
+        self.__init__(words, state["offsets"], state["neighbors"],
+                      state.get("components"), state.get("component_sizes"),
+                      state.get("weights"), state.get("rweights"))
+        self.cache_key = state.get("cache_key")
+
+    @classmethod
+    def from_adjacency(cls, words: List[str], adj: List[List[int]]) -> "WordGraph":
+        offsets = array("I", [0]) * (len(words) + 1)
+        neighbors = array(id_typecode(len(words)))
+        for i, lst in enumerate(adj):
+            neighbors.extend(lst)
+            offsets[i + 1] = len(neighbors)
+        return cls(words, offsets, neighbors)
+
+    @classmethod
+    def from_dict(cls, graph: Dict[str, List[str]]) -> "WordGraph":
+        """Chuyển từ đồ thị Dict[str, List[str]] kiểu cũ."""
+        words = Lexicon(graph)
+        return cls.from_adjacency(words, [[words.id_of(v) for v in graph[w]] for w in words])
+
+    @property
+    def n(self) -> int:
+        return len(self.words)
+
+    @property
+    def names(self) -> tuple:
+        """words dạng tuple (id -> word) cho vòng lặp nóng: PackedLexicon chỉ dựng 1 lần."""
+        return self.words.as_tuple()
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.neighbors) // 2
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __getitem__(self, word: str) -> List[str]:
+        """graph[word] -> list word kề, giữ tương thích với dict cũ."""
+        return [self.words[v] for v in self.adj(self.words.id_of(word))]
+
+    def id_of(self, word: str) -> int:
+        return self.words.id_of(word)
+
+    def word_of(self, i: int) -> str:
+        return self.words[i]
+
+    def adj(self, u: int):
+        """Các id kề với u."""
+        return self.neighbors[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    # ---------------- cost cạnh (UCS) ----------------
+
+    @property
+    def weights(self):
+        if self._weights is None:
+            from .ucs_solver import edge_weights
+            self._weights, self._rweights = edge_weights(self)
+        return self._weights
+
+    @property
+    def rweights(self):
+        if self._rweights is None:
+            from .ucs_solver import edge_weights
+            self._weights, self._rweights = edge_weights(self)
+        return self._rweights
+
+    def edges(self, u: int):
+        """(v, cost(u -> v)) cho mọi v kề u."""
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.neighbors[a:b], self.weights[a:b])
+
+    def in_edges(self, u: int):
+        """(v, cost(v -> u)) cho mọi v kề u, dùng cho search ngược từ goal."""
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.neighbors[a:b], self.rweights[a:b])
+
+    # ---------------- connected components ----------------
+
+    @property
+    def components(self):
+        if self._components is None:
+            self._components, self._component_sizes = label_components(self)
+        return self._components
+
+    @property
+    def component_sizes(self):
+        if self._component_sizes is None:
+            self._components, self._component_sizes = label_components(self)
+        return self._component_sizes
+
+    @property
+    def num_components(self) -> int:
+        return len(self.component_sizes)
+
+    def connected(self, a: int, b: int) -> bool:
+        """O(1): a và b có cùng component không (có đường đi hay không)."""
+        comp = self.components
+        return comp[a] == comp[b]
+
+    def component_size(self, u: int) -> int:
+        return self.component_sizes[self.components[u]]
+
+    def new_parent_array(self):
+        """Mảng parent cấp sẵn, NO_PARENT = chưa thăm."""
+        return array("i", [NO_PARENT]) * len(self.words)
+
+    def to_words(self, ids: Iterable[int]) -> List[str]:
+        words = self.names
+        return [words[i] for i in ids]
+
+    def path_from_parents(self, parent, goal: int) -> List[str]:
+        """Dựng path [start, ..., goal]; node gốc có parent[root] == root."""
+        ids = [goal]
+        cur = goal
+        while parent[cur] != cur:
+            cur = parent[cur]
+            ids.append(cur)
+        ids.reverse()
+        return self.to_words(ids)
+
+
+def label_components(graph: WordGraph) -> Tuple[array, array]:
+    """Gán nhãn connected component bằng BFS, trả về (labels, sizes)."""
+    n = graph.n
+    adj = graph.adj
+    labels = array("i", [-1]) * n
+    sizes = array("I")
+    for root in range(n):
+        if labels[root] >= 0:
+            continue
+        c = len(sizes)
+        labels[root] = c
+        size = 1
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            for v in adj(u):
+                if labels[v] < 0:
+                    labels[v] = c
+                    size += 1
+                    queue.append(v)
+        sizes.append(size)
+    return array(id_typecode(n), labels), sizes
+
+
+def build_word_graph(words: List[str], workers: Optional[int] = 1) -> WordGraph:
+    """Xây WordGraph trực tiếp từ danh sách từ (bucket wildcard)."""
+    words = Lexicon(words)
+    return WordGraph.from_adjacency(words, build_adjacency(words, workers))
+
+
+def as_word_graph(graph) -> WordGraph:
+    """Nhận WordGraph hoặc Dict[str, List[str]] kiểu cũ, trả về WordGraph."""
+    if isinstance(graph, WordGraph):
+        return graph
+    return WordGraph.from_dict(graph)
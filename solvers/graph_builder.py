@@ -0,0 +1,97 @@
+# solvers/graph_builder.py
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+WILDCARD = "_"
+
+
+def wildcard_patterns(word: str) -> List[str]:
+    """Các pattern 1 wildcard của word, vd BATCH -> _ATCH, B_TCH, ..."""
+    return [word[:i] + WILDCARD + word[i + 1:] for i in range(len(word))]
+
+
+def group_buckets(words: List[str]) -> List[List[int]]:
+    """
+    Gom index các từ theo pattern wildcard.
+    Chỉ giữ bucket có >= 2 từ (bucket 1 từ không tạo cạnh nào).
+    """
+    buckets: Dict[str, List[int]] = defaultdict(list)
+    seen = set()
+    for i, w in enumerate(words):
+        if w in seen:
+            continue
+        seen.add(w)
+        for p in wildcard_patterns(w):
+            buckets[p].append(i)
+    return [b for b in buckets.values() if len(b) > 1]
+
+
+def link_buckets(buckets: List[List[int]]) -> List[Tuple[int, int]]:
+    """
+    Nối mọi cặp trong cùng bucket. Hai từ khác nhau đúng 1 ký tự
+    nằm chung đúng 1 bucket, nên mỗi cạnh chỉ sinh ra 1 lần.
+    """
+    edges = []
+    for b in buckets:
+        m = len(b)
+        for x in range(m):
+            i = b[x]
+            for y in range(x + 1, m):
+                edges.append((i, b[y]))
+    return edges
+
+
+def _shard(buckets: List[List[int]], n_shards: int) -> List[List[List[int]]]:
+    """Chia bucket thành n_shards phần có tổng số cặp gần bằng nhau."""
+    shards: List[List[List[int]]] = [[] for _ in range(n_shards)]
+    load = [0] * n_shards
+    # bucket lớn trước để cân tải tốt hơn
+    for b in sorted(buckets, key=len, reverse=True):
+        k = load.index(min(load))
+        shards[k].append(b)
+        load[k] += len(b) * (len(b) - 1) // 2
+    return [s for s in shards if s]
+
+
+def build_adjacency(words: List[str], workers: Optional[int] = 1) -> List[List[int]]:
+    """
+    Danh sách kề theo index, mỗi list đã sort tăng dần theo index
+    (cùng thứ tự với cách duyệt từng cặp i < j cũ).
+    - workers = 1: chạy tuần tự
+    - workers = None: dùng os.cpu_count() process
+    """
+    buckets = group_buckets(words)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(buckets) > workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(link_buckets, _shard(buckets, workers)))
+    else:
+        parts = [link_buckets(buckets)]
+
+    adj: List[List[int]] = [[] for _ in words]
+    for edges in parts:
+        for i, j in edges:
+            adj[i].append(j)
+            adj[j].append(i)
+    for lst in adj:
+        lst.sort()
+    return adj
+
+
+def build_graph_buckets(words: List[str], workers: Optional[int] = 1) -> Dict[str, List[str]]:
+    """
+    Xây đồ thị word-ladder bằng bucket wildcard, ~O(n * L) thay vì O(n²).
+    Kết quả giống hệt build_graph kiểu so từng cặp (kể cả thứ tự neighbor).
+    """
+    adj = build_adjacency(words, workers)
+    graph: Dict[str, List[str]] = {w: [] for w in words}
+    for i, lst in enumerate(adj):
+        if lst:
+            graph[words[i]] = [words[j] for j in lst]
+    return graph
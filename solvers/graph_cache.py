@@ -0,0 +1,196 @@
+# solvers/graph_cache.py
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import List, Optional
+
+from game.logic import Lexicon
+from .graph import WordGraph, build_word_graph, id_typecode
+
+MAGIC = b"WLGC"
+FORMAT_VERSION = 3
+# đổi khi cách xây đồ thị (hoặc bảng letter_freq_cost của cost cạnh) đổi -> cache cũ tự bị build lại
+BUILD_PARAMS = "wildcard-buckets/v1|letter-freq-weights/v1"
+
+# magic, version, byteorder, id typecode, key (sha256), n, num neighbors, words bytes,
+# num components
+_HEADER = struct.Struct("<4sHcc32sIIII")
+
+
+def graph_cache_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_graph.bin"
+
+
+def graph_cache_key(words: List[str], params: str = BUILD_PARAMS) -> bytes:
+    """Key = sha256(format version + build params + nội dung dictionary)."""
+    h = hashlib.sha256()
+    h.update(f"{FORMAT_VERSION}|{params}|".encode())
+    h.update("\n".join(words).encode("utf-8"))
+    return h.digest()
+
+
+def _pad4(n: int) -> int:
+    return (-n) % 4
+
+
+def save_graph(path: str, graph: WordGraph, key: bytes) -> None:
+    """Ghi cache atomically: ghi ra file tạm cùng thư mục rồi os.replace."""
+    words_blob = "\n".join(graph.words).encode("utf-8")
+    neighbors = graph.neighbors
+    typecode = neighbors.format if isinstance(neighbors, memoryview) else neighbors.typecode
+    labels = bytes(graph.components)
+    sizes = bytes(graph.component_sizes)
+    weights = bytes(graph.weights)
+    rweights = bytes(graph.rweights)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, sys.byteorder[0].encode(), typecode.encode(),
+        key, graph.n, len(neighbors), len(words_blob), graph.num_components,
+    )
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(b"\0" * _pad4(len(header)))
+            f.write(words_blob)
+            f.write(b"\0" * _pad4(len(words_blob)))
+            f.write(bytes(graph.offsets))
+            f.write(bytes(neighbors))
+            f.write(labels)
+            f.write(b"\0" * _pad4(len(neighbors) * struct.calcsize(typecode) + len(labels)))
+            f.write(sizes)
+            f.write(weights)
+            f.write(rweights)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _layout(header):
+    """
+    Header (đã unpack) -> (typecode, vị trí các khối, tổng kích thước file),
+    hoặc None nếu sai magic / version / byteorder / typecode.
+    """
+    magic, version, order, typecode, _, n, n_nb, n_words, n_comp = header
+    if magic != MAGIC or version != FORMAT_VERSION or order != sys.byteorder[0].encode():
+        return None
+    typecode = typecode.decode()
+    if typecode != id_typecode(n):
+        return None
+    pos = _HEADER.size + _pad4(_HEADER.size)
+    words_end = pos + n_words
+    off_start = words_end + _pad4(n_words)
+    nb_start = off_start + 4 * (n + 1)
+    item = struct.calcsize(typecode)
+    nb_end = nb_start + n_nb * item
+    labels_end = nb_end + n * item
+    sizes_start = labels_end + _pad4(labels_end)
+    sizes_end = sizes_start + 4 * n_comp
+    weights_end = sizes_end + n_nb
+    bounds = (pos, words_end, off_start, nb_start, nb_end, labels_end, sizes_start, sizes_end, weights_end)
+    return typecode, bounds, weights_end + n_nb
+
+
+def graph_cache_valid(path: str, key: bytes) -> bool:
+    """Cache có dùng được với key không, chỉ đọc header + kích thước file (không mmap)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return False
+    if len(head) < _HEADER.size:
+        return False
+    header = _HEADER.unpack(head)
+    layout = _layout(header)
+    return layout is not None and header[4] == key and layout[2] == size
+
+
+def load_graph(path: str, key: bytes, words: Optional[List[str]] = None) -> Optional[WordGraph]:
+    """
+    Mở cache bằng mmap, offsets/neighbors là memoryview trên mmap (không copy).
+    Nếu truyền words (đã dùng để tính key) thì dùng luôn, khỏi decode lại từ file.
+    Trả về None nếu file không có, hỏng, khác version/byteorder hoặc khác key.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # file rỗng
+            return None
+
+    if len(mm) < _HEADER.size:
+        mm.close()
+        return None
+    header = _HEADER.unpack_from(mm, 0)
+    layout = _layout(header)
+    if layout is None or header[4] != key or layout[2] != len(mm):
+        mm.close()
+        return None
+
+    typecode, bounds, _ = layout
+    pos, words_end, off_start, nb_start, nb_end, labels_end, sizes_start, sizes_end, weights_end = bounds
+    n = header[5]
+    buf = memoryview(mm)
+    if words is None:
+        words = bytes(buf[pos:words_end]).decode("utf-8").split("\n") if n else []
+    offsets = buf[off_start:nb_start].cast("I")
+    neighbors = buf[nb_start:nb_end].cast(typecode)
+    labels = buf[nb_end:labels_end].cast(typecode)
+    sizes = buf[sizes_start:sizes_end].cast("I")
+    weights = buf[sizes_end:weights_end]
+    rweights = buf[weights_end:]
+
+    graph = WordGraph(words, offsets, neighbors, labels, sizes, weights, rweights)
+    graph.cache_key = key.hex()
+    graph.cache_path = path
+    graph._mmap = mm      # giữ mmap sống cùng graph
+    return graph
+
+
+def attach_graph(path: str, key: bytes) -> WordGraph:
+    """
+    load_graph cho worker process: cache phải còn nguyên như lúc process cha kiểm tra,
+    không thì báo lỗi rõ ràng thay vì để worker chạy với graph None.
+    """
+    graph = load_graph(path, key)
+    if graph is None:
+        raise RuntimeError(f"graph cache {path} bị xoá hoặc thay đổi sau khi bắt đầu chạy, "
+                           "chạy lại (cache sẽ được build lại)")
+    return graph
+
+
+def load_or_build_graph(dict_path: str, words: List[str], workers: Optional[int] = 1,
+                        log=print) -> WordGraph:
+    """
+    Dùng chung cho app và experiments:
+    load cache nếu key khớp, ngược lại build lại và ghi đè cache.
+    """
+    path = graph_cache_path(dict_path)
+    words = Lexicon(words)
+    key = graph_cache_key(words)
+
+    graph = load_graph(path, key, words)
+    if graph is not None:
+        log("Loading graph cache...")
+        return graph
+
+    log("Building graph (cache missing or stale)...")
+    graph = build_word_graph(words, workers)
+    graph.cache_key = key.hex()
+    try:
+        save_graph(path, graph, key)
+        graph.cache_path = path
+    except OSError as e:
+        log(f"Could not write graph cache: {e}")
+    return graph
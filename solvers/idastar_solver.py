@@ -0,0 +1,98 @@
+# solvers/idastar_solver.py
+
+from typing import Callable, List, Optional, Tuple
+
+from .astar_solver import id_heuristic
+from .graph import WordGraph, as_word_graph
+from .search_core import STOP_CHECK_EVERY
+
+
+def idastar_search(graph: WordGraph, s: int, t: int,
+                   stop_flag: Callable[[], bool] = lambda: False,
+                   max_expanded: Optional[int] = None,
+                   landmarks=None) -> Tuple[Optional[List[int]], int, int]:
+    """
+    IDA*: DFS với ngưỡng f = g + h (h = Hamming, xem astar_solver.heuristic),
+    mỗi vòng nâng ngưỡng lên f nhỏ nhất đã vượt ngưỡng ở vòng trước.
+    Bộ nhớ O(độ sâu): chỉ giữ path hiện tại + danh sách hàng xóm của từng tầng.
+    - max_expanded: dừng (trả None) khi vượt số node expand
+    - landmarks: h = max(Hamming, ALT) như A*, cắt nhánh mạnh hơn nhiều
+    Trả về (path id, tổng expanded, peak số node trên stack).
+    """
+    if not graph.connected(s, t):
+        return None, 0, 0
+
+    adj = graph.adj
+    h = id_heuristic(graph, t, landmarks)
+
+    def children(u: int):
+        # (h, v), hàng xóm gần goal hơn thử trước; h tính 1 lần cho cả sort lẫn f
+        return iter(sorted([(h(v), v) for v in adj(u)]))
+
+    bound = h(s)
+    expanded = 0
+    peak = 1
+
+    while True:
+        if stop_flag():
+            return None, expanded, peak
+
+        expanded += 1
+        if s == t:
+            return [s], expanded, peak
+
+        next_bound = None
+        path = [s]
+        on_path = {s}
+        iters = [children(s)]
+
+        while iters:
+            item = next(iters[-1], None)
+            if item is None:
+                iters.pop()
+                on_path.discard(path.pop())
+                continue
+            hv, v = item
+            if v in on_path:
+                continue
+
+            f = len(path) + hv
+            if f > bound:
+                if next_bound is None or f < next_bound:
+                    next_bound = f
+                continue
+
+            expanded += 1
+            if v == t:
+                path.append(v)
+                return path, expanded, max(peak, len(path))
+
+            path.append(v)
+            on_path.add(v)
+            iters.append(children(v))
+            if len(path) > peak:
+                peak = len(path)
+
+            if expanded % STOP_CHECK_EVERY == 0:
+                if stop_flag() or (max_expanded is not None and expanded >= max_expanded):
+                    return None, expanded, peak
+
+        if next_bound is None:
+            return None, expanded, peak   # không còn node nào vượt ngưỡng: hết đường
+        bound = next_bound
+
+
+def idastar_solve(start: str, goal: str, words: List[str], graph,
+                  stop_flag=lambda: False, landmarks=None) -> Optional[List[str]]:
+    """
+    Tìm đường đi ngắn nhất start -> goal bằng IDA* (heuristic Hamming).
+    Cùng độ dài path với A* nhưng bộ nhớ chỉ O(độ dài path).
+    """
+    start = start.upper()
+    goal = goal.upper()
+    if start not in words or goal not in words:
+        raise ValueError("start và goal phải nằm trong dictionary")
+
+    g = as_word_graph(graph)
+    path, _, _ = idastar_search(g, g.id_of(start), g.id_of(goal), stop_flag, landmarks=landmarks)
+    return g.to_words(path) if path is not None else None
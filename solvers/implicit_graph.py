@@ -0,0 +1,140 @@
+# solvers/implicit_graph.py
+"""
+Graph word-ladder "ngầm": không dựng CSR, không file cache.
+
+Hàng xóm của u sinh lúc cần: thay từng vị trí của từ bằng 25 chữ còn lại
+(L x 25 từ ứng viên) rồi tra hash index của lexicon. Tuỳ chọn giữ LRU
+cache_size node gần nhất để search đi lại qua node cũ không phải sinh lại.
+
+Là subclass của WordGraph, cùng interface (adj, edges, in_edges, id_of, connected, ...)
+nên mọi solver nhận được (as_word_graph trả nguyên). Khởi động chỉ tốn dựng Lexicon;
+đổi lại mỗi lần expand chậm hơn đọc CSR, và connected() trả True (không biết trước
+component) cho tới khi gọi label_components() (duyệt cả graph).
+"""
+
+from array import array
+from collections import OrderedDict
+from string import ascii_uppercase
+from typing import List, Optional, Tuple
+
+from .graph import WordGraph, id_typecode, label_components
+from .graph_cache import graph_cache_key
+from .ucs_solver import letter_freq_cost
+
+
+class ImplicitWordGraph(WordGraph):
+
+    def __init__(self, words: List[str], cache_size: int = 0, alphabet: str = ascii_uppercase):
+        super().__init__(words, None, None)
+        # cùng key với graph cache của dictionary này (cùng 1 graph), để PathCache /
+        # landmark cache dùng chung được giữa 2 backend
+        self.cache_key = graph_cache_key(self.words).hex()
+        # dict word -> id (PackedLexicon dựng 1 lần): L x 25 lần tra mỗi node
+        self._probe = self.words.hash_index().get
+        self.alphabet = alphabet
+        self.cache_size = cache_size
+        self._cache: Optional[OrderedDict] = OrderedDict() if cache_size > 0 else None
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        state = {"words": "\n".join(self.words), "cache_size": self.cache_size,
+                 "alphabet": self.alphabet}
+        # component đã tính (label_components) đi kèm, để worker không mất connected() O(1)
+        if self._components is not None:
+            state["components"] = array(id_typecode(self.n), self._components)
+            state["component_sizes"] = array("I", self._component_sizes)
+        return state
+
+    def __setstate__(self, state):
+        words = state["words"].split("\n") if state["words"] else []
+        self.__init__(words, state["cache_size"], state["alphabet"])
+        self._components = state.get("components")
+        self._component_sizes = state.get("component_sizes")
+
+    # ---------------- sinh hàng xóm ----------------
+
+    def _expand(self, u: int) -> Tuple[tuple, bytes, bytes]:
+        """(id kề, cost u -> v, cost v -> u) theo letter_freq_cost như step_cost."""
+        word = self.words[u]
+        get = self._probe
+        cost = letter_freq_cost
+        ids, w, rw = [], [], []
+        for i, a in enumerate(word):
+            head, tail = word[:i], word[i + 1:]
+            back = cost[a]
+            for c in self.alphabet:
+                if c != a:
+                    v = get(head + c + tail)
+                    if v is not None:
+                        ids.append(v)
+                        w.append(cost[c])
+                        rw.append(back)
+        return tuple(ids), bytes(w), bytes(rw)
+
+    def _lookup(self, u: int) -> Tuple[tuple, bytes, bytes]:
+        cache = self._cache
+        if cache is None:
+            return self._expand(u)
+        entry = cache.get(u)
+        if entry is not None:
+            self.hits += 1
+            try:
+                cache.move_to_end(u)
+            except KeyError:
+                pass          # thread khác vừa đẩy u ra khỏi cache (GUI chạy solver ở thread)
+            return entry
+        self.misses += 1
+        entry = cache[u] = self._expand(u)
+        while len(cache) > self.cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+        return entry
+
+    def adj(self, u: int):
+        return self._lookup(u)[0]
+
+    def degree(self, u: int) -> int:
+        return len(self._lookup(u)[0])
+
+    def edges(self, u: int):
+        ids, w, _ = self._lookup(u)
+        return zip(ids, w)
+
+    def in_edges(self, u: int):
+        ids, _, rw = self._lookup(u)
+        return zip(ids, rw)
+
+    @property
+    def num_edges(self) -> int:
+        return sum(self.degree(u) for u in range(self.n)) // 2
+
+    @property
+    def weights(self):
+        raise AttributeError("ImplicitWordGraph không có mảng cost cạnh, dùng edges(u)")
+
+    rweights = weights
+
+    def cache_stats(self) -> dict:
+        size = len(self._cache) if self._cache is not None else 0
+        return {"size": size, "maxsize": self.cache_size, "hits": self.hits, "misses": self.misses}
+
+    # ---------------- connected components ----------------
+
+    def label_components(self) -> None:
+        """Tính component cho cả graph (duyệt hết mọi node), sau đó connected() là O(1)."""
+        self._components, self._component_sizes = label_components(self)
+
+    def connected(self, a: int, b: int) -> bool:
+        """Chưa tính component thì trả True: solver tự search rồi trả None nếu không tới được."""
+        if self._components is None:
+            return True
+        return self._components[a] == self._components[b]
+
+    def component_size(self, u: int) -> int:
+        """Chưa tính component thì lấy cận trên n."""
+        if self._components is None:
+            return self.n
+        return self._component_sizes[self._components[u]]
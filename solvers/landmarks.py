@@ -0,0 +1,245 @@
+# solvers/landmarks.py
+"""
+Landmark (ALT) distance oracle cho A*.
+
+Với landmark L, bất đẳng thức tam giác cho |d(L, v) - d(L, goal)| <= d(v, goal),
+nên max trên K landmark là heuristic admissible (và consistent).
+Bảng khoảng cách: K hàng uint8, mỗi hàng n byte, 255 = không tới được.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional
+
+from .graph import WordGraph
+
+UNREACHABLE = 255
+DEFAULT_K = 16
+
+MAGIC = b"WLLM"
+FORMAT_VERSION = 1
+# magic, version, K, n, graph cache key (sha256)
+_HEADER = struct.Struct("<4sHHI32s")
+
+
+def bfs_distances(graph: WordGraph, src: int) -> bytearray:
+    """Khoảng cách BFS từ src tới mọi node, uint8 (>= 255 coi như không tới được)."""
+    dist = bytearray(b"\xff") * graph.n
+    dist[src] = 0
+    adj = graph.adj
+    queue = deque([src])
+    while queue:
+        u = queue.popleft()
+        du = dist[u] + 1
+        if du >= UNREACHABLE:
+            continue
+        for v in adj(u):
+            if dist[v] == UNREACHABLE:
+                dist[v] = du
+                queue.append(v)
+    return dist
+
+
+_w_graph: Optional[WordGraph] = None
+
+
+def _init_worker(graph):
+    global _w_graph
+    _w_graph = graph
+
+
+def _bfs_task(src):
+    return bfs_distances(_w_graph, src)
+
+
+class Landmarks:
+    def __init__(self, ids: List[int], rows: List):
+        self.ids = list(ids)
+        self.rows = rows     # rows[k][v] = d(ids[k], v)
+
+    def __reduce__(self):
+        # rows có thể là memoryview trên mmap (load_landmarks), không pickle được -> copy ra bytes
+        return Landmarks, (self.ids, [bytes(row) for row in self.rows])
+
+    @property
+    def k(self) -> int:
+        return len(self.ids)
+
+    def lower_bound(self, v: int, goal: int) -> int:
+        best = 0
+        for row in self.rows:
+            a, b = row[v], row[goal]
+            if a != UNREACHABLE and b != UNREACHABLE:
+                d = a - b if a > b else b - a
+                if d > best:
+                    best = d
+        return best
+
+    def heuristic_to(self, goal: int) -> Callable[[int], int]:
+        """h(v) cho 1 goal cố định, chỉ giữ landmark tới được goal."""
+        pairs = [(row, row[goal]) for row in self.rows if row[goal] != UNREACHABLE]
+
+        def h(v: int) -> int:
+            best = 0
+            for row, dg in pairs:
+                a = row[v]
+                if a != UNREACHABLE:
+                    d = a - dg if a > dg else dg - a
+                    if d > best:
+                        best = d
+            return best
+
+        return h
+
+
+def _hamming(a: str, b: str) -> int:
+    return sum(x != y for x, y in zip(a, b))
+
+
+def select_landmarks(graph: WordGraph, k: int = DEFAULT_K, workers: Optional[int] = 1) -> Landmarks:
+    """
+    Chọn landmark kiểu farthest-point theo từng đợt `workers` landmark:
+    mỗi đợt lấy các node (cùng component với node bậc cao nhất, tức component
+    lớn) xa tập landmark hiện tại nhất; các node trong cùng đợt phải khác nhau
+    hoàn toàn (Hamming = độ dài từ, nên cách nhau >= độ dài từ bước).
+    BFS của cả đợt chạy song song; hàng BFS chính là bảng.
+    """
+    n = graph.n
+    k = min(k, n)
+    workers = workers or os.cpu_count() or 1
+    words = graph.words
+    full = len(words[0]) if n else 0
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(graph,))
+    try:
+        # node bậc cao nhất làm mốc ban đầu, landmark đầu = node xa nó nhất
+        start = max(range(n), key=graph.degree) if n else 0
+        seed = bfs_distances(graph, start)
+        first = max(range(n), key=lambda v: (seed[v] != UNREACHABLE, seed[v] if seed[v] != UNREACHABLE else 0))
+
+        ids: List[int] = []
+        rows: List = []
+        min_dist = bytearray(b"\xff") * n   # khoảng cách tới landmark gần nhất
+        batch = [first]
+        while batch:
+            if pool is not None:
+                new_rows = list(pool.map(_bfs_task, batch))
+            else:
+                new_rows = [bfs_distances(graph, s) for s in batch]
+            for s, row in zip(batch, new_rows):
+                ids.append(s)
+                rows.append(row)
+                for v in range(n):
+                    if row[v] < min_dist[v]:
+                        min_dist[v] = row[v]
+
+            need = min(workers, k - len(ids))
+            if need <= 0:
+                break
+            reach = [v for v in range(n) if min_dist[v] != UNREACHABLE]
+            order = sorted(reach, key=lambda v: (-min_dist[v], -graph.degree(v), v))
+            batch = []
+            for v in order:
+                if min_dist[v] == 0:
+                    break
+                if all(_hamming(words[v], words[b]) == full for b in batch):
+                    batch.append(v)
+                    if len(batch) == need:
+                        break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return Landmarks(ids, rows)
+
+
+# ======================================================
+# CACHE (cạnh graph cache, key theo graph cache key)
+# ======================================================
+
+def landmarks_cache_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_landmarks.bin"
+
+
+def save_landmarks(path: str, lm: Landmarks, n: int, graph_key: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, lm.k, n, graph_key))
+            f.write(struct.pack(f"<{lm.k}I", *lm.ids))
+            for row in lm.rows:
+                f.write(bytes(row))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def landmarks_cache_valid(path: str, n: int, graph_key: bytes, k: int) -> bool:
+    """Như load_landmarks(...) is not None nhưng chỉ đọc header + kích thước file (không mmap)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return False
+    if len(head) < _HEADER.size:
+        return False
+    magic, version, file_k, file_n, key = _HEADER.unpack(head)
+    return (magic == MAGIC and version == FORMAT_VERSION and file_k == k and file_n == n
+            and key == graph_key and size == _HEADER.size + 4 * file_k + file_k * n)
+
+
+def load_landmarks(path: str, n: int, graph_key: bytes, k: int) -> Optional[Landmarks]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+    if len(mm) < _HEADER.size:
+        mm.close()
+        return None
+    magic, version, file_k, file_n, key = _HEADER.unpack_from(mm, 0)
+    start = _HEADER.size + 4 * file_k
+    if (magic != MAGIC or version != FORMAT_VERSION or file_k != k or file_n != n
+            or key != graph_key or len(mm) != start + file_k * n):
+        mm.close()
+        return None
+    ids = list(struct.unpack_from(f"<{file_k}I", mm, _HEADER.size))
+    buf = memoryview(mm)
+    rows = [buf[start + i * n:start + (i + 1) * n] for i in range(file_k)]
+    lm = Landmarks(ids, rows)
+    lm._mmap = mm
+    return lm
+
+
+def load_or_build_landmarks(dict_path: str, graph: WordGraph, k: int = DEFAULT_K,
+                            workers: Optional[int] = 1, log=print) -> Landmarks:
+    """Dùng bảng landmark đã cache nếu khớp graph cache key và K, ngược lại build lại."""
+    path = landmarks_cache_path(dict_path)
+    key = bytes.fromhex(graph.cache_key) if graph.cache_key else None
+
+    if key is not None:
+        lm = load_landmarks(path, graph.n, key, k)
+        if lm is not None:
+            return lm
+
+    log(f"Building {k} landmarks...")
+    lm = select_landmarks(graph, k, workers)
+    if key is not None:
+        try:
+            save_landmarks(path, lm, graph.n, key)
+        except OSError as e:
+            log(f"Could not write landmark cache: {e}")
+    return lm
@@ -0,0 +1,137 @@
+# solvers/path_cache.py
+"""
+Cache kết quả (start, goal) -> path dùng chung cho mọi solver.
+
+Key = (algorithm, start, goal, graph version), graph version là graph.cache_key,
+nên khi graph cache build lại (dictionary đổi) thì toàn bộ entry cũ bị bỏ.
+LRU giới hạn số entry, có đếm hit / miss, có thể lưu ra file giữa các phiên.
+"""
+
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+# thuật toán cho path ngắn nhất trên đồ thị vô hướng, cost 1 mỗi bước:
+# path goal -> start đảo ngược cũng là đáp án tối ưu cho start -> goal
+UNIT_COST_ALGOS = {"bfs", "bibfs", "dfs", "ids", "astar", "astar_alt", "idastar"}
+
+_MISSING = object()
+
+
+def path_cache_path(dict_path: str) -> str:
+    return os.path.splitext(dict_path)[0] + "_paths.pkl"
+
+
+class PathCache:
+    def __init__(self, maxsize: int = 4096, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.version: Optional[str] = None
+        self._data: "OrderedDict[Tuple[str, str, str], Optional[List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.reverse_hits = 0
+        self.misses = 0
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data), "maxsize": self.maxsize,
+            "hits": self.hits, "reverse_hits": self.reverse_hits, "misses": self.misses,
+        }
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def _check_version(self, graph) -> None:
+        version = getattr(graph, "cache_key", None)
+        if version != self.version:
+            # graph khác (hoặc cache key đổi) -> path cũ không còn đúng
+            self._data.clear()
+            self.version = version
+
+    # ---------------- get / put ----------------
+
+    def get(self, algo: str, start: str, goal: str, graph):
+        """Trả về path (None = đã biết không có đường) hoặc _MISSING nếu chưa có."""
+        self._check_version(graph)
+        data = self._data
+        key = (algo, start, goal)
+        if key in data:
+            data.move_to_end(key)
+            self.hits += 1
+            return data[key]
+
+        if algo in UNIT_COST_ALGOS:
+            rkey = (algo, goal, start)
+            if rkey in data:
+                data.move_to_end(rkey)
+                self.reverse_hits += 1
+                path = data[rkey]
+                return path[::-1] if path is not None else None
+
+        self.misses += 1
+        return _MISSING
+
+    def put(self, algo: str, start: str, goal: str, graph, path: Optional[List[str]]) -> None:
+        self._check_version(graph)
+        data = self._data
+        key = (algo, start, goal)
+        data[key] = list(path) if path is not None else None
+        data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def get_or_solve(self, algo: str, start: str, goal: str, graph,
+                     solve: Callable[[], Optional[List[str]]],
+                     store: Callable[[], bool] = lambda: True) -> Optional[List[str]]:
+        """
+        Lấy từ cache hoặc gọi solve(); store() = False (vd solver bị STOP giữa chừng)
+        thì không lưu kết quả.
+        """
+        start, goal = start.upper(), goal.upper()
+        path = self.get(algo, start, goal, graph)
+        if path is not _MISSING:
+            return list(path) if path is not None else None
+        path = solve()
+        if store():
+            self.put(algo, start, goal, graph, path)
+        return path
+
+    # ---------------- lưu file ----------------
+
+    def save(self) -> None:
+        """Ghi atomically; chỉ lưu khi graph có cache key (version xác định)."""
+        if not self.path or self.version is None:
+            return
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": self.version, "entries": list(self._data.items())}, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            self.version = state["version"]
+            self._data = OrderedDict(state["entries"][-self.maxsize:])
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            # file hỏng -> bỏ qua, coi như cache rỗng
+            self.version = None
+            self._data = OrderedDict()
+
+
+# cache mặc định dùng chung trong process (GUI, script)
+default_path_cache = PathCache()
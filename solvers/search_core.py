@@ -0,0 +1,355 @@
+# solvers/search_core.py
+"""
+Lõi search dùng chung cho BFS / IDS / UCS / A* (GUI lẫn experiments chạy cùng 1 code).
+
+search(graph, s, t, policy, ...) chọn frontier theo policy:
+- FIFO: queue, đánh dấu parent khi push (BFS)
+- LIFO: stack tường minh, giới hạn độ sâu + transposition table (1 vòng của IDS)
+- PRIORITY: heap theo f = g + epsilon * h, g là số bước hoặc cost cạnh graph.weights
+
+Đo đạc: chỉ khi có truyền stats mới chạy bản có counter (expanded, pushed, stale pop,
+peak frontier, peak frontier + visited), ghi vào SearchStats ở cuối, kèm thời gian từng
+phase (perf_counter_ns) và tuỳ chọn chạy dưới cProfile. stats=None (GUI, solver thường)
+chạy vòng lặp trần _fifo_plain / _priority_plain, không đếm gì ngoài stop check.
+"""
+
+import cProfile
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from itertools import repeat
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional
+
+from .graph import WordGraph
+
+FIFO = "fifo"
+LIFO = "lifo"
+PRIORITY = "priority"
+
+# stop_flag / max_expanded chỉ được hỏi mỗi STOP_CHECK_EVERY node để đỡ tốn lời gọi hàm
+STOP_CHECK_EVERY = 256
+
+
+class SearchStats:
+    """
+    Số liệu của 1 (hoặc nhiều, xem add) lần search.
+    profile=True: chạy search dưới cProfile, kết quả ở self.profiler (pstats.Stats(stats.profiler)).
+    clock: hàm thời gian (ns) cho phase_ns, mặc định perf_counter_ns.
+    """
+
+    __slots__ = ("expanded", "pushed", "stale", "peak_frontier", "peak_mem", "visited",
+                 "cutoff", "stopped", "phase_ns", "profile", "profiler", "clock")
+
+    def __init__(self, profile: bool = False, clock: Callable[[], int] = perf_counter_ns):
+        self.expanded = 0
+        self.pushed = 0
+        self.stale = 0
+        self.peak_frontier = 0
+        self.peak_mem = 0
+        self.visited = 0
+        self.cutoff = False       # LIFO: có nhánh bị cắt ở depth limit
+        self.stopped = False      # dừng vì stop_flag / max_expanded
+        self.phase_ns: Dict[str, int] = {}
+        self.profile = profile
+        self.profiler: Optional[cProfile.Profile] = None
+        self.clock = clock
+
+    def add(self, other: "SearchStats") -> None:
+        """Cộng dồn 1 lần search khác vào (vd các vòng của IDS); peak lấy max."""
+        self.expanded += other.expanded
+        self.pushed += other.pushed
+        self.stale += other.stale
+        self.peak_frontier = max(self.peak_frontier, other.peak_frontier)
+        self.peak_mem = max(self.peak_mem, other.peak_mem)
+        self.visited = max(self.visited, other.visited)
+        self.cutoff = other.cutoff
+        self.stopped = self.stopped or other.stopped
+        for k, v in other.phase_ns.items():
+            self.phase_ns[k] = self.phase_ns.get(k, 0) + v
+
+    def as_dict(self) -> dict:
+        d = {
+            "expanded": self.expanded, "pushed": self.pushed, "stale": self.stale,
+            "peak_frontier": self.peak_frontier, "peak_mem": self.peak_mem, "visited": self.visited,
+        }
+        for k, v in self.phase_ns.items():
+            d[f"{k}_ns"] = v
+        return d
+
+
+def search(graph: WordGraph, s: int, t: int, policy: str = FIFO, *,
+           h: Optional[Callable[[int], float]] = None, weighted: bool = False,
+           epsilon: float = 1.0, depth_limit: Optional[int] = None,
+           stop_flag: Optional[Callable[[], bool]] = None, max_expanded: Optional[int] = None,
+           stats: Optional[SearchStats] = None) -> Optional[List[int]]:
+    """
+    Tìm path id s -> t theo policy (FIFO / LIFO / PRIORITY).
+    - h, epsilon: heuristic cho PRIORITY (None = UCS / Dijkstra)
+    - weighted: PRIORITY dùng cost cạnh graph.weights thay cho cost 1 mỗi bước
+    - depth_limit: bắt buộc với LIFO
+    - stop_flag / max_expanded: dừng sớm, trả None (stats.stopped = True)
+    Trả về list id [s, ..., t] hoặc None.
+    """
+    if not graph.connected(s, t):
+        return None
+    if stats is None:
+        if policy == FIFO:
+            found, parent = _fifo_plain(graph, s, t, stop_flag, max_expanded)
+        elif policy == PRIORITY:
+            found, parent = _priority_plain(graph, s, t, h, weighted, epsilon, stop_flag, max_expanded)
+        else:
+            return _run(graph, s, t, policy, h, weighted, epsilon, depth_limit, stop_flag, max_expanded)[0]
+        return _path_ids(parent, t) if found else None
+
+    if stats.profile:
+        stats.profiler = stats.profiler or cProfile.Profile()
+        path, counters, phases = stats.profiler.runcall(
+            _run, graph, s, t, policy, h, weighted, epsilon, depth_limit, stop_flag, max_expanded,
+            stats.clock)
+    else:
+        path, counters, phases = _run(graph, s, t, policy, h, weighted, epsilon, depth_limit,
+                                      stop_flag, max_expanded, stats.clock)
+
+    one = SearchStats()
+    (one.expanded, one.pushed, one.stale, one.peak_frontier, one.peak_mem,
+     one.visited, one.cutoff, one.stopped) = counters
+    one.phase_ns = phases
+    stats.add(one)
+    return path
+
+
+def _run(graph, s, t, policy, h, weighted, epsilon, depth_limit, stop_flag, max_expanded, clock=None):
+    """Chạy policy; clock != None thì đo phase "search" và "path" (dựng path từ parent)."""
+    t0 = clock() if clock is not None else 0
+    if policy == FIFO:
+        found, parent, counters = _fifo(graph, s, t, stop_flag, max_expanded)
+    elif policy == PRIORITY:
+        found, parent, counters = _priority(graph, s, t, h, weighted, epsilon, stop_flag, max_expanded)
+    elif policy == LIFO:
+        if depth_limit is None:
+            raise ValueError("LIFO cần depth_limit")
+        path, counters = _lifo(graph, s, t, depth_limit, stop_flag, max_expanded)
+        phases = {"search": clock() - t0} if clock is not None else {}
+        return path, counters, phases
+    else:
+        raise ValueError(f"policy không hợp lệ: {policy!r}")
+
+    t1 = clock() if clock is not None else 0
+    path = _path_ids(parent, t) if found else None
+    phases = {"search": t1 - t0, "path": clock() - t1} if clock is not None else {}
+    return path, counters, phases
+
+
+def _path_ids(parent, goal: int) -> List[int]:
+    ids = [goal]
+    while parent[ids[-1]] != ids[-1]:
+        ids.append(parent[ids[-1]])
+    ids.reverse()
+    return ids
+
+
+def _should_stop(expanded, stop_flag, max_expanded) -> bool:
+    return ((stop_flag is not None and stop_flag())
+            or (max_expanded is not None and expanded >= max_expanded))
+
+
+# ======================= FIFO (BFS) =======================
+
+def _fifo(graph, s, t, stop_flag, max_expanded):
+    adj = graph.adj
+    parent = graph.new_parent_array()   # parent[v] < 0 = chưa thăm
+    parent[s] = s
+    queue = deque([s])
+    visited = 1           # mỗi node chỉ push 1 lần: pushed = visited - 1
+    expanded = 0
+    peak_frontier = 1
+    check = stop_flag is not None or max_expanded is not None
+    found = stopped = False
+
+    while queue:
+        u = queue.popleft()
+        expanded += 1
+        if u == t:
+            found = True
+            break
+
+        for v in adj(u):
+            if parent[v] < 0:
+                parent[v] = u
+                visited += 1
+                queue.append(v)
+
+        q = len(queue)
+        if q > peak_frontier:
+            peak_frontier = q
+        if check and expanded % STOP_CHECK_EVERY == 0 and _should_stop(expanded, stop_flag, max_expanded):
+            stopped = True
+            break
+
+    # visited chỉ tăng nên peak (frontier + visited) <= peak frontier + visited cuối
+    peak_mem = peak_frontier + visited
+    return found, parent, (expanded, visited - 1, 0, peak_frontier, peak_mem, visited, False, stopped)
+
+
+def _fifo_plain(graph, s, t, stop_flag, max_expanded):
+    """Như _fifo nhưng không đếm counter (stats=None)."""
+    adj = graph.adj
+    parent = graph.new_parent_array()
+    parent[s] = s
+    queue = deque([s])
+    check = stop_flag is not None or max_expanded is not None
+    expanded = 0
+
+    while queue:
+        u = queue.popleft()
+        if u == t:
+            return True, parent
+        for v in adj(u):
+            if parent[v] < 0:
+                parent[v] = u
+                queue.append(v)
+        if check:
+            expanded += 1
+            if expanded % STOP_CHECK_EVERY == 0 and _should_stop(expanded, stop_flag, max_expanded):
+                break
+    return False, parent
+
+
+# ======================= PRIORITY (UCS / A*) =======================
+
+def _priority(graph, s, t, h, weighted, epsilon, stop_flag, max_expanded):
+    inf = float("inf")
+    parent = graph.new_parent_array()
+    parent[s] = s
+    g_cost = array("d", [inf]) * graph.n
+    g_cost[s] = 0
+    adj = graph.adj
+    edges = graph.edges
+    one = repeat(1)
+
+    pq = [((epsilon * h(s)) if h is not None else 0, 0, s)]   # (f, g, node id)
+    visited = 1
+    expanded = pushed = stale = 0
+    peak_frontier = peak_mem = 1
+    check = stop_flag is not None or max_expanded is not None
+
+    while pq:
+        f, g, u = heappop(pq)
+        if g > g_cost[u]:
+            stale += 1            # entry cũ, u đã có g tốt hơn
+            continue
+        expanded += 1
+        if u == t:
+            return True, parent, (expanded, pushed, stale, peak_frontier, peak_mem, visited, False, False)
+
+        for v, w in (edges(u) if weighted else zip(adj(u), one)):
+            new_g = g + w
+            if new_g < g_cost[v]:
+                if parent[v] < 0:
+                    visited += 1
+                g_cost[v] = new_g
+                parent[v] = u
+                pushed += 1
+                heappush(pq, ((new_g + epsilon * h(v)) if h is not None else new_g, new_g, v))
+
+        q = len(pq)
+        if q > peak_frontier:
+            peak_frontier = q
+        if q + visited > peak_mem:
+            peak_mem = q + visited
+        if check and expanded % STOP_CHECK_EVERY == 0 and _should_stop(expanded, stop_flag, max_expanded):
+            return False, parent, (expanded, pushed, stale, peak_frontier, peak_mem, visited, False, True)
+
+    return False, parent, (expanded, pushed, stale, peak_frontier, peak_mem, visited, False, False)
+
+
+def _priority_plain(graph, s, t, h, weighted, epsilon, stop_flag, max_expanded):
+    """Như _priority nhưng không đếm counter (stats=None)."""
+    inf = float("inf")
+    parent = graph.new_parent_array()
+    parent[s] = s
+    g_cost = array("d", [inf]) * graph.n
+    g_cost[s] = 0
+    adj = graph.adj
+    edges = graph.edges
+    one = repeat(1)
+    pq = [((epsilon * h(s)) if h is not None else 0, 0, s)]
+    check = stop_flag is not None or max_expanded is not None
+    expanded = 0
+
+    while pq:
+        f, g, u = heappop(pq)
+        if g > g_cost[u]:
+            continue
+        if u == t:
+            return True, parent
+        for v, w in (edges(u) if weighted else zip(adj(u), one)):
+            new_g = g + w
+            if new_g < g_cost[v]:
+                g_cost[v] = new_g
+                parent[v] = u
+                heappush(pq, ((new_g + epsilon * h(v)) if h is not None else new_g, new_g, v))
+        if check:
+            expanded += 1
+            if expanded % STOP_CHECK_EVERY == 0 and _should_stop(expanded, stop_flag, max_expanded):
+                break
+    return False, parent
+
+
+# ======================= LIFO (1 vòng IDS) =======================
+
+def _lifo(graph, s, t, depth_limit, stop_flag, max_expanded):
+    """
+    DFS giới hạn độ sâu bằng stack tường minh, transposition table "độ sâu nông nhất
+    đã tới node này": tới lại node ở độ sâu >= mức đã ghi thì còn ít budget hơn -> bỏ qua.
+    cutoff = còn hàng xóm chưa tới được vì hết budget (cần depth limit lớn hơn).
+    """
+    adj = graph.adj
+    shallow = array("i", [depth_limit + 1]) * graph.n
+    shallow[s] = 0
+    touched = 1
+    expanded = 1
+    pushed = 0
+    peak_frontier = 1
+    cutoff = False
+    check = stop_flag is not None or max_expanded is not None
+
+    if s == t:
+        return [s], (expanded, pushed, 0, 1, 1, touched, False, False)
+
+    path = [s]
+    iters = [iter(adj(s))]
+    while iters:
+        v = next(iters[-1], None)
+        if v is None:
+            iters.pop()
+            path.pop()
+            continue
+
+        nd = len(path)
+        if shallow[v] <= nd:
+            continue          # đã tới v nông hơn (hoặc v đang nằm trên path)
+        if shallow[v] > depth_limit:
+            touched += 1
+        shallow[v] = nd
+
+        expanded += 1
+        if v == t:
+            path.append(v)
+            return path, (expanded, pushed, 0, max(peak_frontier, len(path)),
+                          touched + len(path), touched, cutoff, False)
+
+        if nd < depth_limit:
+            path.append(v)
+            iters.append(iter(adj(v)))
+            pushed += 1
+            if nd + 1 > peak_frontier:
+                peak_frontier = nd + 1
+        elif not cutoff:
+            cutoff = any(shallow[x] > depth_limit for x in adj(v))
+
+        if check and expanded % STOP_CHECK_EVERY == 0 and _should_stop(expanded, stop_flag, max_expanded):
+            return None, (expanded, pushed, 0, peak_frontier, touched + len(path), touched, cutoff, True)
+
+    return None, (expanded, pushed, 0, peak_frontier, touched + peak_frontier, touched, cutoff, False)
@@ -0,0 +1,99 @@
+# solvers/sssp_tree.py
+
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Iterable, List, Optional
+
+from .graph import WordGraph, as_word_graph
+
+
+class ShortestPathTree:
+    """
+    Cây đường đi ngắn nhất từ 1 source tới mọi node, lưu bằng mảng parent.
+    path_to(goal) chỉ đi ngược parent: O(độ dài path), không search lại.
+    """
+
+    def __init__(self, graph: WordGraph, source: int, parent, dist, kind: str):
+        self.graph = graph
+        self.source = source
+        self.parent = parent     # parent[source] = source, < 0 = không tới được
+        self.dist = dist
+        self.kind = kind
+
+    @property
+    def source_word(self) -> str:
+        return self.graph.words[self.source]
+
+    def reachable(self, goal: str) -> bool:
+        return self.parent[self.graph.id_of(goal.upper())] >= 0
+
+    def distance(self, goal: str):
+        """Số bước (bfs) hoặc tổng cost (ucs), None nếu không tới được."""
+        t = self.graph.id_of(goal.upper())
+        return self.dist[t] if self.parent[t] >= 0 else None
+
+    def path_to(self, goal: str) -> Optional[List[str]]:
+        t = self.graph.id_of(goal.upper())
+        if self.parent[t] < 0:
+            return None
+        return self.graph.path_from_parents(self.parent, t)
+
+    def paths_to(self, goals: Iterable[str]) -> List[Optional[List[str]]]:
+        return [self.path_to(g) for g in goals]
+
+
+def bfs_tree(graph, source: str) -> ShortestPathTree:
+    """BFS toàn bộ component của source; path giống hệt bfs_solve."""
+    g = as_word_graph(graph)
+    s = g.id_of(source.upper())
+    adj = g.adj
+    parent = g.new_parent_array()
+    dist = array("i", [-1]) * g.n
+    parent[s] = s
+    dist[s] = 0
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        du = dist[u] + 1
+        for v in adj(u):
+            if parent[v] < 0:
+                parent[v] = u
+                dist[v] = du
+                queue.append(v)
+    return ShortestPathTree(g, s, parent, dist, "bfs")
+
+
+def dijkstra_tree(graph, source: str,
+                  cost: Optional[Callable[[str, str], float]] = None) -> ShortestPathTree:
+    """
+    Dijkstra toàn bộ component của source theo cost model của UCS; path giống ucs_solve.
+    cost=None -> dùng cost cạnh tính sẵn (graph.weights), ngược lại gọi cost(word, word).
+    """
+    g = as_word_graph(graph)
+    s = g.id_of(source.upper())
+    names = g.names
+    if cost is None:
+        edges = g.edges
+    else:
+        adj = g.adj
+
+        def edges(u):
+            wu = names[u]
+            return ((v, cost(wu, names[v])) for v in adj(u))
+    parent = g.new_parent_array()
+    dist = array("d", [float("inf")]) * g.n
+    parent[s] = s
+    dist[s] = 0
+    pq = [(0, s)]
+    while pq:
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue      # entry cũ
+        for v, w in edges(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heappush(pq, (nd, v))
+    return ShortestPathTree(g, s, parent, dist, "ucs")
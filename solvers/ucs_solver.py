@@ -1,7 +1,10 @@
 # solvers/ucs_solver.py
 
-from heapq import heappush, heappop
-from typing import List, Dict, Optional
+from array import array
+from typing import List, Optional
+
+from .graph import as_word_graph
+from .search_core import PRIORITY, search
 
 letter_freq_cost = {
     'E': 1, 
@@ -23,10 +26,38 @@ def step_cost(from_word: str, to_word: str) -> int:
     return 1
 
 
+def path_cost(path: List[str]) -> int:
+    """Tổng cost của path [w0, w1, ...] theo step_cost."""
+    return sum(step_cost(a, b) for a, b in zip(path, path[1:]))
+
+
+def edge_weights(graph):
+    """
+    Tính 1 lần cost của mọi cạnh, song song với graph.neighbors:
+    weights[k] = cost(u -> v) = cost chữ của v ở vị trí khác nhau,
+    rweights[k] = cost(v -> u) = cost chữ của u ở vị trí đó.
+    """
+    names = graph.names
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    weights = array("B", bytes(len(neighbors)))
+    rweights = array("B", bytes(len(neighbors)))
+    for u in range(graph.n):
+        wu = names[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            wv = names[neighbors[k]]
+            for a, b in zip(wu, wv):
+                if a != b:
+                    weights[k] = letter_freq_cost[b]
+                    rweights[k] = letter_freq_cost[a]
+                    break
+    return weights, rweights
+
+
 def ucs_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[str]]:
     """
     Tìm đường đi chi phí thấp nhất từ start -> goal bằng UCS.
-    Mặc định mỗi bước cost = 1.
+    Cost mỗi bước = step_cost, đọc từ graph.weights (tính sẵn lúc build graph).
     Trả về list các từ [start, ..., goal] hoặc None nếu không có đường.
     """
     start = start.upper()
@@ -36,31 +67,6 @@ def ucs_solve(start: str, goal: str, words: List[str], graph) -> Optional[List[s
         raise ValueError("start và goal phải nằm trong dictionary")
 
 
-    # priority queue item: (cost, node)
-    pq = []
-    heappush(pq, (0, start))
-
-    parent: Dict[str, Optional[str]] = {start: None}
-    cost: Dict[str, float] = {start: 0}
-
-    while pq:
-        g, u = heappop(pq)
-        # reconstruct path
-        if u == goal:
-            path = []
-            cur = goal
-            while cur is not None:
-                path.append(cur)
-                cur = parent[cur]
-            path.reverse()
-            return path
-
-        for v in graph[u]:
-            step_c = step_cost(u, v)
-            new_cost = g + step_c  # step cost = 1
-            if v not in cost or new_cost < cost[v]:
-                cost[v] = new_cost
-                parent[v] = u
-                heappush(pq, (new_cost, v))
-
-    return None
\ No newline at end of file
+    gr = as_word_graph(graph)
+    path = search(gr, gr.id_of(start), gr.id_of(goal), PRIORITY, weighted=True)
+    return gr.to_words(path) if path is not None else None
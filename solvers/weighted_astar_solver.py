@@ -0,0 +1,54 @@
+# solvers/weighted_astar_solver.py
+
+from typing import Callable, List, Optional, Tuple
+
+from .graph import WordGraph, as_word_graph
+from .search_core import PRIORITY, SearchStats, search
+from .ucs_solver import letter_freq_cost
+
+
+def letter_cost_heuristic(graph: WordGraph, goal_id: int) -> Callable[[int], int]:
+    """
+    h(v) cho cost model của UCS: mỗi vị trí v khác goal sớm muộn phải đổi
+    thành chữ của goal, tốn letter_freq_cost[goal[i]] -> h = tổng các cost đó.
+    Admissible và consistent (1 bước chỉ đổi 1 vị trí, cost = chữ đổi thành).
+    Cost từng vị trí tính sẵn 1 lần cho goal.
+    """
+    names = graph.names
+    goal = names[goal_id]
+    costs = [letter_freq_cost[c] for c in goal]
+
+    def h(v: int) -> int:
+        return sum(c for a, b, c in zip(names[v], goal, costs) if a != b)
+
+    return h
+
+
+def weighted_astar_search(graph: WordGraph, s: int, t: int,
+                          epsilon: float = 1.0) -> Tuple[Optional[List[int]], int, int]:
+    """
+    A* trên cost cạnh của UCS (graph.weights) với f = g + epsilon * h.
+    epsilon = 1: cost tối ưu như ucs_solve; epsilon > 1: nhanh hơn,
+    cost <= epsilon * tối ưu.
+    Trả về (path id, số node expanded, peak heap + visited).
+    """
+    stats = SearchStats()
+    path = search(graph, s, t, PRIORITY, h=letter_cost_heuristic(graph, t), weighted=True,
+                  epsilon=epsilon, stats=stats)
+    return path, stats.expanded, stats.peak_mem
+
+
+def weighted_astar_solve(start: str, goal: str, words: List[str], graph,
+                         epsilon: float = 1.0) -> Optional[List[str]]:
+    """
+    Tìm đường đi chi phí thấp nhất start -> goal (cost model của UCS) bằng A*.
+    epsilon > 1: bounded-suboptimal, cost tối đa epsilon lần tối ưu.
+    """
+    start = start.upper()
+    goal = goal.upper()
+    if start not in words or goal not in words:
+        raise ValueError("start và goal phải nằm trong dictionary")
+
+    g = as_word_graph(graph)
+    path, _, _ = weighted_astar_search(g, g.id_of(start), g.id_of(goal), epsilon)
+    return g.to_words(path) if path is not None else None
@@ -0,0 +1,29 @@
+# tests/test_entropy_solver.py
+
+import os
+
+from solvers.entropy_solver import EntropySolver
+
+WORDS = ["ARISE", "ABOUT", "OTHER", "REBUS", "APPLE", "HOUSE", "WORLD", "GAMES", "SMART", "BRAIN"]
+
+
+def test_opener_is_cached(tmp_path):
+    path = str(tmp_path / "words_opener.txt")
+    first = EntropySolver(WORDS, workers=1, opener_path=path).next_guess()
+    assert os.path.exists(path)
+    assert EntropySolver(WORDS, workers=1, opener_path=path).next_guess() == first
+
+
+def test_opener_without_writable_cache(tmp_path, capsys):
+    path = str(tmp_path / "missing_dir" / "words_opener.txt")     # thư mục không tồn tại
+    guess = EntropySolver(WORDS, workers=1, opener_path=path).next_guess()
+    assert guess in WORDS
+    assert "Could not write opener cache" in capsys.readouterr().out
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_opener_write_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "words_opener.txt"
+    path.mkdir()                        # os.replace lên 1 thư mục -> OSError sau khi đã ghi file tạm
+    assert EntropySolver(WORDS, workers=1, opener_path=str(path)).next_guess() in WORDS
+    assert sorted(os.listdir(tmp_path)) == ["words_opener.txt"]
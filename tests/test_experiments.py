@@ -0,0 +1,91 @@
+# tests/test_experiments.py
+
+import pytest
+
+from experiments import sample_pair, sample_pairs
+from solvers.graph import build_word_graph
+
+
+def test_sample_pairs_reachable_only_needs_a_component():
+    graph = build_word_graph(["ABC", "XYZ", "QQQ"])      # không cặp nào nối được
+    words = list(graph.words)
+    with pytest.raises(ValueError):
+        sample_pair(words, graph, reachable_only=True)
+    with pytest.raises(ValueError):
+        sample_pairs(words, graph, 3, reachable_only=True)
+    with pytest.raises(ValueError):
+        sample_pairs(["ABC"], build_word_graph(["ABC"]), 3)
+
+
+def test_sample_pairs_reachable_only():
+    graph = build_word_graph(["ABC", "ABD", "QQQ"])
+    pairs = sample_pairs(list(graph.words), graph, 10, seed=1, reachable_only=True)
+    assert pairs == sample_pairs(list(graph.words), graph, 10, seed=1, reachable_only=True)
+    assert all({s, t} == {"ABC", "ABD"} for s, t in pairs)
+
+
+def test_implicit_rows_do_not_depend_on_workers(tmp_path):
+    from experiments import run_pairs_parallel
+    from solvers.implicit_graph import ImplicitWordGraph
+    import pickle
+
+    words = ["COLD", "CORD", "CARD", "WARD", "WARM", "WORM", "WORD", "XYZW", "XYZQ"]
+    graph = ImplicitWordGraph(words, cache_size=16)
+    graph.label_components()
+    clone = pickle.loads(pickle.dumps(graph))
+    assert not clone.connected(clone.id_of("COLD"), clone.id_of("XYZW"))
+
+    # có cả cặp không tới được: worker phải thấy cùng component như process cha
+    pairs = [("COLD", "WARM"), ("COLD", "XYZW"), ("XYZQ", "XYZW"), ("WORD", "CARD")]
+    dict_path = str(tmp_path / "words.txt")
+    strip = lambda rows: [{k: v for k, v in r.items() if not k.endswith("time_ms")} for r in rows]
+    one = run_pairs_parallel(pairs, graph, dict_path, workers=1)
+    two = run_pairs_parallel(pairs, graph, dict_path, workers=2, chunksize=1)
+    assert strip(one) == strip(two)
+
+
+def test_parallel_pool_is_joined(tmp_path):
+    import multiprocessing
+    from experiments import iter_pairs_parallel
+
+    graph = build_word_graph(["COLD", "CORD", "CARD", "WARD", "WARM"])
+    pairs = [("COLD", "WARM"), ("CARD", "CORD"), ("WARD", "COLD")]
+    dict_path = str(tmp_path / "words.txt")
+    rows = list(iter_pairs_parallel(pairs, graph, dict_path, workers=2, algorithms=["BFS"]))
+    assert [(r["start"], r["goal"]) for r in rows] == pairs
+    assert multiprocessing.active_children() == []
+
+    # đóng giữa chừng: không chờ job còn lại, không treo
+    gen = iter_pairs_parallel(pairs, graph, dict_path, workers=2, algorithms=["BFS"])
+    next(gen)
+    gen.close()
+
+
+def test_implicit_landmarks_under_spawn(tmp_path):
+    import multiprocessing
+    import pickle
+    from experiments import iter_pairs_parallel
+    from solvers.implicit_graph import ImplicitWordGraph
+    from solvers.landmarks import landmarks_cache_path, load_landmarks, save_landmarks, select_landmarks
+
+    words = ["COLD", "CORD", "CARD", "WARD", "WARM", "WORM", "WORD"]
+    graph = ImplicitWordGraph(words)
+    graph.label_components()
+    dict_path = str(tmp_path / "words.txt")
+    key = bytes.fromhex(graph.cache_key)
+    save_landmarks(landmarks_cache_path(dict_path), select_landmarks(graph, 2), graph.n, key)
+    landmarks = load_landmarks(landmarks_cache_path(dict_path), graph.n, key, 2)
+    clone = pickle.loads(pickle.dumps(landmarks))          # rows mmap -> bytes
+    assert [list(r) for r in clone.rows] == [list(r) for r in landmarks.rows]
+
+    pairs = [("COLD", "WARM"), ("WORD", "CARD")]
+    algos = ["Astar", "AstarALT"]
+    one = iter_pairs_parallel(pairs, graph, dict_path, landmarks, workers=1, algorithms=algos)
+    ctx = multiprocessing.get_start_method()
+    multiprocessing.set_start_method("spawn", force=True)
+    try:
+        two = list(iter_pairs_parallel(pairs, graph, dict_path, landmarks, workers=2, algorithms=algos))
+    finally:
+        multiprocessing.set_start_method(ctx, force=True)
+    strip = lambda rows: [{k: v for k, v in r.items() if not k.endswith("time_ms")} for r in rows]
+    assert strip(list(one)) == strip(two)
@@ -0,0 +1,53 @@
+# tests/test_feedback.py
+
+from game.feedback import (
+    build_feedback_matrix, decode, encode, feedback_matrix_path, load_feedback_matrix,
+    score, score_batch, verify,
+)
+from game.logic import Lexicon, check_guess
+
+# nhiều từ có chữ lặp (2-3 lần, lặp ở guess / secret / cả hai) để bắt lỗi đếm Yellow
+WORDS = Lexicon([
+    "ARISE", "ABOUT", "APPLE", "PAPER", "LLAMA", "ALLEY", "EERIE", "GEESE",
+    "SPEED", "ERROR", "MAMMA", "SASSY", "TESTS", "ABBEY", "KAYAK", "LEVEL",
+    "BOOST", "ROBOT", "OTTER", "TOTEM", "STEEL", "SLEET", "EMCEE", "NEVER",
+])
+
+
+def test_encode_decode_roundtrip():
+    for s in WORDS:
+        for g in WORDS:
+            fb = check_guess(s, g)
+            assert decode(encode(fb), len(g)) == fb
+
+
+def test_score_matches_check_guess():
+    for s in WORDS:
+        for g in WORDS:
+            assert score(s, g) == encode(check_guess(s, g)), (s, g)
+
+
+def test_verify_batch_path():
+    assert verify(WORDS) == 0
+
+
+def test_score_batch_other_lengths():
+    words = ["EEL", "LEE", "ELL", "ALE", "SASSES", "ASSESS", "TSETSE", "SETTER"]
+    for g in words:
+        same = [s for s in words if len(s) == len(g)]
+        assert list(score_batch(g, same)) == [encode(check_guess(s, g)) for s in same]
+
+
+def test_matrix_agrees_with_score(tmp_path):
+    dict_path = str(tmp_path / "words.txt")
+    matrix = build_feedback_matrix(dict_path, WORDS, workers=1, chunk=5, log=None)
+    assert matrix.path == feedback_matrix_path(dict_path)
+    for gi, g in enumerate(WORDS):
+        for si, s in enumerate(WORDS):
+            assert matrix.code(gi, si) == score(s, g), (g, s)
+
+    loaded = load_feedback_matrix(dict_path, WORDS)
+    assert loaded is not None
+    assert verify(WORDS, loaded) == 0
+    # dictionary khác (thứ tự khác) -> không dùng matrix cũ
+    assert load_feedback_matrix(dict_path, Lexicon(reversed(WORDS))) is None
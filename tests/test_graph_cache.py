@@ -0,0 +1,47 @@
+# tests/test_graph_cache.py
+
+import pytest
+
+import experiments
+from solvers import batch_query
+from solvers.graph import build_word_graph
+from solvers.graph_cache import attach_graph, graph_cache_key, graph_cache_valid, load_graph, save_graph
+
+WORDS = ["COLD", "CORD", "CARD", "WARD", "WARM", "WORM", "WORD", "XYZW"]
+
+
+def test_graph_cache_valid_matches_load_graph(tmp_path):
+    path = str(tmp_path / "words_graph.bin")
+    graph = build_word_graph(WORDS)
+    key = graph_cache_key(graph.words)
+    assert not graph_cache_valid(path, key)
+    save_graph(path, graph, key)
+    assert graph_cache_valid(path, key)
+    assert not graph_cache_valid(path, graph_cache_key(WORDS[:-1]))
+    assert load_graph(path, key) is not None
+
+    with open(path, "r+b") as f:        # file cụt -> không hợp lệ
+        f.truncate(f.seek(0, 2) - 1)
+    assert not graph_cache_valid(path, key)
+    assert load_graph(path, key) is None
+
+
+def test_workers_report_missing_cache(tmp_path):
+    path = str(tmp_path / "gone_graph.bin")
+    key = graph_cache_key(WORDS).hex()
+    with pytest.raises(RuntimeError):
+        attach_graph(path, bytes.fromhex(key))
+
+    experiments._init_worker(path, key, None, None, 0, None)
+    try:
+        with pytest.raises(RuntimeError, match="graph cache"):
+            experiments._job(("BFS", "COLD", "WARM"))
+    finally:
+        experiments._w_error = None
+
+    batch_query._init_worker(path, key, None)
+    try:
+        with pytest.raises(RuntimeError, match="graph cache"):
+            batch_query._group_task(("bfs", 0, [(0, 1)], False))
+    finally:
+        batch_query._w_error = None
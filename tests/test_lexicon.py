@@ -0,0 +1,23 @@
+# tests/test_lexicon.py
+
+from game.logic import Lexicon, LengthLexicons, PackedLexicon, _read_words, load_words
+
+TEXT = "rossa\nabcde\nécole\nROSSA\nđường\nabc\nzebra\nab-cd\n\U0001d400bcde\n"
+
+
+def test_snapshot_keeps_text_order_and_alphabet(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    expected = Lexicon(w for w in _read_words(str(path)) if len(w) == 5)
+
+    for _ in range(2):                  # lần 1 compile, lần 2 đọc snapshot
+        words = load_words(str(path))
+        assert isinstance(words, PackedLexicon)
+        assert list(words) == list(expected)
+        assert words[0] == "ROSSA"
+        assert "ÉCOLE" in words and "AB-CD" not in words
+        assert all(words.id_of(w) == i for i, w in enumerate(expected))
+        assert words.as_tuple() == tuple(expected)
+
+    assert LengthLexicons(str(path)).lengths == [3, 5]
+    assert list(load_words(str(path), None)) == list(Lexicon(_read_words(str(path))))